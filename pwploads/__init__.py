@@ -1,12 +1,27 @@
 from math import pi
 from .unit_converter import convert_unit
 from .collapse_calcs import calc_collapse_pressure
-from .von_mises import vme
-from .design_factors import api_limits
+from .von_mises import vme, VmeEnvelope
+from .design_factors import api_limits, ApiEnvelope
 from .connections import get_conn_limits
 from .utilities import *
 from .prepare_cases import *
 from .plot import *
+from .trajectory import Trajectory
+from .shared import SharedSurvey, SurveyHandle, detach_all
+from .survey import load_survey, FILE_TYPES
+from .results import export_results, load_results
+from .batch import evaluate_batch, summarize, ResultStore, CASES
+from .asynchronous import run_loads_async, run_batch_async
+from .scenarios import run_scenarios, sensitivity, expand_grid, merge_settings, get_setting
+from .envelope import Envelope, von_mises_stress, compute_safety_profiles
+from .units import UNIT_SYSTEMS, convert_load
+from .profiles import Profile
+from .fluids import FluidColumn, fluid_column
+from .joints import aggregate_joints, joint_edges
+from .depth_index import DepthIndex, depth_index
+from .registry import LoadCase, register_case, unregister_case, register_node, registered_cases, case_names, \
+    plan_cases, merge_plans, run_cases
 import well_profile as wp
 
 
@@ -26,24 +41,23 @@ class Casing(object):
         dt (num): ratio --> outer diameter / thickness
         area (num): effective area [in^2]
         shoe (num): measured depth at shoe [m]
-        ellipse (list): triaxial points [x, y+, y-]
+        ellipse (list): triaxial points [x, y+, y-], sampled from vme_envelope when used
+        vme_envelope (VmeEnvelope): triaxial limit with its design factor
+        api_envelope (ApiEnvelope): API limits with their design factors
         loads (list): list of loads that have been run
         nominal_weight (num): weight per unit length [kg/m]
         trajectory (obj): wellbore trajectory object
-        api_lines (list): API limits coordinates [x, y]
+        api_lines (list): API limits coordinates [x, y], sampled from api_envelope when used
+        collapse_curve (list): API collapse limit in tension [axial forces, pressures]
         design_factor (dict): design factors used 'vme', 'api'
+        factors (dict): design factors for 'pipe' and 'connection'
+        yield_strength (num): minimum yield strength [psi]
+        adaptive (bool): pressure profiles are kept as Profile objects, evaluated only around the depths where
+                         they change (see run_loads)
     """
 
     def __init__(self, pipe, conn_compression=0.6, conn_tension=0.6, factors=None):
 
-        df = {'pipe': {'tension': 1.1, 'compression': 1.1, 'burst': 1.1, 'collapse': 1.1, 'triaxial': 1.25},
-              'connection': {'tension': 1.0, 'compression': 1.0}}
-
-        if type(factors) == dict:
-            for key in factors.keys():
-                for item in factors[key].keys():
-                    df[key][item] = factors[key][item]
-
         self.od = pipe['od']
         self.id = pipe['id']
         self.area = (pi / 4) * (self.od ** 2 - self.id ** 2)
@@ -62,6 +76,7 @@ class Casing(object):
             yield_s = float(pipe['grade'].split('-')[1]) * 1000
         else:
             yield_s = 80000
+        self.yield_strength = yield_s
 
         if 'weight' in pipe:
             self.nominal_weight = pipe['weight']
@@ -74,26 +89,52 @@ class Casing(object):
             self.e = 29e6
 
         self.limits = {'burst': 0.875 * 2 * yield_s * self.thickness / self.od,
-                       'burstDF': 0.875 * 2 * yield_s * self.thickness / self.od / df['pipe']['burst'],
                        'collapse': - calc_collapse_pressure(self.dt, yield_s),
-                       'collapseDF': - calc_collapse_pressure(self.dt, yield_s) / df['pipe']['collapse'],
                        'compression': - yield_s * self.area,
-                       'compressionDF': - yield_s * self.area / df['pipe']['compression'],
-                       'tension': yield_s * self.area,
-                       'tensionDF': yield_s * self.area / df['pipe']['tension']}
+                       'tension': yield_s * self.area}
 
-        self.ellipse = vme(yield_s, self.area, self.id, self.od, df['pipe']['triaxial'])
+        self.conn_compression = conn_compression
+        self.conn_tension = conn_tension
+        self.factors = {'pipe': {'tension': 1.1, 'compression': 1.1, 'burst': 1.1, 'collapse': 1.1, 'triaxial': 1.25},
+                        'connection': {'tension': 1.0, 'compression': 1.0}}
         self.loads = []
         self.trajectory = None
         self.settings = None
         self.msgs = None
         self.safety_factors = None
-        self.api_lines, self.collapse_curve = api_limits(self.dt, yield_s, self.limits, self.area,
-                                                         df['pipe']['tension'],
-                                                         df['pipe']['compression'],
-                                                         df['pipe']['burst'],
-                                                         df['pipe']['collapse'])
-        self.conn_limits = get_conn_limits(self.limits, conn_compression, conn_tension,
+        self.screening = None
+        self.adaptive = False
+        self.update_design_factors(factors)
+
+    def update_design_factors(self, factors):
+        """
+        Set new design factors. Only the limits are calculated again, loads already run are kept and their
+        minimum DF and the safety factors are updated.
+
+        Arguments:
+            factors (dict or None): design factors for pipe and connection to change, e.g.
+                                    {'pipe': {'burst': 1.2}, 'connection': {'tension': 1.5}}
+        """
+
+        df = {key: dict(values) for key, values in self.factors.items()}
+        if type(factors) == dict:
+            for key in factors.keys():
+                for item in factors[key].keys():
+                    df[key][item] = factors[key][item]
+        self.factors = df
+
+        self.limits.update({'burstDF': self.limits['burst'] / df['pipe']['burst'],
+                            'collapseDF': self.limits['collapse'] / df['pipe']['collapse'],
+                            'compressionDF': self.limits['compression'] / df['pipe']['compression'],
+                            'tensionDF': self.limits['tension'] / df['pipe']['tension']})
+
+        self.vme_envelope = VmeEnvelope(self.yield_strength, self.area, self.id, self.od, df['pipe']['triaxial'])
+        self.api_envelope = ApiEnvelope(self.dt, self.yield_strength, self.limits, self.area,
+                                        df['pipe']['tension'],
+                                        df['pipe']['compression'],
+                                        df['pipe']['burst'],
+                                        df['pipe']['collapse'])
+        self.conn_limits = get_conn_limits(self.limits, self.conn_compression, self.conn_tension,
                                            df['connection']['compression'],
                                            df['connection']['tension'])
         self.design_factor = {'vme': df['pipe']['triaxial'],
@@ -102,7 +143,54 @@ class Casing(object):
                                       'burst': df['pipe']['burst'],
                                       'collapse': df['pipe']['collapse']}}
 
+        if len(self.loads) > 0 and all('maxLoads' in load for load in self.loads):
+            define_min_df(self)
+            define_safety_factors(self)
+
+    @property
+    def ellipse(self):
+        return self.vme_envelope.sample()
+
+    @property
+    def api_lines(self):
+        return self.api_envelope.sample()[0]
+
+    @property
+    def collapse_curve(self):
+        return self.api_envelope.sample()[1]
+
+    def evaluate_design_factors(self, factor_sets):
+        """
+        Check the loads already run against many sets of design factors at once, see
+        pwploads.evaluate_design_factors.
+
+        Arguments:
+            factor_sets (list): design factors dicts, missing values are taken from the casing
+
+        Returns:
+            dict with 'cases', 'minDF' and 'margin' (set x case array per load type) and 'passed' (bool per set)
+        """
+
+        return evaluate_design_factors(self, factor_sets)
+
     def add_trajectory(self, survey):
+        """
+        Set the wellbore trajectory between casing top and shoe.
+
+        Arguments:
+            survey: excel file, csv/npy/npz/binary file, dataframe, list of dicts, Trajectory object or
+                    SurveyHandle from a SharedSurvey
+        """
+
+        if isinstance(survey, SurveyHandle):
+            survey = survey.attach()
+
+        if isinstance(survey, str) and survey.endswith(FILE_TYPES):
+            survey = load_survey(survey)
+
+        if isinstance(survey, Trajectory):
+            self.trajectory = survey.window(self.top, self.shoe)
+            return
 
         trajectory = wp.load(survey, equidistant=False)
         idx = [trajectory.trajectory.index(x) for x in trajectory.trajectory if self.top <= x['md'] <= self.shoe]
@@ -113,7 +201,7 @@ class Casing(object):
         trajectory.dls = [x['dls'] for x in trajectory.trajectory][idx[0]:idx[-1] + 1]
         self.trajectory = trajectory
 
-    def plot(self, plot_type='vme'):
+    def plot(self, plot_type='vme', webgl=False):
         if plot_type == 'pressureDiff':
             fig = pressure_plot(self)
         elif plot_type == 'burst':
@@ -123,78 +211,139 @@ class Casing(object):
         elif plot_type == 'axial':
             fig = axial_plot(self)
         else:
-            fig = vme_plot(self)
+            fig = vme_plot(self, webgl)
 
         return fig
 
-    def run_loads(self, settings=None):
+    def export_results(self, path, format='npz', append=False):
+        """
+        Write the load profiles as columnar float arrays with their metadata. Read them with load_results.
+
+        Arguments:
+            path (str): output file
+            format (str): 'npz' or 'arrow' (requires pyarrow)
+            append (bool): add this casing to an existing results file
+        """
+
+        export_results([self], path, format, append)
+
+    def loads_in(self, units='si'):
+        """
+        Get the loads in another unit system. The loads are kept in field units (lbf, psi), this returns
+        converted copies.
+
+        Arguments:
+            units (str): 'field', 'si' (kN, kPa) or 'metric' (kN, bar)
+
+        Returns:
+            list of loads with converted 'axialForce', 'diffPressure' and 'maxLoads'
+        """
+
+        return [convert_load(load, units) for load in self.loads]
+
+    def aggregate_joints(self, joint_length=12.0):
+        """
+        Get the worst loads and safety factors per casing joint and check the connections, see
+        pwploads.aggregate_joints.
+
+        Arguments:
+            joint_length (num): joint length, m
+
+        Returns:
+            dict with 'cases', 'top', 'bottom', worst loads and 'safetyFactors' (case x joint) and 'connections'
+        """
+
+        return aggregate_joints(self, joint_length)
+
+    def loads_at(self, md=None, tvd=None, cases=None):
+        """
+        Get the loads and safety factors at any depths, see DepthIndex.at. The index is built once for the current
+        loads.
+
+        Arguments:
+            md (num, list or array or None): measured depths, m
+            tvd (num, list or array or None): true vertical depths, m
+            cases (list or None): load descriptions, all the loads if None
+
+        Returns:
+            dict with 'md', 'tvd', 'cases', 'axialForce', 'diffPressure' and 'safetyFactors' (case x depth arrays)
+        """
+
+        return depth_index(self).at(md, tvd, cases)
+
+    def run_loads(self, settings=None, mode='full', workers=None):
+        """
+        Run the load cases.
+
+        Arguments:
+            settings (dict or None): load case settings, defaults are used for missing values
+            mode (str): 'full' to keep every load profile, 'adaptive' to keep the pressure profiles as Profile
+                        objects calculated only at the stations around fluid changes, packer, perforations and mud
+                        levels (exact elsewhere by interpolation, np.asarray builds them) or 'screen' to only check
+                        the design factors, stopping at the first failing case (see screen_loads)
+            workers (int or None): threads to run independent load cases at the same time (see run_cases)
+        """
 
         self.define_settings(settings)
-        config = self.settings
+        self.adaptive = mode == 'adaptive'
         gen_msgs(self)
 
-        gen_overpull(self, rho_fluid=[config['densities']['mud']], v_avg=config['tripping']['speed'],
-                     fric=config['tripping']['slidingFriction'], a=config['tripping']['maxSpeedRatio'],
-                     f_ov=int(config['forces']['overpull']))
-
-        gen_running(self, rho_fluid=[config['densities']['mud']], v_avg=config['tripping']['speed'],
-                    fric=config['tripping']['slidingFriction'], a=config['tripping']['maxSpeedRatio'])
-
-        gen_green_cement(self, rho_fluid_int=config['densities']['cementDisplacingFluid'],
-                         rho_cement=config['densities']['cement'], f_pre=config['forces']['preloading'],
-                         p_test=config['testing']['cementingPressure'])
-
-        gen_cementing(self, rho_cement=config['densities']['cement'],
-                      rho_fluid=config['densities']['cementDisplacingFluid'],
-                      f_pre=config['forces']['preloading'])
-
-        if self.pipe_class in [None, 'Production']:
-            gen_full_evacuation(self, rho_prod_fluid=config['production']['fluidDensity'],
-                                rho_mud=config['densities']['mud'], md_toc=self.toc_md,
-                                poisson=config['production']['poisson'],
-                                f_setting=config['forces']['preloading'])
-
-        gen_mud_drop(self, rho_mud=config['densities']['mud'], rho_mud_new=config['densities']['mudDropTo'])
-
-        if 'Displacement to gas' not in self.msgs:
-            gen_displacement_gas(self, p_res=config['production']['resPressure'],
-                                 tvd_res=config['production']['resTvd'],
-                                 rho_gas=config['densities']['gasKick'], rho_mud=config['densities']['mud'])
-
-        if 'Production' not in self.msgs and self.pipe_class in [None, 'Production']:
-            gen_production(self, p_res=config['production']['resPressure'],
-                           rho_prod_fluid=config['production']['fluidDensity'],
-                           rho_ann_fluid=config['densities']['completionFluid'],
-                           rho_packerfluid=config['production']['packerFluidDensity'],
-                           md_toc=self.toc_md,
-                           tvd_packer=config['production']['packerTvd'],
-                           tvd_perf=config['production']['perforationsTvd'],
-                           poisson=config['production']['poisson'],
-                           f_setting=config['forces']['preloading'])
-
-        if 'Injection' not in self.msgs and self.pipe_class in [None, 'Production']:
-            gen_injection(self, whp=config['injection']['whp'],
-                          rho_injectionfluid=config['densities']['injectionFluid'],
-                          rho_mud=config['densities']['mud'], temp=config['temp'],
-                          t_k=config['production']['wellHeadTemp'],
-                          poisson=config['production']['poisson'],
-                          f_setting=config['forces']['preloading'])
-
-        if 'Pressure Test' not in self.msgs:
-            gen_pressure_test(self, whp=config['testing']['testPressure'],
-                              effective_diameter=config['testing']['pipeDiameter'],
-                              rho_testing_fluid=config['testing']['testFluidDensity'],
-                              rho_mud=config['densities']['mud'])
-
-        if 'Gas Kick' not in self.msgs:
-            gen_gas_kick(self, p_res=config['production']['resPressure'], tvd_res=config['production']['resTvd'],
-                         rho_gas=config['densities']['gasKick'], rho_mud=config['densities']['mud'],
-                         vol_kick_initial=config['influx']['gasKickVolume'])
+        if mode == 'screen':
+            screen_loads(self)
+            return
+
+        run_cases(self, workers)
 
         define_max_loads(self.loads)
         define_min_df(self)
         define_safety_factors(self)
 
+    async def run_loads_async(self, settings=None, executor=None, timeout=None, mode='full'):
+        """
+        Run the load cases from an event loop, see pwploads.run_loads_async.
+
+        Arguments:
+            settings (dict or None): load case settings, defaults are used for missing values
+            executor (Executor or None): thread or process pool executor, the loop default is used if None
+            timeout (num or None): seconds to wait before raising asyncio.TimeoutError, tasks already running
+                                   finish in the background and are discarded
+            mode (str): 'full' or 'adaptive', see run_loads
+        """
+
+        await run_loads_async(self, settings, executor, timeout, mode)
+
+    def run_scenarios(self, base_settings=None, grid=None, envelope=None):
+        """
+        Run the load cases for every combination of settings in a grid, see pwploads.run_scenarios.
+
+        Arguments:
+            base_settings (dict or None): settings shared by all the scenarios
+            grid (dict or None): values for each setting, keys as 'section.item', e.g. {'densities.mud': [1.2, 1.4]}
+            envelope (Envelope or None): envelope to add every calculated load to
+
+        Returns:
+            dict with 'scenarios', 'cases', 'safetyFactors' (scenario x case array per load type) and 'evaluations'
+        """
+
+        return run_scenarios(self, base_settings, grid, envelope)
+
+    def sensitivity(self, settings=None, params=None, rel_step=0.01):
+        """
+        Calculate the derivatives of the minimum DF of every case with respect to some settings, see
+        pwploads.sensitivity.
+
+        Arguments:
+            settings (dict or None): load case settings, defaults are used for missing values
+            params (list or None): settings to perturb as 'section.item'
+            rel_step (num): perturbation relative to each value, used as absolute step for values equal to 0
+
+        Returns:
+            dict with 'params', 'values', 'steps', 'cases', 'safetyFactors', 'gradients' (param x case array per
+            load type) and 'tornado'
+        """
+
+        return sensitivity(self, settings, params, rel_step)
+
     def define_settings(self, settings):
 
         default = {'densities': {'mud': 1.5, 'cement': 1.9, 'cementDisplacingFluid': 1.6, 'gasKick': 0.5,
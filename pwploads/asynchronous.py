@@ -0,0 +1,103 @@
+import asyncio
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from .utilities import gen_msgs, define_max_loads, define_min_df, define_safety_factors
+from .registry import plan_cases, node_value, run_case
+
+
+async def run_loads_async(csg, settings=None, executor=None, timeout=None, mode='full'):
+    """
+    Run the load cases without blocking the event loop.
+
+    With a thread executor (or None for the loop default) the cases are planned as in run_cases: every shared node
+    and then every load case is a separate task, so the cases of this casing interleave with other work. With a
+    ProcessPoolExecutor the whole run is sent to one worker.
+
+    On a timeout or cancellation only the tasks that have not started are cancelled. Node and case tasks already
+    running in a thread, or a run already sent to a worker process, keep running until they finish and their
+    results are discarded.
+
+    Arguments:
+        csg: casing obj
+        settings (dict or None): load case settings
+        executor (Executor or None): executor to run the cases in
+        timeout (num or None): seconds to wait before raising asyncio.TimeoutError
+        mode (str): 'full' or 'adaptive', see Casing.run_loads
+
+    Returns:
+        None. The casing is only updated once every case is finished, a run that timed out or was cancelled leaves
+        its loads, settings and msgs untouched.
+    """
+
+    if mode not in ('full', 'adaptive'):
+        raise ValueError("mode must be 'full' or 'adaptive'")
+
+    loop = asyncio.get_running_loop()
+
+    if isinstance(executor, ProcessPoolExecutor):
+        results = await asyncio.wait_for(loop.run_in_executor(executor, _run_remote, csg, settings, mode), timeout)
+        settings, msgs, loads = results
+        _update(csg, settings, msgs, mode, [loads])
+        return
+
+    run = copy.copy(csg)
+    run.define_settings(settings)
+    run.adaptive = mode == 'adaptive'
+    gen_msgs(run)
+    plan = plan_cases(run)
+
+    async def run_plan():
+        values = {}
+        for level in plan['levels']:
+            results = await asyncio.gather(*[loop.run_in_executor(executor, node_value, run, plan['nodes'][key],
+                                                                  values) for key in level])
+            values.update(zip(level, results))
+        return await asyncio.gather(*[loop.run_in_executor(executor, run_case, run, item, values)
+                                      for item in plan['cases']])
+
+    results = await asyncio.wait_for(run_plan(), timeout)
+    _update(csg, run.settings, run.msgs, mode, results)
+
+
+def _update(csg, settings, msgs, mode, results):
+    # same state as run_loads, whichever executor ran the cases
+    csg.settings = settings
+    csg.msgs = msgs
+    csg.adaptive = mode == 'adaptive'
+    for loads in results:
+        csg.loads += loads
+    define_max_loads(csg.loads)
+    define_min_df(csg)
+    define_safety_factors(csg)
+
+
+async def run_batch_async(casings, settings=None, executor=None, timeout=None, limit=None):
+    """
+    Run the load cases of many casings concurrently without blocking the event loop.
+
+    Arguments:
+        casings (list): casing objects
+        settings (dict or None): load case settings used for every casing
+        executor (Executor or None): executor to run the cases in
+        timeout (num or None): seconds allowed for each casing
+        limit (int or None): maximum number of casings running at the same time
+
+    Returns:
+        list with None for each finished casing or the exception raised by it (e.g. asyncio.TimeoutError)
+    """
+
+    semaphore = asyncio.Semaphore(limit) if limit is not None else None
+
+    async def run(csg):
+        if semaphore is None:
+            return await run_loads_async(csg, settings, executor, timeout)
+        async with semaphore:
+            return await run_loads_async(csg, settings, executor, timeout)
+
+    return await asyncio.gather(*[run(csg) for csg in casings], return_exceptions=True)
+
+
+def _run_remote(csg, settings, mode):
+    csg.loads = []
+    csg.run_loads(settings, mode)
+    return csg.settings, csg.msgs, csg.loads
@@ -1,6 +1,9 @@
 from math import pi
+import numpy as np
 
 from ..unit_converter import convert_unit
+from ..profiles import Profile, piecewise
+from ..fluids import fluid_column
 
 
 def air_weight(tvd, nominal_weight):
@@ -8,10 +11,10 @@ def air_weight(tvd, nominal_weight):
     Calculate axial force due to pipe weight in air
     :param tvd: list - true vertical depth, m
     :param nominal_weight: weight per unit length, kg/m
-    :return: axial force profile, kN
+    :return: axial force profile (linear Profile), kN
     """
 
-    f_w = [nominal_weight * (tvd[-1] - x) / 1000 for x in tvd]
+    f_w = Profile.linear(nominal_weight * tvd[-1] / 1000, - nominal_weight / 1000, tvd)
 
     return f_w
 
@@ -37,8 +40,8 @@ def buoyancy_force(tvd, od_csg, id_csg, tvd_fluid_ext, rho_fluid_ext, tvd_fluid_
     area_int = (pi / 4) * id_csg ** 2
     area_int = convert_unit(area_int, unit_from="in2", unit_to="m2")
 
-    f_bu = [area_total * x - area_int * y for x, y in zip(p_ext, p_int)]
-    f_bu = [x/1000 for x in f_bu]       # N to kN
+    f_bu = area_total * p_ext - area_int * p_int
+    f_bu = f_bu / 1000       # N to kN
 
     return f_bu
 
@@ -57,12 +60,12 @@ def drag(trajectory, od_csg, id_csg, shoe_depth, nominal_weight, tvd_fluid, rho_
     :param sliding_fric: sliding friction factor pipe - wellbore
     :param case: operational case "lowering", "static", "hoisting" or "all"
     :param hole: borehole size, in
-    :return: axial force profile, kN
+    :return: axial force profile, kN. With case "all" a dict with the profile of every case
     """
 
     import torque_drag
 
-    rhof = density_profile(trajectory.tvd, tvd_fluid, rho_fluid)
+    rhof = density_profile(trajectory.tvd, tvd_fluid, rho_fluid).tolist()
 
     area = (pi / 4) * (od_csg ** 2 - id_csg * 2)        # in2
     area = convert_unit(area, unit_from="in2", unit_to="m2")
@@ -78,9 +81,12 @@ def drag(trajectory, od_csg, id_csg, shoe_depth, nominal_weight, tvd_fluid, rho_
                            case=case,
                            fric=sliding_fric,
                            wob=0,
-                           tbit=0).force[case]      # kN
+                           tbit=0).force      # kN
+
+    if case == 'all':
+        return {key: np.array(value, dtype=float) for key, value in f_d.items()}
 
-    return f_d
+    return np.array(f_d[case], dtype=float)
 
 
 def pressure_testing(tvd, whp, effective_diameter):
@@ -89,14 +95,13 @@ def pressure_testing(tvd, whp, effective_diameter):
     :param tvd: list - true vertical depth, m
     :param whp: wellhead pressure, bar
     :param effective_diameter: diameter, in
-    :return: axial force profile, kN
+    :return: axial force profile (constant Profile), kN
     """
 
     whp = convert_unit(whp, unit_from="bar", unit_to="Pa")
     effective_diameter = convert_unit(effective_diameter, unit_from="in", unit_to="m")
 
-    f_h = [(effective_diameter ** 2) * (pi/4) * whp] * len(tvd)
-    f_h = [x / 1000 for x in f_h]  # N to kN
+    f_h = Profile.constant((effective_diameter ** 2) * (pi/4) * whp / 1000, len(tvd))     # N to kN
 
     return f_h
 
@@ -115,14 +120,14 @@ def pickup_force(tvd, od_csg, id_csg, tvd_toc, t_k, t_o, e, alpha):
     :return: axial force profile, kN
     """
 
-    delta_t = [x - y for x, y in zip(t_k, t_o)]
+    tvd = np.asarray(tvd, dtype=float)
+    delta_t = np.asarray(t_k, dtype=float) - np.asarray(t_o, dtype=float)
     area = (pi/4) * (od_csg**2 - id_csg*2)
     area = convert_unit(area, unit_from="in2", unit_to="m2")
     e = convert_unit(e, unit_from="bar", unit_to="Pa")
 
-    f_pu = [e * area * alpha * y for x, y in zip(tvd, delta_t) if x <= tvd_toc]
-    f_pu += [0] * (len(tvd) - len(f_pu))
-    f_pu = [x / 1000 for x in f_pu]  # N to kN
+    f_pu = np.where(tvd <= tvd_toc, e * area * alpha * delta_t, 0)
+    f_pu = f_pu / 1000  # N to kN
 
     return f_pu
 
@@ -141,15 +146,16 @@ def thermal_load(trajectory, od_csg, id_csg, t_w, temp, alpha, e):
     """
 
     gradient = (temp['target']['temp'] - temp['seabed']['temp']) / (temp['target']['tvd'] - temp['seabed']['tvd'])
-    t_o = [temp['seabed']['temp'] + gradient * (tvd - temp['seabed']['tvd']) for tvd in trajectory.tvd]
-    t_k = [t_w + gradient * (tvd - temp['seabed']['tvd']) for tvd in trajectory.tvd]
-    delta_t = [x - y for x, y in zip(t_k, t_o)]
+    tvd = np.asarray(trajectory.tvd, dtype=float)
+    t_o = temp['seabed']['temp'] + gradient * (tvd - temp['seabed']['tvd'])
+    t_k = t_w + gradient * (tvd - temp['seabed']['tvd'])
+    delta_t = t_k - t_o
     area = (pi / 4) * (od_csg ** 2 - id_csg * 2)
     area = convert_unit(area, unit_from="in2", unit_to="m2")
     e = convert_unit(e, unit_from="bar", unit_to="Pa")
 
-    f_th = [- e * area * alpha * x for x in delta_t]
-    f_th = [x / 1000 for x in f_th]  # N to kN
+    f_th = - e * area * alpha * delta_t
+    f_th = f_th / 1000  # N to kN
 
     return f_th
 
@@ -170,11 +176,11 @@ def ballooning(md, md_toc, od_csg, id_csg, rho_fluid_int, rho_fluid_ext, poisson
     area_i = convert_unit(pi * (id_csg / 2) ** 2, unit_from='in2', unit_to='m2')
     area_o = convert_unit(pi * (od_csg / 2) ** 2, unit_from='in2', unit_to='m2')
 
+    md = np.asarray(md, dtype=float)
     delta_rho_i = rho_fluid_ext - rho_fluid_int
     delta_rho_a = 0
-    f_bl = [-2 * poisson * ((area_i * delta_rho_i * x - area_o * delta_rho_a * x) * 0.0981) for x in md if x >= md_toc]
-    f_bl = [0] * (len(md) - len(f_bl)) + f_bl
-    f_bl = [x / 1000 for x in f_bl]  # N to kN
+    f_bl = np.where(md >= md_toc, -2 * poisson * ((area_i * delta_rho_i * md - area_o * delta_rho_a * md) * 0.0981), 0)
+    f_bl = f_bl / 1000  # N to kN
 
     return f_bl
 
@@ -189,7 +195,7 @@ def shock_load(tvd, v_avg, od_csg, id_csg, nominal_weight, e, a=1.5):
     :param nominal_weight: weight per unit length, kg/m
     :param e: pipe Young's modulus, bar
     :param a: ratio of maximum running speed to average running speed
-    :return: axial force profile, kN
+    :return: axial force profile (constant Profile), kN
     """
 
     area = (pi / 4) * (od_csg ** 2 - id_csg * 2)
@@ -198,8 +204,7 @@ def shock_load(tvd, v_avg, od_csg, id_csg, nominal_weight, e, a=1.5):
 
     rho_pipe = nominal_weight / area
 
-    f_sh = [a * v_avg * area * (e * rho_pipe) ** 0.5] * len(tvd)
-    f_sh = [x / 1000 for x in f_sh]  # N to kN
+    f_sh = Profile.constant(a * v_avg * area * (e * rho_pipe) ** 0.5 / 1000, len(tvd))     # N to kN
 
     return f_sh
 
@@ -216,8 +221,8 @@ def bending(od_csg, dls, dls_res, e):
 
     e = convert_unit(e, unit_from="bar", unit_to="psi")
 
-    f_be = [pi * e * (x/dls_res) * od_csg * 30.48 / 4.32e5 for x in dls]       # lbf
-    f_be = [convert_unit(x, unit_from="lbf", unit_to="kN") for x in f_be]       # lbf to kN
+    f_be = pi * e * (np.asarray(dls, dtype=float) / dls_res) * od_csg * 30.48 / 4.32e5       # lbf
+    f_be = f_be * 4.448 / 1000       # lbf to kN
 
     return f_be
 
@@ -226,60 +231,25 @@ def pressure_profile(tvd, tvd_fluid, rho_fluid):
     """
     Generate hydrostatic pressure profile
     :param tvd: list - true vertical depth, m
-    :param tvd_fluid: list - reference tvd of fluid change, m
+    :param tvd_fluid: list - reference tvd of fluid change, m, or a FluidColumn
     :param rho_fluid: list - downwards sorted fluids densities, sg
-    :return: pressure profile, Pa
+    :return: pressure profile, Pa. A linear Profile for a single fluid, a piecewise Profile for more fluids
     """
-    g = 9.81        # gravity constant, [m/s2]
-    rho_fluid = [convert_unit(x, unit_from="sg", unit_to="kg/m3") for x in rho_fluid]   # convert sg to kg/m3
-
-    tvd_fluid.append(tvd[-1])
 
-    p_prev = 0
-    tvd_fluid_prev = 0
-    rho_fluid = iter(rho_fluid)
-    tvd_fluid = iter(tvd_fluid)
-    rho_fluid_selected = next(rho_fluid)
-    tvd_fluid_selected = next(tvd_fluid)
+    column = fluid_column(tvd_fluid, rho_fluid)
+    if len(column) == 1:
+        return Profile.linear(0.0, column.gradients[0], tvd)
 
-    pressure = []
-    density = []
-    for x in tvd:
-        p = g * rho_fluid_selected * (x - tvd_fluid_prev) + p_prev
-        density.append(rho_fluid_selected)
-
-        if (x >= tvd_fluid_selected) and (tvd_fluid_selected != tvd[-1]):
-            tvd_fluid_prev = tvd_fluid_selected
-            tvd_fluid_selected = next(tvd_fluid)
-            rho_fluid_selected = next(rho_fluid)
-            p_prev = p
-        pressure.append(p)
-
-    return pressure
+    return piecewise(tvd, column.interfaces, column.pressure)
 
 
 def density_profile(tvd, tvd_fluid, rho_fluid):
     """
     Generate a density profile from specific density values and depth of change
     :param tvd: list - true vertical depth, m
-    :param tvd_fluid: list - reference tvd of fluid change, m
+    :param tvd_fluid: list - reference tvd of fluid change, m, or a FluidColumn
     :param rho_fluid: list - downwards sorted fluids densities, sg
     :return: density profile
     """
 
-    tvd_fluid.append(tvd[-1])
-
-    rho_fluid = iter(rho_fluid)
-    tvd_fluid = iter(tvd_fluid)
-    rho_fluid_selected = next(rho_fluid)
-    tvd_fluid_selected = next(tvd_fluid)
-
-    density = []
-    for x in tvd:
-        density.append(rho_fluid_selected)
-
-        if (x >= tvd_fluid_selected) and (tvd_fluid_selected != tvd[-1]):
-            tvd_fluid_selected = next(tvd_fluid)
-            rho_fluid_selected = next(rho_fluid)
-
-    return density
+    return fluid_column(tvd_fluid, rho_fluid).density(tvd)
@@ -0,0 +1,227 @@
+import json
+import os
+import numpy as np
+from .trajectory import Trajectory
+from .survey import read_trajectory
+
+CASES = ['Overpull', 'Running', 'Green Cement Pressure Test', 'Cementing', 'Full Evacuation', 'Mud Drop',
+         'Displacement to gas', 'Production', 'Injection', 'Pressure Test', 'Gas kick']
+
+
+def evaluate_batch(pipes, survey, settings=None, factors=None, store=None):
+    """
+    Run the load cases for many casing candidates against one well.
+
+    Arguments:
+        pipes (list): pipe dicts, one per candidate (see Casing)
+        survey: survey file, Trajectory object or anything accepted by Casing.add_trajectory
+        settings (dict or None): load case settings used for every candidate
+        factors (dict or None): design factors used for every candidate
+        store (str or None): folder to write the load profiles to as a ResultStore. Only the summaries are kept
+                             in memory.
+
+    Returns:
+        list of summaries (see summarize), one per candidate
+    """
+
+    from . import Casing
+
+    survey = read_trajectory(survey)
+
+    result_store = None
+    if store is not None:
+        stations = max(len(survey.window(pipe['top'], pipe['shoeDepth'])) for pipe in pipes)
+        result_store = ResultStore.create(store, len(pipes), stations)
+
+    summaries = []
+    try:
+        for idx, pipe in enumerate(pipes):
+            csg = Casing(pipe, factors=factors)
+            csg.add_trajectory(survey)
+            csg.run_loads(settings)
+            summaries.append(summarize(csg))
+            if result_store is not None:
+                result_store.write(idx, csg, summaries[-1])
+    finally:
+        if result_store is not None:        # keep the candidates already written readable
+            result_store.close()
+
+    return summaries
+
+
+def summarize(csg):
+    """
+    Get the summary of the loads run for a casing.
+
+    Arguments:
+        csg: casing obj with loads already run
+
+    Returns:
+        dict with 'maxLoads' and 'minDF' per load case, 'safetyFactors' and 'msgs'
+    """
+
+    summary = {'maxLoads': {}, 'minDF': {}, 'safetyFactors': csg.safety_factors, 'msgs': csg.msgs}
+    for load in csg.loads:
+        summary['maxLoads'][load['description']] = load['maxLoads']
+        summary['minDF'][load['description']] = load['minDF']
+
+    return json.loads(json.dumps(summary, default=float))
+
+
+class ResultStore(object):
+    """
+    Disk backed load profiles of a candidate sweep with layout (candidate, case, station). Cases follow the order
+    of the store case list (kept in layout.json), cases that were not run and stations beyond the candidate length
+    are NaN.
+
+    Use ResultStore.create to start a new store and ResultStore.open to read an existing one.
+
+    Attributes:
+        path (str): store folder
+        cases (list): load case names of the case axis
+        axial_force (memmap): axial force profiles, lbf
+        diff_pressure (memmap): differential pressure profiles, psi
+        md, tvd (memmap): depths of each candidate (candidate, station), m
+        points (array): number of stations of each candidate
+        summary (list): summary of each candidate, None if it has not been written yet
+    """
+
+    def __init__(self, path, candidates, stations, mode, cases):
+        self.path = path
+        self.cases = list(cases)
+        shape = (candidates, len(self.cases), stations)
+        self.axial_force = np.memmap(os.path.join(path, 'axialForce.dat'), np.float64, mode, shape=shape)
+        self.diff_pressure = np.memmap(os.path.join(path, 'diffPressure.dat'), np.float64, mode, shape=shape)
+        self.md = np.memmap(os.path.join(path, 'md.dat'), np.float64, mode, shape=shape[::2])
+        self.tvd = np.memmap(os.path.join(path, 'tvd.dat'), np.float64, mode, shape=shape[::2])
+        self.points = np.zeros(candidates, dtype=int)
+        self.summary = [None] * candidates
+
+    @classmethod
+    def create(cls, path, candidates, stations, cases=None):
+        """
+        Create a new store, it overwrites any previous store in the same folder.
+
+        Arguments:
+            path (str): store folder
+            candidates (int): number of candidates
+            stations (int): maximum number of stations per candidate
+            cases (list or None): load case names, the registered ones now if None (see case_names)
+
+        Returns:
+            ResultStore object
+        """
+
+        if cases is None:
+            from .registry import case_names
+            cases = case_names()
+
+        os.makedirs(path, exist_ok=True)
+        store = cls(path, candidates, stations, 'w+', cases)
+        for array in [store.axial_force, store.diff_pressure, store.md, store.tvd]:
+            array.fill(np.nan)
+
+        return store
+
+    @classmethod
+    def open(cls, path):
+        """
+        Open an existing store for reading, with the case list it was written with.
+
+        Arguments:
+            path (str): store folder
+
+        Returns:
+            ResultStore object
+        """
+
+        with open(os.path.join(path, 'layout.json')) as file:
+            layout = json.load(file)
+
+        store = cls(path, layout['candidates'], layout['stations'], 'r', layout.get('cases', CASES))
+        store.points = np.array(layout['points'])
+        store.summary = layout['summary']
+
+        return store
+
+    def write(self, idx, csg, summary=None):
+        """
+        Write the loads of a casing as a candidate.
+
+        Arguments:
+            idx (int): candidate index
+            csg: casing obj with loads already run
+            summary (dict or None): summary to keep in memory. By default it is calculated with summarize.
+        """
+
+        missing = [load['description'] for load in csg.loads if load['description'] not in self.cases]
+        if missing:
+            raise ValueError('load cases not in the store: {}'.format(', '.join(missing)))
+
+        points = len(csg.trajectory.md)
+        self.md[idx, :points] = csg.trajectory.md
+        self.tvd[idx, :points] = csg.trajectory.tvd
+        for load in csg.loads:
+            case = self.cases.index(load['description'])
+            self.axial_force[idx, case, :points] = load['axialForce']
+            self.diff_pressure[idx, case, :points] = load['diffPressure']
+
+        self.points[idx] = points
+        self.summary[idx] = summary if summary is not None else summarize(csg)
+
+    def loads(self, idx):
+        """
+        Get the loads of a candidate without reading the rest of the store.
+
+        Arguments:
+            idx (int): candidate index
+
+        Returns:
+            list of loads as in Casing.loads (only the cases that were run)
+        """
+
+        points = self.points[idx]
+        loads = []
+        for case, description in enumerate(self.cases):
+            if np.isnan(self.axial_force[idx, case, 0]):
+                continue
+            loads.append({'description': description,
+                          'axialForce': self.axial_force[idx, case, :points],
+                          'diffPressure': self.diff_pressure[idx, case, :points],
+                          'maxLoads': self.summary[idx]['maxLoads'][description],
+                          'minDF': self.summary[idx]['minDF'][description]})
+
+        return loads
+
+    def restore(self, idx, csg):
+        """
+        Load a candidate back into a casing object, e.g. for plotting. Only md and tvd of the trajectory are
+        restored.
+
+        Arguments:
+            idx (int): candidate index
+            csg: casing obj created with the candidate pipe
+        """
+
+        points = self.points[idx]
+        csg.trajectory = Trajectory(self.md[idx, :points], self.tvd[idx, :points], None, None, None)
+        csg.loads = self.loads(idx)
+        csg.safety_factors = self.summary[idx]['safetyFactors']
+        csg.msgs = self.summary[idx]['msgs']
+
+    def flush(self):
+        """
+        Write pending profile changes and the layout (points and summaries) to disk.
+        """
+
+        for array in [self.axial_force, self.diff_pressure, self.md, self.tvd]:
+            array.flush()
+
+        layout = {'candidates': self.axial_force.shape[0], 'stations': self.axial_force.shape[2],
+                  'cases': self.cases, 'points': self.points.tolist(), 'summary': self.summary}
+        with open(os.path.join(self.path, 'layout.json'), 'w') as file:
+            json.dump(layout, file)
+
+    def close(self):
+        if self.axial_force.mode != 'r':
+            self.flush()
@@ -62,7 +62,7 @@ def drilling_influx_3(tvd, rho_mud, id_csg, od_dp, p_res, tvd_res, vol_kick_init
     p_int = gas_kick(tvd, rho_mud, p_res, tvd_res, vol_kick_initial, id_csg, od_dp)
     p_ext = onefluid_behindcasing(tvd, rho_mud)
 
-    pressure_differential = [x - y for x, y in zip(p_int, p_ext)]
+    pressure_differential = p_int - p_ext
 
     return pressure_differential
 
@@ -83,7 +83,7 @@ def pressure_test_onefluid(tvd, p_test, rho_fluid_int, rho_fluid_ext):
     p_int = pressure_test(tvd, p_test, rho_fluid_int)
     p_ext = onefluid_behindcasing(tvd, rho_fluid_ext)
 
-    pressure_differential = [x - y for x, y in zip(p_int, p_ext)]
+    pressure_differential = p_int - p_ext
 
     return pressure_differential
 
@@ -105,7 +105,7 @@ def pressure_test_morefluids(tvd, p_test, rho_mud, rho_fluid, tvd_fluid):
     p_int = pressure_test(tvd, p_test, rho_mud)
     p_ext = morefluids_behindcasing(tvd, rho_fluid, tvd_fluid)
 
-    pressure_differential = [x - y for x, y in zip(p_int, p_ext)]
+    pressure_differential = p_int - p_ext
 
     return pressure_differential
 
@@ -129,7 +129,7 @@ def production_with_packer(tvd, rho_fluid, rho_mud, p_res, tvd_perf, rho_packerf
     p_int = tubing_leak(tvd, p_res, rho_fluid, tvd_perf, rho_packerfluid, tvd_packer, rho_mud)
     p_ext = onefluid_behindcasing(tvd, rho_mud)
 
-    pressure_differential = [x - y for x, y in zip(p_int, p_ext)]
+    pressure_differential = p_int - p_ext
 
     return pressure_differential
 
@@ -178,7 +178,7 @@ def gas_filled(tvd, p_res, rho_gas, tvd_res, rho_mud):
     p_int = displacement_to_gas(tvd, p_res, rho_gas, tvd_res)
     p_ext = onefluid_behindcasing(tvd, rho_mud)
 
-    pressure_differential = [x - y for x, y in zip(p_int, p_ext)]
+    pressure_differential = p_int - p_ext
 
     return pressure_differential
 
@@ -225,7 +225,7 @@ def stimulation(tvd, whp, rho_injectionfluid, rho_mud, rho_packerfluid, tvd_pack
     p_int = tubing_leak_stimulation(tvd, whp, rho_packerfluid, rho_injectionfluid, tvd_packer)
     p_ext = onefluid_behindcasing(tvd, rho_mud)
 
-    pressure_differential = [x - y for x, y in zip(p_int, p_ext)]
+    pressure_differential = p_int - p_ext
 
     return pressure_differential
 
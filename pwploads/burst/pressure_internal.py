@@ -1,6 +1,7 @@
 from ..unit_converter import convert_unit
 from math import pi
-from numpy import array
+import numpy as np
+from ..profiles import Profile, piecewise
 g = 9.81        # gravity constant, [m/s2]
 
 
@@ -11,12 +12,12 @@ def fraction_of_bhp_at_wh(tvd, rho_mud, tvd_next_section, fraction=0.5):
     :param rho_mud: mud density, sg
     :param tvd_next_section: tvd at bottom, m
     :param fraction: bhp fraction at wh
-    :return: internal pressure profile, Pa
+    :return: internal pressure profile (constant Profile), Pa
     """
 
     rho_mud = convert_unit(rho_mud, unit_from="sg", unit_to="kg/m3")
     bhp = g * rho_mud * tvd_next_section
-    p_int = [fraction * bhp] * len(tvd)
+    p_int = Profile.constant(fraction * bhp, len(tvd))
 
     return p_int
 
@@ -27,14 +28,14 @@ def frac_shoe_gas_grad_above(tvd, frac_gradient, rho_fluid):
     :param tvd: list - true vertical depth, m
     :param frac_gradient: fracture gradient, bar/m
     :param rho_fluid: fluid density, sg
-    :return: internal pressure profile, Pa
+    :return: internal pressure profile (linear Profile), Pa
     """
 
     frac_gradient = convert_unit(frac_gradient, unit_from="bar", unit_to="Pa")      # from bar/m to Pa/m
     rho_fluid = convert_unit(rho_fluid, unit_from="sg", unit_to="kg/m3")
     tvd_frac = tvd[-1]
     p_frac = frac_gradient * tvd_frac
-    p_int = [p_frac - g * rho_fluid * (tvd_frac - x) for x in tvd]
+    p_int = Profile.linear(p_frac - g * rho_fluid * tvd_frac, g * rho_fluid, tvd)
 
     return p_int
 
@@ -49,7 +50,7 @@ def gas_kick(tvd, rho_mud, p_res, tvd_res, vol_kick_initial, id_csg, od_dp):
     :param vol_kick_initial: influx initial volume, m3
     :param id_csg: casing inner diameter, in
     :param od_dp: drill pipe outer diameter, in
-    :return: internal pressure profile, Pa
+    :return: internal pressure profile (linear Profile), Pa
     """
 
     p_res = convert_unit(p_res, unit_from="bar", unit_to="Pa")
@@ -60,25 +61,26 @@ def gas_kick(tvd, rho_mud, p_res, tvd_res, vol_kick_initial, id_csg, od_dp):
 
     bhp = g * (rho_mud + kick_intensity) * tvd_res    # bottom hole pressure [Pa]
 
-    p = [g * rho_mud * x for x in tvd]      # hydrostatic pressure profile [Pa]
+    x = np.asarray(tvd, dtype=float)
+    p = g * rho_mud * x      # hydrostatic pressure profile [Pa]
 
-    vol_kick = [vol_kick_initial * (bhp / x) for x in p]  # * (temp/temp_kick) * (z/z_kick) [m3]
-    rho_kick = [rho_kick_initial * (vol_kick_initial / x) for x in vol_kick]
+    with np.errstate(divide='ignore'):
+        vol_kick = vol_kick_initial * (bhp / p)  # * (temp/temp_kick) * (z/z_kick) [m3]
+    rho_kick = rho_kick_initial * (vol_kick_initial / vol_kick)
 
-    p_basekick = [bhp - g * rho_mud * (tvd_res - x) for x in tvd]      # [Pa]
+    p_basekick = bhp - g * rho_mud * (tvd_res - x)      # [Pa]
 
     ir_csg = convert_unit(id_csg/2, unit_from="in", unit_to="m")
     or_dp = convert_unit(od_dp/2, unit_from="in", unit_to="m")
 
-    h = [x / (pi * (ir_csg ** 2 - or_dp ** 2)) for x in vol_kick]       # influx height [m]
-    tvd_topkick = array([x - y for x, y in zip(tvd, h)])
-    tvd_topkick[tvd_topkick < 0] = 0
+    h = vol_kick / (pi * (ir_csg ** 2 - or_dp ** 2))       # influx height [m]
+    tvd_topkick = np.maximum(x - h, 0)
 
-    p_topkick = [a - g * b * (c - d) for a, b, c, d in zip(p_basekick, rho_kick, tvd, tvd_topkick) if d >= 0]
+    p_topkick = p_basekick - g * rho_kick * (x - tvd_topkick)
 
-    whp = [x - g * rho_mud * y for x, y in zip(p_topkick, tvd_topkick)]
+    whp = p_topkick - g * rho_mud * tvd_topkick
 
-    p_int = [max(whp) + ((bhp - max(whp)) / tvd_res) * x for x in tvd]
+    p_int = Profile.linear(whp.max(), (bhp - whp.max()) / tvd_res, tvd)
 
     return p_int
 
@@ -90,13 +92,13 @@ def displacement_to_gas(tvd, p_res, rho_gas, tvd_res):
     :param p_res: reservoir pressure, bar
     :param rho_gas: gas density, sg
     :param tvd_res: tvd at reservoir, m
-    :return: internal pressure profile, Pa
+    :return: internal pressure profile (linear Profile), Pa
     """
 
     p_res = convert_unit(p_res, unit_from="bar", unit_to="Pa")
     rho_gas = convert_unit(rho_gas, unit_from="sg", unit_to="kg/m3")
 
-    p_int = [p_res - g * rho_gas * (tvd_res - x) for x in tvd]
+    p_int = Profile.linear(p_res - g * rho_gas * tvd_res, g * rho_gas, tvd)
 
     return p_int
 
@@ -107,14 +109,14 @@ def pressure_test(tvd, p_test, rho_mud):
     :param tvd: list - true vertical depth, m
     :param p_test: testing pressure, bar
     :param rho_mud: float - downwards sorted mud densities, sg
-    :return: internal pressure profile, Pa
+    :return: internal pressure profile (linear Profile), Pa
     """
 
     p_test = convert_unit(p_test, unit_from="bar", unit_to="Pa")
 
     rho_fluid = convert_unit(rho_mud, unit_from="sg", unit_to="kg/m3")  # convert sg to kg/m3
 
-    return [g * rho_fluid * tvd + p_test for tvd in tvd]
+    return Profile.linear(p_test, g * rho_fluid, tvd)
 
 
 def tubing_leak(tvd, p_res, rho_fluid, tvd_perf, rho_packerfluid, tvd_packer, rho_mud):
@@ -128,7 +130,7 @@ def tubing_leak(tvd, p_res, rho_fluid, tvd_perf, rho_packerfluid, tvd_packer, rh
     :param rho_packerfluid: packer fluid density, sg
     :param tvd_packer: tvd at packer, m
     :param rho_mud: mud density, sg
-    :return: internal pressure profile, Pa
+    :return: internal pressure profile (piecewise Profile between packer and perforations), Pa
     """
 
     p_res = convert_unit(p_res, unit_from="bar", unit_to="Pa")
@@ -137,11 +139,12 @@ def tubing_leak(tvd, p_res, rho_fluid, tvd_perf, rho_packerfluid, tvd_packer, rh
 
     whp = p_res - g * rho_fluid * tvd_perf      # wellhead pressure [Pa]
 
-    p_int = [whp + g * rho_packerfluid * x for x in tvd if x <= tvd_packer] + \
-            [p_res - g * rho_packerfluid * (tvd_perf - x) for x in tvd if (x > tvd_packer) and (x <= tvd_perf)] + \
-            [p_res + g * rho_mud * (x - tvd_perf) for x in tvd if x > tvd_perf]
+    def p_int(x):
+        return np.select([x <= tvd_packer, x <= tvd_perf],
+                         [whp + g * rho_packerfluid * x, p_res - g * rho_packerfluid * (tvd_perf - x)],
+                         p_res + g * rho_mud * (x - tvd_perf))
 
-    return p_int
+    return piecewise(tvd, [tvd_packer, tvd_perf], p_int)
 
 
 def tubing_leak_stimulation(tvd, whp, rho_packerfluid, rho_injectionfluid, tvd_packer=0):
@@ -152,14 +155,14 @@ def tubing_leak_stimulation(tvd, whp, rho_packerfluid, rho_injectionfluid, tvd_p
     :param rho_packerfluid: packer fluid density, sg
     :param rho_injectionfluid: injection fluid density, sg
     :param tvd_packer: tvd at packer, m
-    :return: internal pressure profile, Pa
+    :return: internal pressure profile (piecewise Profile around the packer), Pa
     """
 
     whp = convert_unit(whp, unit_from="bar", unit_to="Pa")
     rho_injectionfluid = convert_unit(rho_injectionfluid, unit_from="sg", unit_to="kg/m3")
     rho_packerfluid = convert_unit(rho_packerfluid, unit_from="sg", unit_to="kg/m3")
 
-    p_int = [whp + g * rho_packerfluid * x for x in tvd if x <= tvd_packer] + \
-            [whp + g * rho_injectionfluid * x for x in tvd if x > tvd_packer]
+    def p_int(x):
+        return np.where(x <= tvd_packer, whp + g * rho_packerfluid * x, whp + g * rho_injectionfluid * x)
 
-    return p_int
+    return piecewise(tvd, [tvd_packer], p_int)
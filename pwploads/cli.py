@@ -0,0 +1,183 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from .shared import SharedSurvey, SurveyHandle, detach_all
+from .batch import summarize
+
+_mapped = None      # survey block mapped by the current worker process
+
+
+def main(argv=None):
+    """
+    Command line entry point, see `pwploads --help`.
+
+    Arguments:
+        argv (list or None): arguments, sys.argv is used by default
+
+    Returns:
+        exit code
+    """
+
+    parser = argparse.ArgumentParser(prog='pwploads', description='Load cases for well design')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    batch = commands.add_parser('batch', help='run a JSON lines file of jobs through a worker pool')
+    batch.add_argument('jobs', help="JSON lines file, one job per line: {'pipe', 'factors', 'settings', 'survey', "
+                                    "'id'}, only 'pipe' and 'survey' are required")
+    batch.add_argument('-j', '--workers', type=int, default=os.cpu_count(), help='number of worker processes')
+    batch.add_argument('-o', '--output', default='-', help='JSON lines output file, stdout by default')
+    batch.add_argument('--unordered', action='store_true', help='write results as they complete')
+    batch.add_argument('-q', '--quiet', action='store_true', help='do not report progress')
+
+    serve = commands.add_parser('serve', help='answer JSON line requests with warm workers (see pwploads.serve)')
+    serve.add_argument('-j', '--workers', type=int, default=1,
+                       help='number of worker processes, 0 to answer in the main process')
+    serve.add_argument('--socket', help='unix socket file to listen on instead of stdin/stdout')
+    serve.add_argument('--preload', nargs='*', default=[], help='surveys to read before the first request')
+    serve.add_argument('--cache-size', type=int, default=64,
+                       help='surveys, casings and trajectory windows kept by each worker')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'batch':
+        progress = None if args.quiet else sys.stderr
+        if args.output == '-':
+            return run_batch(args.jobs, sys.stdout, args.workers, not args.unordered, progress)
+        with open(args.output, 'w') as output:
+            return run_batch(args.jobs, output, args.workers, not args.unordered, progress)
+
+    if args.command == 'serve':
+        from .serve import Server, serve, serve_socket
+        server = Server(args.workers, args.preload, args.cache_size)
+        try:
+            if args.socket is None:
+                serve(server, sys.stdin, sys.stdout)
+            else:
+                serve_socket(server, args.socket)
+        finally:
+            server.close()
+        return 0
+
+
+def run_batch(jobs, output, workers=None, ordered=True, progress=None):
+    """
+    Evaluate the jobs of a JSON lines file with a process pool and stream the results. Each unique survey is read
+    once and shared with the workers, and only a few jobs per worker are in flight at any time. A shared survey
+    is released when its last job in flight is written, so only the surveys of those jobs are kept in memory.
+
+    Arguments:
+        jobs (str): JSON lines file, one job per line {'pipe', 'factors', 'settings', 'survey', 'id'}
+        output: writable text file for the results, one JSON line per job {'line', 'id', 'summary'} or
+                {'line', 'id', 'error'}
+        workers (int or None): number of worker processes, os.cpu_count() by default
+        ordered (bool): write the results in the order of the jobs, otherwise as they complete
+        progress: writable text file for progress and throughput reports, None to disable them
+
+    Returns:
+        exit code, 0 if every job was evaluated and 1 otherwise
+    """
+
+    workers = workers or os.cpu_count()
+    surveys = {}        # survey: [SharedSurvey, jobs in flight], closed when its last job is written
+    pending = deque()   # (future, survey)
+    report = {'done': 0, 'errors': 0, 'start': time.perf_counter()}
+    report['last'] = report['start']
+
+    def write(future, survey):
+        result = future.result()
+        output.write(json.dumps(result) + '\n')
+        report['done'] += 1
+        report['errors'] += 'error' in result
+        _report_progress(progress, report)
+        if survey is not None:
+            surveys[survey][1] -= 1
+            if surveys[survey][1] == 0:
+                surveys.pop(survey)[0].close()
+
+    def drain(limit):
+        while len(pending) > limit:
+            if ordered:
+                write(*pending.popleft())
+            else:
+                done, _ = wait([future for future, survey in pending], return_when=FIRST_COMPLETED)
+                for item in [item for item in pending if item[0] in done]:
+                    pending.remove(item)
+                    write(*item)
+
+    try:
+        with ProcessPoolExecutor(workers) as executor, open(jobs) as file:
+            for line, text in enumerate(file, 1):
+                if not text.strip():
+                    continue
+                job = None
+                try:
+                    job = json.loads(text)
+                    if job['survey'] not in surveys:
+                        surveys[job['survey']] = [SharedSurvey(job['survey']), 0]
+                    future = executor.submit(evaluate_job, line, job, surveys[job['survey']][0].handle)
+                    surveys[job['survey']][1] += 1
+                    pending.append((future, job['survey']))
+                except Exception as error:      # bad job line or survey, reported without stopping the batch
+                    failed = Future()
+                    failed.set_result({'line': line, 'id': job.get('id') if isinstance(job, dict) else None,
+                                       'error': '{}: {}'.format(type(error).__name__, error)})
+                    pending.append((failed, None))
+
+                drain(2 * workers - 1)
+
+            drain(0)
+    finally:
+        for survey, count in surveys.values():
+            survey.close()
+
+    report['last'] = 0
+    _report_progress(progress, report)
+
+    return int(report['errors'] > 0)
+
+
+def evaluate_job(line, job, survey):
+    """
+    Run the load cases of one batch job.
+
+    Arguments:
+        line (int): job line number
+        job (dict): {'pipe', 'factors', 'settings', 'id'}
+        survey: SurveyHandle or anything accepted by Casing.add_trajectory
+
+    Returns:
+        dict {'line', 'id', 'summary'}, or {'line', 'id', 'error'} if the job failed
+    """
+
+    from . import Casing
+
+    global _mapped
+    if isinstance(survey, SurveyHandle) and survey.name != _mapped:
+        detach_all()        # the parent removes the blocks of finished surveys, keep only the current one
+        _mapped = survey.name
+
+    result = {'line': line, 'id': job.get('id')}
+    try:
+        csg = Casing(job['pipe'], factors=job.get('factors'))
+        csg.add_trajectory(survey)
+        csg.run_loads(job.get('settings'))
+        result['summary'] = summarize(csg)
+    except Exception as error:
+        result['error'] = '{}: {}'.format(type(error).__name__, error)
+
+    return result
+
+
+def _report_progress(progress, report):
+    now = time.perf_counter()
+    if progress is None or now - report['last'] < 1:
+        return
+    report['last'] = now
+    elapsed = now - report['start']
+    progress.write('{} jobs done, {} failed, {:.1f} jobs/s\n'.format(report['done'], report['errors'],
+                                                                      report['done'] / max(elapsed, 1e-9)))
+    progress.flush()
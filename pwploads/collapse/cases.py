@@ -17,7 +17,7 @@ def plug_cementation_onefluid_behindcasing(tvd, rho_fluid, rho_mud):
     p_int = inside_full(tvd, rho_fluid)
     p_ext = onefluid_behindcasing(tvd, rho_mud)
 
-    pressure_differential = [x - y for x, y in zip(p_int, p_ext)]
+    pressure_differential = p_int - p_ext
 
     return pressure_differential
 
@@ -65,7 +65,7 @@ def production_fullevacuation(tvd, rho_mud):
     p_int = full_evacuation(tvd)
     p_ext = onefluid_behindcasing(tvd, rho_mud)
 
-    pressure_differential = [x - y for x, y in zip(p_int, p_ext)]
+    pressure_differential = p_int - p_ext
 
     return pressure_differential
 
@@ -110,6 +110,6 @@ def fluid_filled(tvd, rho_mud_new, rho_mud):
     p_int = inside_full(tvd, rho_mud_new)
     p_ext = onefluid_behindcasing(tvd, rho_mud)
 
-    pressure_differential = [x - y for x, y in zip(p_int, p_ext)]
+    pressure_differential = p_int - p_ext
 
     return pressure_differential
@@ -1,13 +1,64 @@
+from functools import lru_cache
+import numpy as np
+
+
 def calc_collapse_pressure(dt, yield_strength, axial_stress=None):
+    """
+    Calculate the API 5C3 collapse pressure. Inputs can be numbers or arrays of any shape that broadcast together,
+    e.g. a single pipe with the axial stress at every station.
+
+    Arguments:
+        dt (num or array): ratio --> outer diameter / thickness
+        yield_strength (num or array): minimum yield strength, psi
+        axial_stress (num, array or None): axial stress to reduce the yield strength, psi
 
-    y_p = yield_strength
+    Returns:
+        collapse pressure, psi. A number for number inputs, else an array
+    """
+
+    y_p = np.asarray(yield_strength, dtype=float)
 
     if axial_stress is not None:
-        s_a = axial_stress
+        s_a = np.asarray(axial_stress, dtype=float)
         y_pa = ((1 - 0.75 * (s_a / y_p) ** 2) ** 0.5 - 0.5 * s_a / y_p) * y_p
         y_p = y_pa
 
-    if y_p != 0:
+    dt, y_p = np.broadcast_arrays(np.asarray(dt, dtype=float), y_p)
+    if y_p.ndim == 0:
+        factors = collapse_factors(float(y_p))
+    else:
+        factors = _factors(y_p)
+
+    a, b, c, f, g = [factors[key] for key in 'abcfg']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pressure = np.select(_ranges(dt, factors),
+                             [2 * y_p * (dt - 1) / dt**2, y_p * ((a/dt) - b) - c, y_p * ((f/dt) - g)],
+                             46.96 * 1e6 / (dt * (dt-1)**2))
+    pressure = np.where(y_p != 0, pressure, 0)
+
+    if pressure.ndim == 0:
+        return float(pressure)
+    return pressure
+
+
+@lru_cache(maxsize=1024)
+def collapse_factors(y_p):
+    """
+    Get the API 5C3 collapse factors and D/t limits of each collapse range for a yield strength. They are
+    calculated once per yield strength.
+
+    Arguments:
+        y_p (num): yield strength (reduced by the axial stress if any), psi
+
+    Returns:
+        dict with 'a', 'b', 'c', 'f', 'g', 'dt_yp', 'dt_pt' and 'dt_te'
+    """
+
+    return {key: float(value) for key, value in _factors(np.float64(y_p)).items()}
+
+
+def _factors(y_p):
+    with np.errstate(divide='ignore', invalid='ignore'):
         a = 2.8762 + 0.10679 * 1e-5 * y_p + 0.21301 * 1e-10 * y_p ** 2 - 0.53132 * 1e-16 * y_p ** 3
         b = 0.026233 + 0.50609 * 1e-6 * y_p
         c = -465.93 + 0.030867 * y_p - 0.10483 * 1e-7 * y_p ** 2 + 0.36989 * 1e-13 * y_p ** 3
@@ -19,20 +70,34 @@ def calc_collapse_pressure(dt, yield_strength, axial_stress=None):
         dt_pt = y_p * (a - f) / (c + y_p * (b - g))
         dt_te = (2 + b / a) / (3 * b / a)
 
-        if dt <= dt_yp or dt_yp < 0:
-            collapse_range = 'yield'
-        elif dt_yp < dt < dt_pt:
-            collapse_range = 'plastic'
-        elif dt_pt < dt < dt_te:
-            collapse_range = 'transition'
-        else:
-            collapse_range = 'elastic'
+    return {'a': a, 'b': b, 'c': c, 'f': f, 'g': g, 'dt_yp': dt_yp, 'dt_pt': dt_pt, 'dt_te': dt_te}
 
-        pressure = p_collap(dt, y_p, collapse_range, a, b, c, f, g)
-    else:
-        pressure = 0
 
-    return pressure
+def collapse_range(dt, factors):
+    """
+    Get the collapse range. A D/t equal to the plastic/transition limit is taken as elastic, as it is not inside
+    any of the other ranges.
+
+    Arguments:
+        dt (num or array): ratio --> outer diameter / thickness
+        factors (dict): D/t limits, see collapse_factors
+
+    Returns:
+        'yield', 'plastic', 'transition' or 'elastic', as an array of them for array inputs
+    """
+
+    c_range = np.select(_ranges(np.asarray(dt, dtype=float), factors), ['yield', 'plastic', 'transition'], 'elastic')
+    return str(c_range) if c_range.ndim == 0 else c_range
+
+
+def _ranges(dt, factors):
+    # yield, plastic and transition masks, checked in this order
+    dt_yp, dt_pt, dt_te = factors['dt_yp'], factors['dt_pt'], factors['dt_te']
+    is_yield = (dt <= dt_yp) | (dt_yp < 0)
+    is_plastic = ~is_yield & (dt_yp < dt) & (dt < dt_pt)
+    is_transition = ~is_yield & ~is_plastic & (dt_pt < dt) & (dt < dt_te)
+
+    return [is_yield, is_plastic, is_transition]
 
 
 def p_collap(dt, y_p, c_range, a, b, c, f, g):
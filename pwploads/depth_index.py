@@ -0,0 +1,124 @@
+import numpy as np
+from .envelope import compute_safety_profiles, SF_TYPES
+
+
+class DepthIndex(object):
+    """
+    Loads of a casing stacked by station, to get them at any depth without going through the load lists.
+
+    Arguments:
+        csg: casing obj with trajectory and loads run
+
+    Attributes:
+        md, tvd (array): station depths, m
+        cases (list): load descriptions
+        axial_force (array): case x station axial force, lbf
+        diff_pressure (array): case x station pressure difference, psi
+    """
+
+    def __init__(self, csg):
+        self.csg = csg
+        self.md = np.array(csg.trajectory.md, dtype=float)
+        self.tvd = np.array(csg.trajectory.tvd, dtype=float)
+        self.cases = [load['description'] for load in csg.loads]
+        shape = (len(csg.loads), len(self.md))
+        self.axial_force = np.array([np.asarray(load['axialForce'], dtype=float) for load in csg.loads],
+                                    dtype=float).reshape(shape)
+        self.diff_pressure = np.array([np.asarray(load['diffPressure'], dtype=float) for load in csg.loads],
+                                      dtype=float).reshape(shape)
+        self.trajectory = csg.trajectory
+        self.loads = list(csg.loads)
+        self._increasing = {'md': bool(np.all(np.diff(self.md) > 0)), 'tvd': bool(np.all(np.diff(self.tvd) > 0))}
+
+    def at(self, md=None, tvd=None, cases=None):
+        """
+        Get the loads and safety factors at some depths, interpolated linearly between stations.
+
+        Arguments:
+            md (num, list or array or None): measured depths, m
+            tvd (num, list or array or None): true vertical depths, m. Only if tvd increases along the casing
+            cases (list or None): load descriptions, all the loads if None
+
+        Returns:
+            dict with 'md', 'tvd', 'cases', 'axialForce' and 'diffPressure' (case x depth) and 'safetyFactors' (case x
+            depth array per type, see compute_safety_profiles). NaN outside the casing.
+        """
+
+        if (md is None) == (tvd is None):
+            raise ValueError('give either md or tvd')
+
+        if md is not None:
+            reference, depths = self.md, md
+            name = 'md'
+        else:
+            reference, depths = self.tvd, tvd
+            name = 'tvd'
+        if not self._increasing[name]:
+            raise ValueError('{} does not increase along the casing, it can not be used as depth'.format(name))
+
+        depths = np.atleast_1d(np.asarray(depths, dtype=float))
+        rows = self._rows(cases)
+
+        # station before each depth and weight of the next one
+        idx = np.clip(np.searchsorted(reference, depths, 'right') - 1, 0, max(len(reference) - 2, 0))
+        nxt = np.minimum(idx + 1, len(reference) - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weight = np.where(nxt > idx, (depths - reference[idx]) / (reference[nxt] - reference[idx]), 0.0)
+        outside = (depths < reference[0]) | (depths > reference[-1]) | np.isnan(depths)
+
+        def interpolate(values):
+            result = values[..., idx] * (1 - weight) + values[..., nxt] * weight
+            result[..., outside] = np.nan
+            return result
+
+        axial_force = interpolate(self.axial_force[rows])
+        diff_pressure = interpolate(self.diff_pressure[rows])
+        cases = [self.cases[row] for row in rows]
+        loads = [{'description': case, 'axialForce': force, 'diffPressure': pressure}
+                 for case, force, pressure in zip(cases, axial_force, diff_pressure)]
+        profiles = compute_safety_profiles(self.csg, loads)
+
+        return {'md': interpolate(self.md), 'tvd': interpolate(self.tvd), 'cases': cases,
+                'axialForce': axial_force, 'diffPressure': diff_pressure,
+                'safetyFactors': {sf_type: profiles[sf_type].reshape(axial_force.shape)
+                                  for sf_type in SF_TYPES + ('connection',)}}
+
+    def matches(self, csg):
+        """
+        Returns:
+            True if the index was built from the current trajectory and loads of the casing
+        """
+
+        return self.trajectory is csg.trajectory and len(self.loads) == len(csg.loads) and \
+            all(x is y for x, y in zip(self.loads, csg.loads))
+
+    def _rows(self, cases):
+        if cases is None:
+            return list(range(len(self.cases)))
+        if isinstance(cases, str):
+            cases = [cases]
+        missing = [case for case in cases if case not in self.cases]
+        if missing:
+            raise ValueError('no loads for {}'.format(', '.join(missing)))
+        return [self.cases.index(case) for case in cases]
+
+
+def depth_index(csg):
+    """
+    Get the depth index of a casing. It is kept in the casing and built again when the trajectory or the loads
+    change.
+
+    Arguments:
+        csg: casing obj with trajectory and loads run
+
+    Returns:
+        DepthIndex
+    """
+
+    index = getattr(csg, '_depth_index', None)
+    if index is None or not index.matches(csg):
+        index = DepthIndex(csg)
+        csg._depth_index = index
+    index.csg = csg     # limits of this casing, e.g. after update_design_factors or in a copy
+    return index
+
@@ -1,34 +1,114 @@
-from numpy import linspace
+import numpy as np
 from .collapse_calcs import calc_collapse_pressure
 
 
 def api_limits(dt, yield_strength, limits, area, df_tension=1.3, df_compression=1.3, df_burst=1.1,
                df_collapse=1.1):
 
-    # Defining respective limits according with design factors
-    burst_limit = limits['burst'] / df_burst
-    collapse_limit = limits['collapse'] / df_collapse
-    tension_limit = limits['tension'] / df_tension
-    compression_limit = limits['compression'] / df_compression
+    return ApiEnvelope(dt, yield_strength, limits, area, df_tension, df_compression, df_burst, df_collapse).sample()
 
-    # Zone with collapse and tension
-    axial_force = linspace(0, tension_limit, 20)
-    axial_stress = [x/area for x in axial_force]
-    diff_pressure = [- calc_collapse_pressure(dt, yield_strength, x) / df_collapse for x in axial_stress]
-    collapse_tens_line = [axial_force, diff_pressure]
 
-    # Generating lines [x_list, y_list]
-    burst_line = [[compression_limit, tension_limit], [burst_limit, burst_limit]]
-    compression_line = [[compression_limit, compression_limit], [collapse_limit, burst_limit]]
-    collapse_comp_line = [compression_limit, 0], [collapse_limit, collapse_limit]
-    tension_line = [tension_limit, tension_limit], [burst_limit, collapse_tens_line[1][-1]]
+class ApiEnvelope(object):
+    """
+    API limits of the pipe reduced by the design factors, evaluated in closed form. The collapse limit in tension
+    uses the yield strength reduced by the axial stress (see calc_collapse_pressure).
 
-    x_values = burst_line[0] + tension_line[0] + list(collapse_tens_line[0][::-1]) \
-        + list(collapse_comp_line[0][::-1]) + compression_line[0]
+    Arguments:
+        dt (num): ratio --> outer diameter / thickness
+        yield_strength (num): minimum yield strength, psi
+        limits (dict): 'burst', 'collapse', 'tension' and 'compression' limits without design factors
+        area (num): pipe cross section area, in^2
+        df_tension, df_compression, df_burst, df_collapse (num): design factors
 
-    y_values = burst_line[1] + tension_line[1] + list(collapse_tens_line[1][::-1]) \
-        + list(collapse_comp_line[1][::-1]) + compression_line[1]
+    Attributes:
+        burst_limit, collapse_limit, tension_limit, compression_limit (num): limits with design factors, psi and lbf
+    """
 
-    api_lines = [x_values, y_values]
+    def __init__(self, dt, yield_strength, limits, area, df_tension=1.3, df_compression=1.3, df_burst=1.1,
+                 df_collapse=1.1):
+        self.dt = dt
+        self.yield_strength = yield_strength
+        self.area = area
+        self.df_collapse = df_collapse
 
-    return api_lines, collapse_tens_line
+        self.burst_limit = limits['burst'] / df_burst
+        self.collapse_limit = limits['collapse'] / df_collapse
+        self.tension_limit = limits['tension'] / df_tension
+        self.compression_limit = limits['compression'] / df_compression
+
+    def collapse(self, axial_force):
+        """
+        Get the collapse limit for some axial forces. Forces are taken between 0 and the tension limit, the limit in
+        compression is the collapse limit without axial stress.
+
+        Arguments:
+            axial_force (num or array): axial force, lbf
+
+        Returns:
+            pressure difference (negative), psi
+        """
+
+        return self.rating(np.minimum(axial_force, self.tension_limit)) / self.df_collapse
+
+    def rating(self, axial_force):
+        """
+        Get the collapse rating without design factor for some axial forces. Compression takes the rating without
+        axial stress, in tension the rating goes down to 0 at the yield load and stays there.
+
+        Arguments:
+            axial_force (num or array): axial force, lbf
+
+        Returns:
+            pressure difference (negative or 0), psi
+        """
+
+        axial_stress = np.clip(np.asarray(axial_force, dtype=float) / self.area, 0, self.yield_strength)
+        rating = np.minimum(- calc_collapse_pressure(self.dt, self.yield_strength, axial_stress), 0)
+        if rating.ndim == 0:
+            return float(rating)
+        return rating
+
+    def burst(self, axial_force):
+        """
+        Arguments:
+            axial_force (num or array): axial force, lbf
+
+        Returns:
+            burst limit, psi, with the shape of axial_force
+        """
+
+        return np.full(np.shape(axial_force), self.burst_limit)[()]
+
+    def sample(self, points=20):
+        """
+        Sample the limits for plots.
+
+        Arguments:
+            points (int): points of the collapse line in tension
+
+        Returns:
+            api_lines ([x, y] lists of the whole limit) and collapse_tens_line ([axial forces, pressures] in tension)
+        """
+
+        burst_limit, collapse_limit = self.burst_limit, self.collapse_limit
+        tension_limit, compression_limit = self.tension_limit, self.compression_limit
+
+        # Zone with collapse and tension
+        axial_force = np.linspace(0, tension_limit, points)
+        collapse_tens_line = [axial_force, list(self.collapse(axial_force))]
+
+        # Generating lines [x_list, y_list]
+        burst_line = [[compression_limit, tension_limit], [burst_limit, burst_limit]]
+        compression_line = [[compression_limit, compression_limit], [collapse_limit, burst_limit]]
+        collapse_comp_line = [compression_limit, 0], [collapse_limit, collapse_limit]
+        tension_line = [tension_limit, tension_limit], [burst_limit, collapse_tens_line[1][-1]]
+
+        x_values = burst_line[0] + tension_line[0] + list(collapse_tens_line[0][::-1]) \
+            + list(collapse_comp_line[0][::-1]) + compression_line[0]
+
+        y_values = burst_line[1] + tension_line[1] + list(collapse_tens_line[1][::-1]) \
+            + list(collapse_comp_line[1][::-1]) + compression_line[1]
+
+        api_lines = [x_values, y_values]
+
+        return api_lines, collapse_tens_line
@@ -0,0 +1,176 @@
+import numpy as np
+
+SF_TYPES = ('burst', 'collapse', 'tension', 'compression', 'triaxial')
+
+
+def compute_safety_profiles(csg, loads=None):
+    """
+    Calculate the safety factors of every load at every station in one pass. Burst uses the pipe burst rating,
+    collapse the rating reduced by the axial force (see get_collapse_base), tension and compression the pipe body
+    limits, the connection its limits and triaxial the von Mises stress. Every safety factor (minimum DF,
+    envelopes, plots, joints, depth queries) is taken from here.
+
+    Arguments:
+        csg: casing obj
+        loads (list or None): loads sharing the same stations, csg.loads if None
+
+    Returns:
+        dict with 'cases' (load descriptions), 'md' and 'tvd' (station depths, m, None without trajectory) and a
+        case x station array for 'burst', 'collapse', 'tension', 'compression', 'connection' and 'triaxial'. It is
+        inf where the station has no load of that type.
+    """
+
+    from .utilities import get_collapse_base
+
+    if loads is None:
+        loads = csg.loads
+    axial_force = np.array([np.asarray(load['axialForce'], dtype=float) for load in loads], dtype=float)
+    diff_pressure = np.array([np.asarray(load['diffPressure'], dtype=float) for load in loads], dtype=float)
+    if len(loads) == 0 and csg.trajectory is not None:
+        axial_force = diff_pressure = np.empty((0, len(csg.trajectory.md)))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        profiles = {'burst': np.where(diff_pressure > 0, csg.limits['burst'] / diff_pressure, np.inf),
+                    'collapse': np.where(diff_pressure < 0,
+                                         get_collapse_base(csg, axial_force) / diff_pressure, np.inf),
+                    'tension': np.where(axial_force > 0, csg.limits['tension'] / axial_force, np.inf),
+                    'compression': np.where(axial_force < 0, csg.limits['compression'] / axial_force, np.inf),
+                    'connection': np.where(axial_force > 0, csg.conn_limits[1] / axial_force,
+                                           np.where(axial_force < 0, csg.conn_limits[0] / axial_force, np.inf)),
+                    'triaxial': csg.yield_strength / von_mises_stress(csg, axial_force, diff_pressure)}
+
+    profiles['cases'] = [load['description'] for load in loads]
+    profiles['md'] = profiles['tvd'] = None
+    if csg.trajectory is not None:
+        profiles['md'] = np.array(csg.trajectory.md, dtype=float)
+        profiles['tvd'] = np.array(csg.trajectory.tvd, dtype=float)
+
+    return profiles
+
+
+def von_mises_stress(csg, axial_force, diff_pressure):
+    """
+    Calculate the equivalent stress used for the triaxial ellipse (see vme).
+
+    Arguments:
+        csg: casing obj
+        axial_force (array): axial force, lbf
+        diff_pressure (array): differential pressure, psi
+
+    Returns:
+        von Mises stress, psi
+    """
+
+    a_factor = ((np.pi * (csg.od / 2) ** 2) + (np.pi * (csg.id / 2) ** 2)) / csg.area
+    axial_stress = np.asarray(axial_force, dtype=float) / csg.area
+    pressure = np.asarray(diff_pressure, dtype=float) * a_factor
+
+    return np.sqrt(axial_stress ** 2 - axial_stress * pressure + pressure ** 2)
+
+
+class Envelope(object):
+    """
+    Worst case of every station across load cases and scenarios, updated in place load by load so the load
+    profiles do not need to be kept.
+
+    Arguments:
+        csg: casing obj with trajectory
+        cases (list or None): load case names, the registered ones now if None (see case_names)
+
+    Attributes:
+        md, tvd (array): station depths, m
+        cases (list): load case names, indexed by case
+        safety_factors (dict): minimum SF per station for each type in SF_TYPES
+        case (dict): index in cases of the load governing each station for each type, -1 if none
+        scenario (dict): first scenario governing each station for each type, -1 if none. Scenarios with the same
+                         inputs for the governing case give the same load, see shared
+        shared (dict): scenarios giving the same load by (case index, first scenario), in order
+        axial_force (dict): 'min' and 'max' axial force per station, lbf
+        diff_pressure (dict): 'min' and 'max' differential pressure per station, psi
+        count (int): number of loads added
+    """
+
+    def __init__(self, csg, cases=None):
+        from .registry import case_names
+
+        self.csg = csg
+        self.cases = list(cases) if cases is not None else case_names()
+        self.md = np.array(csg.trajectory.md, dtype=float)
+        self.tvd = np.array(csg.trajectory.tvd, dtype=float)
+        stations = len(self.md)
+        self.safety_factors = {sf_type: np.full(stations, np.inf) for sf_type in SF_TYPES}
+        self.case = {sf_type: np.full(stations, -1) for sf_type in SF_TYPES}
+        self.scenario = {sf_type: np.full(stations, -1) for sf_type in SF_TYPES}
+        self.shared = {}
+        self.axial_force = {'min': np.full(stations, np.inf), 'max': np.full(stations, -np.inf)}
+        self.diff_pressure = {'min': np.full(stations, np.inf), 'max': np.full(stations, -np.inf)}
+        self.count = 0
+
+    def update(self, load, scenario=0):
+        """
+        Add a load to the envelope.
+
+        Arguments:
+            load (dict): load with 'description', 'axialForce' and 'diffPressure'
+            scenario (int): scenario index
+        """
+
+        axial_force = np.asarray(load['axialForce'], dtype=float)
+        diff_pressure = np.asarray(load['diffPressure'], dtype=float)
+        if load['description'] not in self.cases:
+            raise ValueError('load case {} is not in the envelope'.format(load['description']))
+        case = self.cases.index(load['description'])
+        self.shared.setdefault((case, scenario), [scenario])
+        profiles = compute_safety_profiles(self.csg, [{'description': load['description'],
+                                                       'axialForce': axial_force, 'diffPressure': diff_pressure}])
+
+        for sf_type in SF_TYPES:
+            values = profiles[sf_type][0]
+            lower = values < self.safety_factors[sf_type]
+            self.safety_factors[sf_type][lower] = values[lower]
+            self.case[sf_type][lower] = case
+            self.scenario[sf_type][lower] = scenario
+
+        np.minimum(self.axial_force['min'], axial_force, out=self.axial_force['min'])
+        np.maximum(self.axial_force['max'], axial_force, out=self.axial_force['max'])
+        np.minimum(self.diff_pressure['min'], diff_pressure, out=self.diff_pressure['min'])
+        np.maximum(self.diff_pressure['max'], diff_pressure, out=self.diff_pressure['max'])
+        self.count += 1
+
+    def share(self, load, scenario):
+        """
+        Add a scenario giving the same load as an earlier one, e.g. a load reused by scenario_loads. The envelope
+        does not change, the scenario is only listed as governing along with the first one.
+
+        Arguments:
+            load (dict): load with 'description' and 'scenario', the index it was added with
+            scenario (int): scenario index
+        """
+
+        key = (self.cases.index(load['description']), load['scenario'])
+        if key not in self.shared:
+            raise ValueError('load {} of scenario {} was not added'.format(load['description'], load['scenario']))
+        self.shared[key].append(scenario)
+
+    def governing(self):
+        """
+        Get the station with the lowest SF of each type.
+
+        Returns:
+            dict per type in SF_TYPES: {'safetyFactor', 'md', 'tvd', 'case', 'scenario', 'scenarios'}, None if there
+            is no load of that type. 'scenario' is the first governing scenario, 'scenarios' all of them
+        """
+
+        result = {}
+        for sf_type in SF_TYPES:
+            idx = int(np.argmin(self.safety_factors[sf_type]))
+            if np.isinf(self.safety_factors[sf_type][idx]):
+                result[sf_type] = None
+                continue
+            case, scenario = int(self.case[sf_type][idx]), int(self.scenario[sf_type][idx])
+            result[sf_type] = {'safetyFactor': float(self.safety_factors[sf_type][idx]),
+                               'md': float(self.md[idx]), 'tvd': float(self.tvd[idx]),
+                               'case': self.cases[case], 'scenario': scenario,
+                               'scenarios': list(self.shared[(case, scenario)])}
+
+        return result
@@ -0,0 +1,115 @@
+from functools import lru_cache
+import numpy as np
+from .unit_converter import convert_unit
+
+g = 9.81        # gravity constant, [m/s2]
+
+
+class FluidColumn(object):
+    """
+    Column of fluids from surface (tvd = 0) downwards. Every fluid is used down to its reference tvd, the last one
+    down to any depth. The interfaces are validated and sorted once and the pressure at each one is kept, so
+    pressure and density at any tvd take a single searchsorted. Columns with the same fluids are equal and have the
+    same hash, they can be used as cache keys.
+
+    Arguments:
+        tvd_fluid (list): reference tvd of fluid change, m
+        rho_fluid (list): fluid densities, sg. One more than tvd_fluid, the fluid above each reference tvd and the
+                          one below the last
+
+    Attributes:
+        interfaces (array): sorted tvd of fluid change, m
+        densities (array): fluid densities from top to bottom, sg
+        tops (array): tvd at the top of each fluid, m
+        gradients (array): pressure gradient of each fluid, Pa/m
+        pressures (array): hydrostatic pressure at the top of each fluid, Pa
+    """
+
+    def __init__(self, tvd_fluid, rho_fluid):
+        tvd_fluid = [float(x) for x in tvd_fluid]
+        rho_fluid = [float(x) for x in rho_fluid]
+        if len(rho_fluid) != len(tvd_fluid) + 1:
+            raise ValueError('{} fluid densities given for {} fluid changes, {} expected'
+                             .format(len(rho_fluid), len(tvd_fluid), len(tvd_fluid) + 1))
+        if any(x < 0 for x in tvd_fluid) or any(not rho > 0 for rho in rho_fluid):
+            raise ValueError('fluid depths must not be negative and densities must be positive')
+
+        order = sorted(range(len(tvd_fluid)), key=lambda idx: tvd_fluid[idx])
+        self.interfaces = np.array([tvd_fluid[idx] for idx in order], dtype=float)
+        self.densities = np.array([rho_fluid[idx] for idx in order] + rho_fluid[-1:], dtype=float)
+
+        self.tops = np.concatenate(([0.0], self.interfaces))
+        self.gradients = g * convert_unit(self.densities, unit_from="sg", unit_to="kg/m3")
+        self.pressures = np.concatenate(([0.0], np.cumsum(self.gradients[:-1] * np.diff(self.tops))))
+        self._key = (tuple(self.interfaces), tuple(self.densities))
+
+    def __len__(self):
+        return len(self.densities)
+
+    def index(self, tvd):
+        """
+        Arguments:
+            tvd (num or array): true vertical depth, m
+
+        Returns:
+            index of the fluid at each depth, a depth at an interface belongs to the fluid above
+        """
+
+        return np.searchsorted(self.interfaces, np.asarray(tvd, dtype=float), 'left')
+
+    def density(self, tvd):
+        """
+        Arguments:
+            tvd (num or array): true vertical depth, m
+
+        Returns:
+            fluid density at each depth, sg
+        """
+
+        return self.densities[self.index(tvd)]
+
+    def pressure(self, tvd):
+        """
+        Arguments:
+            tvd (num or array): true vertical depth, m
+
+        Returns:
+            hydrostatic pressure at each depth, Pa
+        """
+
+        tvd = np.asarray(tvd, dtype=float)
+        idx = self.index(tvd)
+        return self.pressures[idx] + self.gradients[idx] * (tvd - self.tops[idx])
+
+    def __eq__(self, other):
+        return isinstance(other, FluidColumn) and self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __repr__(self):
+        return 'FluidColumn(tvd_fluid={}, rho_fluid={})'.format(list(self._key[0]), list(self._key[1]))
+
+
+def fluid_column(tvd_fluid, rho_fluid):
+    """
+    Get the fluid column for some fluids. Columns are built once and shared, e.g. by the buoyancy, drag and
+    hydrostatic pressure of all the load cases with the same fluids.
+
+    Arguments:
+        tvd_fluid (list or FluidColumn): reference tvd of fluid change, m, or a column already built
+        rho_fluid (list or None): fluid densities, sg. Not used for a column
+
+    Returns:
+        FluidColumn
+    """
+
+    if isinstance(tvd_fluid, FluidColumn):
+        return tvd_fluid
+
+    return _column(tuple(float(x) for x in tvd_fluid), tuple(float(x) for x in rho_fluid))
+
+
+@lru_cache(maxsize=256)
+def _column(tvd_fluid, rho_fluid):
+    return FluidColumn(tvd_fluid, rho_fluid)
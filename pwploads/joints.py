@@ -0,0 +1,89 @@
+import numpy as np
+from .envelope import compute_safety_profiles, SF_TYPES
+
+
+def joint_edges(md, joint_length=12.0):
+    """
+    Get the depths of the casing joint ends, from the first station down to the last one.
+
+    Arguments:
+        md (list or array): increasing measured depth of every station, m
+        joint_length (num): joint length, m
+
+    Returns:
+        array with the top of every joint and the bottom of the last one, m
+    """
+
+    if joint_length <= 0:
+        raise ValueError('joint_length must be positive')
+
+    md = np.asarray(md, dtype=float)
+    edges = md[0] + np.arange(np.ceil((md[-1] - md[0]) / joint_length) + 1) * joint_length
+    edges[-1] = md[-1]
+    return edges if len(edges) > 1 else np.array([md[0], md[-1]])
+
+
+def aggregate_joints(csg, joint_length=12.0):
+    """
+    Reduce the loads of every case to the worst value in each casing joint and check the connection at the top of
+    every joint against the connection limits (see get_conn_limits). The joint ends are added to the stations, the
+    loads there are interpolated.
+
+    Arguments:
+        csg: casing obj with loads run
+        joint_length (num): joint length, m
+
+    Returns:
+        dict with:
+            'cases' (load descriptions)
+            'top', 'bottom' (measured depth of each joint, m)
+            'maxTension', 'maxCompression' (case x joint axial force, lbf, NaN if the joint has no load of that type)
+            'maxBurst', 'maxCollapse' (case x joint pressure difference, psi, NaN if no load of that type)
+            'safetyFactors' (case x joint minimum SF for each type in SF_TYPES and 'connection')
+            'connections' (dict with 'md', 'axialForce' (case x connection, lbf), 'safetyFactor' and 'passed')
+    """
+
+    md = np.asarray(csg.trajectory.md, dtype=float)
+    edges = joint_edges(md, joint_length)
+    depths = np.union1d(md, edges)
+    starts = np.searchsorted(depths, edges)        # joint k covers depths[starts[k]:starts[k + 1] + 1]
+
+    loads = [{'description': load['description'],
+              'axialForce': np.interp(depths, md, np.asarray(load['axialForce'], dtype=float)),
+              'diffPressure': np.interp(depths, md, np.asarray(load['diffPressure'], dtype=float))}
+             for load in csg.loads]
+    axial_force = np.array([load['axialForce'] for load in loads]).reshape(len(loads), len(depths))
+    diff_pressure = np.array([load['diffPressure'] for load in loads]).reshape(len(loads), len(depths))
+    profiles = compute_safety_profiles(csg, loads)
+
+    result = {'cases': profiles['cases'], 'top': edges[:-1], 'bottom': edges[1:],
+              'maxTension': _worst(np.maximum, axial_force, starts),
+              'maxCompression': _worst(np.minimum, axial_force, starts),
+              'maxBurst': _worst(np.maximum, diff_pressure, starts),
+              'maxCollapse': _worst(np.minimum, diff_pressure, starts),
+              'safetyFactors': {sf_type: _reduce(np.minimum, profiles[sf_type].reshape(axial_force.shape), starts)
+                                for sf_type in SF_TYPES + ('connection',)}}
+
+    # one connection at the top of each joint
+    conn_force = axial_force[:, starts[:-1]]
+    with np.errstate(divide='ignore'):
+        conn_sf = np.where(conn_force > 0, csg.conn_limits[1] / conn_force,
+                           np.where(conn_force < 0, csg.conn_limits[0] / conn_force, np.inf))
+    result['connections'] = {'md': edges[:-1], 'axialForce': conn_force, 'safetyFactor': conn_sf,
+                             'passed': conn_sf >= 1}
+
+    return result
+
+
+def _reduce(ufunc, values, starts):
+    # reduce every joint including both ends
+    if values.shape[0] == 0:
+        return np.empty((0, len(starts) - 1))
+    return ufunc(ufunc.reduceat(values, starts[:-1], axis=1), values[:, starts[1:]])
+
+
+def _worst(ufunc, values, starts):
+    # worst value of each joint, NaN if the joint has no load in that direction
+    worst = _reduce(ufunc, values, starts)
+    loaded = worst > 0 if ufunc is np.maximum else worst < 0
+    return np.where(loaded, worst, np.nan)
@@ -2,7 +2,7 @@ from . import axial, burst, collapse
 
 
 def running(trajectory, nominal_weight, od_csg, id_csg, shoe_depth, tvd_fluid, rho_fluid, v_avg, e,
-            fric=0.24, a=1.5):
+            fric=0.24, a=1.5, f_d=None, f_be=None, f_bu=None):
     """
     Load case: Running in hole
     :param trajectory: wellpath object
@@ -16,11 +16,14 @@ def running(trajectory, nominal_weight, od_csg, id_csg, shoe_depth, tvd_fluid, r
     :param e: pipe Young's modulus, bar
     :param fric: sliding friction factor pipe - wellbore
     :param a: ratio of maximum running speed to average running speed
+    :param f_d: drag force profile, kN. It is calculated if None
+    :param f_be: bending force profile, kN. It is calculated if None
+    :param f_bu: buoyancy force profile, kN. It is calculated if None
     :return: total axial force profile [kN] and pressure difference [psi]
     """
 
     axial_force = axial.running(trajectory, nominal_weight, od_csg, id_csg, shoe_depth, tvd_fluid, rho_fluid, v_avg,
-                                e, fric, a)
+                                e, fric, a, f_d, f_be, f_bu)
 
     pressure_differential = [0] * len(axial_force)
 
@@ -28,7 +31,7 @@ def running(trajectory, nominal_weight, od_csg, id_csg, shoe_depth, tvd_fluid, r
 
 
 def overpull(trajectory, nominal_weight, od_csg, id_csg, shoe_depth, tvd_fluid, rho_fluid, v_avg, e,
-             fric=0.24, a=1.5, f_ov=0):
+             fric=0.24, a=1.5, f_ov=0, f_d=None, f_be=None, f_bu=None):
     """
     Load case: Overpull
     :param trajectory: wellpath object
@@ -43,11 +46,14 @@ def overpull(trajectory, nominal_weight, od_csg, id_csg, shoe_depth, tvd_fluid,
     :param fric: sliding friction factor pipe - wellbore
     :param a: ratio of maximum running speed to average running speed
     :param f_ov: overpull force (often during freeing of stuck pipe), kN.
+    :param f_d: drag force profile, kN. It is calculated if None
+    :param f_be: bending force profile, kN. It is calculated if None
+    :param f_bu: buoyancy force profile, kN. It is calculated if None
     :return: total axial force profile [kN] and pressure difference [psi]
     """
 
     axial_force = axial.pulling(trajectory, nominal_weight, od_csg, id_csg, shoe_depth, tvd_fluid, rho_fluid, v_avg,
-                                e, fric, a, f_ov)
+                                e, fric, a, f_ov, f_d, f_be, f_bu)
 
     pressure_differential = [0] * len(axial_force)
 
@@ -55,7 +61,7 @@ def overpull(trajectory, nominal_weight, od_csg, id_csg, shoe_depth, tvd_fluid,
 
 
 def green_cement_pressure_test(trajectory, nominal_weight, od_csg, id_csg, rho_cement, rho_fluid_int, p_test, e, f_h,
-                               f_pre=0):
+                               f_pre=0, f_be=None):
     """
     Load case: Green Cement
     :param trajectory: wellpath object
@@ -68,18 +74,19 @@ def green_cement_pressure_test(trajectory, nominal_weight, od_csg, id_csg, rho_c
     :param e: pipe Young's modulus, bar
     :param f_h: pressure testing force, kN
     :param f_pre: pre-loading force applied to the casing string if necessary, kN
+    :param f_be: bending force profile, kN. It is calculated if None
     :return: total axial force profile [kN] and pressure difference [psi]
     """
 
     axial_force = axial.green_cement(trajectory, nominal_weight, od_csg, id_csg, rho_cement, rho_fluid_int, e, f_pre,
-                                     f_h)
+                                     f_h, f_be)
 
     pressure_differential = burst.pressure_test_onefluid(trajectory.tvd, p_test, rho_fluid_int, rho_cement)
 
     return axial_force, pressure_differential
 
 
-def cementing(trajectory, nominal_weight, od_csg, id_csg, rho_cement, rho_fluid, e, f_pre=0):
+def cementing(trajectory, nominal_weight, od_csg, id_csg, rho_cement, rho_fluid, e, f_pre=0, f_be=None):
     """
     Load case: Cementing
     :param trajectory: wellpath object
@@ -90,17 +97,18 @@ def cementing(trajectory, nominal_weight, od_csg, id_csg, rho_cement, rho_fluid,
     :param rho_fluid: displacement fluid density, sg
     :param e: pipe Young's modulus, bar
     :param f_pre: pre-loading force applied to the casing string if necessary, kN
+    :param f_be: bending force profile, kN. It is calculated if None
     :return: total axial force profile [kN] and pressure difference [psi]
     """
 
-    axial_force = axial.cementation(trajectory, nominal_weight, od_csg, id_csg, rho_cement, rho_fluid, e, f_pre)
+    axial_force = axial.cementation(trajectory, nominal_weight, od_csg, id_csg, rho_cement, rho_fluid, e, f_pre, f_be)
 
     pressure_differential = collapse.plug_cementation_onefluid_behindcasing(trajectory.tvd, rho_fluid, rho_cement)
 
     return axial_force, pressure_differential
 
 
-def gas_filled(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_gas, p_res, tvd_res, e):
+def gas_filled(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_gas, p_res, tvd_res, e, f_be=None):
     """
     Load case: Displacement to gas
     :param trajectory: wellpath object
@@ -112,17 +120,19 @@ def gas_filled(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_gas, p_r
     :param p_res: reservoir pressure, bar
     :param tvd_res: tvd at reservoir, m
     :param e: pipe Young's modulus, bar
+    :param f_be: bending force profile, kN. It is calculated if None
     :return: total axial force profile [kN] and pressure difference [psi]
     """
 
-    axial_force = axial.fluid_filled(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_gas, e)
+    axial_force = axial.fluid_filled(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_gas, e, f_be)
 
     pressure_differential = burst.gas_filled(trajectory.tvd, p_res, rho_gas, tvd_res, rho_mud)
 
     return axial_force, pressure_differential
 
 
-def gas_kick(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_gas, p_res, tvd_res, e, vol_kick_initial):
+def gas_kick(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_gas, p_res, tvd_res, e, vol_kick_initial,
+             f_be=None):
     """
     Load case: Displacement to gas
     :param trajectory: wellpath object
@@ -135,10 +145,11 @@ def gas_kick(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_gas, p_res
     :param tvd_res: tvd at reservoir, m
     :param e: pipe Young's modulus, bar
     :param vol_kick_initial: influx initial volume, m3
+    :param f_be: bending force profile, kN. It is calculated if None
     :return: total axial force profile [kN] and pressure difference [psi]
     """
 
-    axial_force = axial.fluid_filled(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_gas, e)
+    axial_force = axial.fluid_filled(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_gas, e, f_be)
 
     od_dp = 5
     pressure_differential = burst.drilling_influx_3(trajectory.tvd, rho_mud, id_csg, od_dp, p_res, tvd_res,
@@ -148,10 +159,10 @@ def gas_kick(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_gas, p_res
 
 
 def production_with_packer(trajectory, md_toc, od_csg, id_csg, rho_fluid_int, rho_fluid_ext, e, p_res, tvd_perf,
-                           rho_packerfluid, tvd_packer, poisson=0.3, f_setting=0):
+                           rho_packerfluid, tvd_packer, poisson=0.3, f_setting=0, f_be=None):
 
     axial_force = axial.production(trajectory, md_toc, od_csg, id_csg, rho_fluid_int, rho_fluid_ext, e, poisson,
-                                   f_setting)
+                                   f_setting, f_be)
 
     pressure_differential = burst.production_with_packer(trajectory.tvd, rho_fluid_int, rho_fluid_ext, p_res, tvd_perf,
                                                          rho_packerfluid, tvd_packer)
@@ -160,10 +171,10 @@ def production_with_packer(trajectory, md_toc, od_csg, id_csg, rho_fluid_int, rh
 
 
 def production_evacuation(trajectory, od_csg, id_csg, md_toc, rho_fluid_int, rho_mud, e, poisson=0.3,
-                          f_setting=0):
+                          f_setting=0, f_be=None):
 
     axial_force = axial.production(trajectory, md_toc, od_csg, id_csg, rho_fluid_int, rho_mud, e, poisson,
-                                   f_setting)
+                                   f_setting, f_be)
 
     pressure_differential = collapse.production_fullevacuation(trajectory.tvd, rho_mud)
 
@@ -171,10 +182,10 @@ def production_evacuation(trajectory, od_csg, id_csg, md_toc, rho_fluid_int, rho
 
 
 def stimulation(trajectory, md_toc, od_csg, id_csg, e, whp, rho_injectionfluid, rho_mud, rho_packerfluid, temp, t_k,
-                alpha=17e-6, poisson=0.3, f_setting=0):
+                alpha=17e-6, poisson=0.3, f_setting=0, f_be=None):
 
     axial_force = axial.injection(trajectory, md_toc, od_csg, id_csg, rho_injectionfluid, rho_mud, e, t_k, temp, alpha,
-                                  poisson, f_setting)
+                                  poisson, f_setting, f_be)
 
     pressure_differential = burst.stimulation(trajectory.tvd, whp, rho_injectionfluid, rho_mud, rho_packerfluid,
                                               tvd_packer=0)
@@ -311,16 +322,16 @@ def injection_evacuation(tvd, tvd_perf, rho_inj, p_inj, tvd_influencedzone, rho_
     return axial_force, pressure_differential
 
 
-def pressure_test(trajectory, whp, od_csg, e, effective_diameter, rho_testing_fluid, rho_mud):
+def pressure_test(trajectory, whp, od_csg, e, effective_diameter, rho_testing_fluid, rho_mud, f_be=None):
 
-    axial_force = axial.pressure_test(trajectory, whp, effective_diameter, od_csg, e)
+    axial_force = axial.pressure_test(trajectory, whp, effective_diameter, od_csg, e, f_be)
 
     pressure_differential = burst.pressure_test_onefluid(trajectory.tvd, whp, rho_testing_fluid, rho_mud)
 
     return axial_force, pressure_differential
 
 
-def mud_drop(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_mud_new, e):
+def mud_drop(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_mud_new, e, f_be=None):
     """
     Load case: Displacement to gas
     :param trajectory: wellpath object
@@ -330,10 +341,11 @@ def mud_drop(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_mud_new, e
     :param rho_mud: mud density, sg
     :param rho_mud_new: new mud density, sg
     :param e: pipe Young's modulus, bar
+    :param f_be: bending force profile, kN. It is calculated if None
     :return: total axial force profile [kN] and pressure difference [psi]
     """
 
-    axial_force = axial.fluid_filled(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_mud_new, e)
+    axial_force = axial.fluid_filled(trajectory, nominal_weight, od_csg, id_csg, rho_mud, rho_mud_new, e, f_be)
 
     pressure_differential = collapse.fluid_filled(trajectory.tvd, rho_mud_new, rho_mud)
 
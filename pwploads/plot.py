@@ -1,31 +1,101 @@
 import plotly.graph_objects as go
-from numpy import array, interp
+from .registry import case_names
+from .envelope import compute_safety_profiles
+from numpy import array, asarray, minimum, concatenate, unique, arange, argmin, argmax, pad, nan
 
+plot_settings = {'maxPoints': 20000,     # point budget per figure, load profiles above it are decimated
+                 'envelopePoints': 300}  # triaxial envelope points on each side of zero axial force
 
-def vme_plot(csg):
-    fig = go.Figure()
+_template = None
+_colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22',
+           '#17becf', '#393b79']
+
+
+def decimate(*arrays, budget=None, keep=None):
+    """
+    Select the points to plot from one or more profiles of the same length using min/max bucketing, so peaks
+    survive the decimation.
+    :param arrays: profiles sharing the same stations
+    :param budget: maximum number of points, default plot_settings['maxPoints']
+    :param keep: list - station indexes that must be kept (e.g. governing points)
+    :return: array of sorted station indexes
+    """
+
+    if budget is None:
+        budget = plot_settings['maxPoints']
+
+    points = len(arrays[0])
+    if points <= budget:
+        return arange(points)
+
+    per_bucket = 2 * len(arrays)
+    size = -(-points * per_bucket // max(budget - 2, per_bucket))       # stations per bucket
+    buckets = -(-points // size)
+    offsets = arange(buckets) * size
+
+    selected = [array([0, points - 1])]
+    for values in arrays:
+        values = pad(asarray(values, dtype=float), (0, buckets * size - points), mode='edge').reshape(buckets, size)
+        selected += [offsets + argmin(values, axis=1), offsets + argmax(values, axis=1)]
+    if keep is not None:
+        selected.append(asarray(keep, dtype=int))
+
+    return unique(minimum(concatenate(selected), points - 1))
+
+
+def _budget(csg):
+    return plot_settings['maxPoints'] // max(len(csg.loads), 1)
+
+
+def vme_traces(csg, webgl=False, showlegend=True):
+    """
+    Build the VME plot traces (triaxial ellipse, API limits, connection limits and loads) from numpy arrays.
+    :param csg: casing obj
+    :param webgl: True to use Scattergl traces
+    :param showlegend: False to hide the legend entries, e.g. for repeated subplots
+    :return: list of traces
+    """
+
+    scatter = go.Scattergl if webgl else go.Scatter
+    traces = []
 
     # Plotting VME
-    triaxial_x = csg.ellipse[0] + csg.ellipse[0][::-1]
-    triaxial_y = csg.ellipse[1] + csg.ellipse[2][::-1]
-    fig.add_trace(go.Scatter(x=triaxial_x, y=triaxial_y, line={'color': 'red', 'dash': 'dash'},
-                             name='Triaxial ' + str(csg.design_factor['vme'])))
+    ellipse = csg.vme_envelope.sample(plot_settings['envelopePoints'])
+    axial = asarray(ellipse[0], dtype=float)
+    triaxial_x = concatenate((axial, axial[::-1]))
+    triaxial_y = concatenate((asarray(ellipse[1], dtype=float), asarray(ellipse[2], dtype=float)[::-1]))
+    traces.append(scatter(x=triaxial_x, y=triaxial_y, line={'color': 'red', 'dash': 'dash'},
+                          name='Triaxial ' + str(csg.design_factor['vme']), legendgroup='Triaxial',
+                          showlegend=showlegend))
 
     # Plotting API limits
-    fig.add_trace(go.Scatter(x=array(csg.api_lines[0]) / 1000, y=array(csg.api_lines[1]) / 1000,
-                             line={'color': 'black'}, name='API'))
+    api_lines = csg.api_envelope.sample(plot_settings['envelopePoints'] // 15)[0]
+    traces.append(scatter(x=asarray(api_lines[0], dtype=float) / 1000,
+                          y=asarray(api_lines[1], dtype=float) / 1000,
+                          line={'color': 'black'}, name='API', legendgroup='API', showlegend=showlegend))
 
     # Plotting connections limits
-    fig.add_trace(go.Scatter(x=[csg.conn_limits[0] / 1000] * 2 + [None] + [csg.conn_limits[1] / 1000] * 2,
-                             y=[csg.limits['collapseDF'] / 1000, csg.limits['burstDF'] / 1000] + [None] +
-                               [csg.limits['burstDF'] / 1000,
-                                interp(csg.conn_limits[1], csg.collapse_curve[0], csg.collapse_curve[1]) / 1000],
-                             line={'color': 'gray', 'dash': 'dash'}, name='Connection', mode='lines'))
+    conn_collapse = csg.api_envelope.collapse(csg.conn_limits[1])
+    traces.append(scatter(x=array([csg.conn_limits[0]] * 2 + [nan] + [csg.conn_limits[1]] * 2) / 1000,
+                          y=array([csg.limits['collapseDF'], csg.limits['burstDF'], nan,
+                                   csg.limits['burstDF'], conn_collapse]) / 1000,
+                          line={'color': 'gray', 'dash': 'dash'}, name='Connection', mode='lines',
+                          legendgroup='Connection', showlegend=showlegend))
 
     # Plotting Loads
     for load in csg.loads:
-        fig.add_trace(go.Scatter(x=array(load['axialForce']) / 1000, y=array(load['diffPressure']) / 1000,
-                                 name=load['description']))
+        axial_force = asarray(load['axialForce'], dtype=float)
+        pressure = asarray(load['diffPressure'], dtype=float)
+        idx = decimate(axial_force, pressure, budget=_budget(csg))
+        traces.append(scatter(x=axial_force[idx] / 1000, y=pressure[idx] / 1000, name=load['description'],
+                              legendgroup=load['description'], showlegend=showlegend,
+                              line={'color': _case_color(load['description'])}))
+
+    return traces
+
+
+def vme_plot(csg, webgl=False):
+    fig = go.Figure(data=vme_traces(csg, webgl))
 
     fig.update_layout(
         xaxis_title='Axial Force, kips',
@@ -34,18 +104,77 @@ def vme_plot(csg):
     return fig
 
 
+def dashboard_plot(casings, cols=3, titles=None):
+    """
+    Plot the VME diagram of many casings in one figure, one subplot per casing, using WebGL traces.
+    :param casings: list - casing objects
+    :param cols: number of subplot columns
+    :param titles: list - subplot titles, default 'Casing 1', 'Casing 2', ...
+    :return: plotly figure
+    """
+
+    from plotly.subplots import make_subplots
+
+    cols = min(cols, len(casings))
+    rows = -(-len(casings) // cols)
+    if titles is None:
+        titles = ['Casing {}'.format(x + 1) for x in range(len(casings))]
+
+    fig = make_subplots(rows=rows, cols=cols, subplot_titles=titles)
+
+    traces, trace_rows, trace_cols = [], [], []
+    for idx, csg in enumerate(casings):
+        csg_traces = vme_traces(csg, webgl=True, showlegend=idx == 0)
+        traces += csg_traces
+        trace_rows += [idx // cols + 1] * len(csg_traces)
+        trace_cols += [idx % cols + 1] * len(csg_traces)
+    fig.add_traces(traces, rows=trace_rows, cols=trace_cols)
+
+    fig.update_layout(template=dashboard_template(), height=350 * rows)
+    fig.update_xaxes(title_text='Axial Force, kips', row=rows)
+    fig.update_yaxes(title_text='Pressure Difference, ksi', col=1)
+
+    return fig
+
+
+def dashboard_template():
+    """
+    Get the layout template shared by the dashboard figures (built once).
+    :return: plotly template
+    """
+
+    global _template
+    if _template is None:
+        _template = go.layout.Template(layout={'font': {'size': 10},
+                                               'margin': {'l': 50, 'r': 20, 't': 40, 'b': 40},
+                                               'legend': {'orientation': 'h', 'y': -0.1},
+                                               'hovermode': 'closest'})
+    return _template
+
+
+def _case_color(description):
+    cases = case_names()
+    if description in cases:
+        return _colors[cases.index(description) % len(_colors)]
+    return None
+
+
 def pressure_plot(csg):
     fig = go.Figure()
+    tvd = asarray(csg.trajectory.tvd, dtype=float)
+    depth_range = [tvd[0], tvd[-1]]
 
     # Plotting Loads
     for load in csg.loads:
-        fig.add_trace(go.Scatter(x=array(load['diffPressure']) / 1000, y=csg.trajectory.tvd,
+        pressure = asarray(load['diffPressure'], dtype=float)
+        idx = decimate(pressure, budget=_budget(csg))
+        fig.add_trace(go.Scatter(x=pressure[idx] / 1000, y=tvd[idx],
                                  name=load['description']))
 
     # Add Burst and Collapse limits
-    fig.add_trace(go.Scatter(x=[csg.limits['burstDF']/1000]*len(csg.trajectory.tvd), y=csg.trajectory.tvd,
+    fig.add_trace(go.Scatter(x=[csg.limits['burstDF']/1000]*2, y=depth_range,
                              name='Burst limit ' + str(csg.design_factor['api']['burst'])))
-    fig.add_trace(go.Scatter(x=[csg.limits['collapseDF']/1000]*len(csg.trajectory.tvd), y=csg.trajectory.tvd,
+    fig.add_trace(go.Scatter(x=[csg.limits['collapseDF']/1000]*2, y=depth_range,
                              name='Collapse limit ' + str(csg.design_factor['api']['collapse'])))
 
     fig.update_layout(
@@ -57,26 +186,27 @@ def pressure_plot(csg):
     return fig
 
 
+def _sf_traces(fig, csg, sf_type, max_limit):
+    profiles = compute_safety_profiles(csg)
+    tvd = profiles['tvd']
+    for description, sf in zip(profiles['cases'], minimum(profiles[sf_type], max_limit)):
+        idx = decimate(sf, budget=_budget(csg), keep=[argmin(sf)])
+        fig.add_trace(go.Scatter(x=sf[idx],
+                                 y=tvd[idx],
+                                 name=description))
+
+    return [tvd[0], tvd[-1]]
+
+
 def burst_plot(csg, max_limit=10):
     fig = go.Figure()
 
     # Plotting Loads
-    for load in csg.loads:
-        sf = []
-        for x in load['diffPressure']:
-            if x > 0:
-                sf.append(csg.limits['burst']/x)
-                if sf[-1] > max_limit:
-                    sf[-1] = max_limit
-            else:
-                sf.append(max_limit)
-        fig.add_trace(go.Scatter(x=sf,
-                                 y=csg.trajectory.tvd,
-                                 name=load['description']))
+    depth_range = _sf_traces(fig, csg, 'burst', max_limit)
 
     # Add Burst SF Limit
-    fig.add_trace(go.Scatter(x=[csg.limits['burst']/csg.limits['burstDF']] * len(csg.trajectory.tvd),
-                             y=csg.trajectory.tvd,
+    fig.add_trace(go.Scatter(x=[csg.limits['burst']/csg.limits['burstDF']] * 2,
+                             y=depth_range,
                              name='Burst SF ' + str(csg.design_factor['api']['burst'])))
 
     fig.update_layout(
@@ -92,22 +222,11 @@ def collapse_plot(csg, max_limit=10):
     fig = go.Figure()
 
     # Plotting Loads
-    for load in csg.loads:
-        sf = []
-        for x in load['diffPressure']:
-            if x < 0:
-                sf.append(csg.limits['collapse']/x)
-                if sf[-1] > max_limit:
-                    sf[-1] = max_limit
-            else:
-                sf.append(max_limit)
-        fig.add_trace(go.Scatter(x=sf,
-                                 y=csg.trajectory.tvd,
-                                 name=load['description']))
+    depth_range = _sf_traces(fig, csg, 'collapse', max_limit)
 
     # Add Collapse SF Limit
-    fig.add_trace(go.Scatter(x=[csg.limits['collapse']/csg.limits['collapseDF']] * len(csg.trajectory.tvd),
-                             y=csg.trajectory.tvd,
+    fig.add_trace(go.Scatter(x=[csg.limits['collapse']/csg.limits['collapseDF']] * 2,
+                             y=depth_range,
                              name='Collapse SF ' + str(csg.design_factor['api']['collapse'])))
 
     fig.update_layout(
@@ -123,22 +242,11 @@ def axial_plot(csg, max_limit=50):
     fig = go.Figure()
 
     # Plotting Loads
-    for load in csg.loads:
-        sf = []
-        for x in load['axialForce']:
-            if x > 0:
-                sf.append(csg.limits['tension']/x)
-                if sf[-1] > max_limit:
-                    sf[-1] = max_limit
-            else:
-                sf.append(max_limit)
-        fig.add_trace(go.Scatter(x=sf,
-                                 y=csg.trajectory.tvd,
-                                 name=load['description']))
+    depth_range = _sf_traces(fig, csg, 'tension', max_limit)
 
     # Add Burst SF Limit
-    fig.add_trace(go.Scatter(x=[csg.limits['tension']/csg.limits['tensionDF']] * len(csg.trajectory.tvd),
-                             y=csg.trajectory.tvd,
+    fig.add_trace(go.Scatter(x=[csg.limits['tension']/csg.limits['tensionDF']] * 2,
+                             y=depth_range,
                              name='Axial SF ' + str(csg.design_factor['api']['tension'])))
 
     fig.update_layout(
@@ -1,7 +1,14 @@
+from numpy import asarray
 from .unit_converter import convert_unit
+from .units import FORCE, PRESSURE
+from .profiles import Profile
+from .utilities import define_max_loads, define_min_df, check_load
 
+SCREEN_ORDER = ['Full Evacuation', 'Displacement to gas', 'Gas kick', 'Pressure Test', 'Production', 'Injection',
+                'Mud Drop', 'Cementing', 'Green Cement Pressure Test', 'Running', 'Overpull']
 
-def gen_running(csg, tvd_fluid=None, rho_fluid=None, v_avg=0.3, fric=0.24, a=1.5):
+
+def gen_running(csg, tvd_fluid=None, rho_fluid=None, v_avg=0.3, fric=0.24, a=1.5, nodes=None):
     """
     Run load case: Running in hole
 
@@ -12,6 +19,7 @@ def gen_running(csg, tvd_fluid=None, rho_fluid=None, v_avg=0.3, fric=0.24, a=1.5
         v_avg (num): average running speed, m/s
         fric (num): sliding friction factor pipe - wellbore
         a (num): ratio of maximum running speed to average running speed
+        nodes (dict or None): shared profiles calculated by the scheduler, see registry.run_cases
 
     Returns:
         None. It adds the load case results in loads as [load case name, axial_force, pressure_differential]
@@ -24,18 +32,17 @@ def gen_running(csg, tvd_fluid=None, rho_fluid=None, v_avg=0.3, fric=0.24, a=1.5
     if rho_fluid is None:
         rho_fluid = [1.2]
 
-    e = convert_unit(csg.e, unit_from='psi', unit_to='bar')
+    e = _young_modulus(csg, nodes)
 
     axial_force, pressure_differential = running(csg.trajectory, csg.nominal_weight, csg.od, csg.id,
-                                                 csg.shoe, tvd_fluid, rho_fluid, v_avg, e, fric, a)
-
-    axial_force = [x * 1000 / 4.448 for x in axial_force]  # kN to lbf
+                                                 csg.shoe, tvd_fluid, rho_fluid, v_avg, e, fric, a,
+                                                 _node(nodes, 'drag', 'lowering'), _node(nodes, 'bending'),
+                                                 _node(nodes, 'buoyancy'))
 
-    csg.loads.append({'description': 'Running', 'axialForce': axial_force,
-                      'diffPressure': pressure_differential})
+    _append_load(csg, 'Running', axial_force, pressure_differential, pressure_unit='psi')
 
 
-def gen_overpull(csg, tvd_fluid=None, rho_fluid=None, v_avg=0.3, fric=0.24, a=1.5, f_ov=0.0):
+def gen_overpull(csg, tvd_fluid=None, rho_fluid=None, v_avg=0.3, fric=0.24, a=1.5, f_ov=0.0, nodes=None):
     """
     Run load case: Overpull
 
@@ -47,6 +54,7 @@ def gen_overpull(csg, tvd_fluid=None, rho_fluid=None, v_avg=0.3, fric=0.24, a=1.
         fric (num): sliding friction factor pipe - wellbore
         a (num): ratio of maximum running speed to average running speed
         f_ov (int or num): overpull force (often during freeing of stuck pipe), kN.
+        nodes (dict or None): shared profiles calculated by the scheduler, see registry.run_cases
 
     Returns:
         None. It adds the load case results in loads as [load case name, axial_force, pressure_differential]
@@ -59,18 +67,17 @@ def gen_overpull(csg, tvd_fluid=None, rho_fluid=None, v_avg=0.3, fric=0.24, a=1.
     if rho_fluid is None:
         rho_fluid = [1.2]
 
-    e = convert_unit(csg.e, unit_from='psi', unit_to='bar')
+    e = _young_modulus(csg, nodes)
 
     axial_force, pressure_differential = overpull(csg.trajectory, csg.nominal_weight, csg.od, csg.id,
-                                                  csg.shoe, tvd_fluid, rho_fluid, v_avg, e, fric, a, f_ov)
-
-    axial_force = [x * 1000 / 4.448 for x in axial_force]  # kN to lbf
+                                                  csg.shoe, tvd_fluid, rho_fluid, v_avg, e, fric, a, f_ov,
+                                                  _node(nodes, 'drag', 'hoisting'), _node(nodes, 'bending'),
+                                                  _node(nodes, 'buoyancy'))
 
-    csg.loads.append({'description': 'Overpull', 'axialForce': axial_force,
-                      'diffPressure': pressure_differential})
+    _append_load(csg, 'Overpull', axial_force, pressure_differential, pressure_unit='psi')
 
 
-def gen_green_cement(csg, rho_fluid_int=1.2, rho_cement=1.8, f_pre=0.0, p_test=0.0):
+def gen_green_cement(csg, rho_fluid_int=1.2, rho_cement=1.8, f_pre=0.0, p_test=0.0, nodes=None):
     """
     Run load case: Green Cement Pressure test
 
@@ -80,6 +87,7 @@ def gen_green_cement(csg, rho_fluid_int=1.2, rho_cement=1.8, f_pre=0.0, p_test=0
         rho_fluid_int (num): inside fluid density, sg
         f_pre (num): pre-loading force applied to the casing string if necessary, kN
         p_test (num): testing pressure, psi
+        nodes (dict or None): shared profiles calculated by the scheduler, see registry.run_cases
 
     Returns:
         None. It adds the load case results in loads as [load case name, axial_force, pressure_differential]
@@ -89,21 +97,17 @@ def gen_green_cement(csg, rho_fluid_int=1.2, rho_cement=1.8, f_pre=0.0, p_test=0
 
     f_test = convert_unit(p_test * csg.area, unit_from="lbf", unit_to="kN")
     p_test = convert_unit(p_test, unit_from="psi", unit_to="bar")
-    e = convert_unit(csg.e, unit_from='psi', unit_to='bar')
+    e = _young_modulus(csg, nodes)
 
     axial_force, pressure_differential = green_cement_pressure_test(csg.trajectory, csg.nominal_weight,
                                                                     csg.od, csg.id, rho_cement, rho_fluid_int,
-                                                                    p_test, e, f_test, f_pre)
-
-    pressure_differential = convert_unit(pressure_differential, unit_from="Pa", unit_to="psi")
+                                                                    p_test, e, f_test, f_pre,
+                                                                    _node(nodes, 'bending'))
 
-    axial_force = [x * 1000 / 4.448 for x in axial_force]  # kN to lbf
-
-    csg.loads.append({'description': 'Green Cement Pressure Test', 'axialForce': axial_force,
-                      'diffPressure': pressure_differential})
+    _append_load(csg, 'Green Cement Pressure Test', axial_force, pressure_differential)
 
 
-def gen_cementing(csg, rho_cement=1.8, rho_fluid=1.3, f_pre=0.0):
+def gen_cementing(csg, rho_cement=1.8, rho_fluid=1.3, f_pre=0.0, nodes=None):
     """
     Run load case: Cementing
 
@@ -112,6 +116,7 @@ def gen_cementing(csg, rho_cement=1.8, rho_fluid=1.3, f_pre=0.0):
         rho_cement (num): cement density, sg
         rho_fluid (num): displacement fluid density, sg
         f_pre (int or num): pre-loading force applied to the casing string if necessary, kN
+        nodes (dict or None): shared profiles calculated by the scheduler, see registry.run_cases
 
     Returns:
         None. It adds the load case results in loads as [load case name, axial_force, pressure_differential]
@@ -119,20 +124,16 @@ def gen_cementing(csg, rho_cement=1.8, rho_fluid=1.3, f_pre=0.0):
 
     from .load_cases import cementing
 
-    e = convert_unit(csg.e, unit_from='psi', unit_to='bar')
+    e = _young_modulus(csg, nodes)
 
     axial_force, pressure_differential = cementing(csg.trajectory, csg.nominal_weight, csg.od, csg.id,
-                                                   rho_cement, rho_fluid, e, f_pre)
+                                                   rho_cement, rho_fluid, e, f_pre,
+                                                   _node(nodes, 'bending'))
 
-    pressure_differential = convert_unit(pressure_differential, unit_from="Pa", unit_to="psi")
+    _append_load(csg, 'Cementing', axial_force, pressure_differential)
 
-    axial_force = [x * 1000 / 4.448 for x in axial_force]  # kN to lbf
 
-    csg.loads.append({'description': 'Cementing', 'axialForce': axial_force,
-                      'diffPressure': pressure_differential})
-
-
-def gen_displacement_gas(csg, p_res, tvd_res, rho_gas=0.5, rho_mud=1.4):
+def gen_displacement_gas(csg, p_res, tvd_res, rho_gas=0.5, rho_mud=1.4, nodes=None):
     """
     Run load case: Displacement to gas
 
@@ -142,6 +143,7 @@ def gen_displacement_gas(csg, p_res, tvd_res, rho_gas=0.5, rho_mud=1.4):
         tvd_res (num): tvd at reservoir, m
         rho_gas (num): gas density, sg
         rho_mud (num): mud density, sg
+        nodes (dict or None): shared profiles calculated by the scheduler, see registry.run_cases
 
     Returns:
         None. It adds the load case results in loads as [load case name, axial_force, pressure_differential]
@@ -150,90 +152,70 @@ def gen_displacement_gas(csg, p_res, tvd_res, rho_gas=0.5, rho_mud=1.4):
     from .load_cases import gas_filled
 
     p_res = convert_unit(p_res, unit_from='psi', unit_to='bar')
-    e = convert_unit(csg.e, unit_from='psi', unit_to='bar')
+    e = _young_modulus(csg, nodes)
 
     axial_force, pressure_differential = gas_filled(csg.trajectory, csg.nominal_weight, csg.od, csg.id,
-                                                    rho_mud, rho_gas, p_res, tvd_res, e)
-
-    pressure_differential = convert_unit(pressure_differential, unit_from="Pa", unit_to="psi")
+                                                    rho_mud, rho_gas, p_res, tvd_res, e,
+                                                    _node(nodes, 'bending'))
 
-    axial_force = [x * 1000 / 4.448 for x in axial_force]  # kN to lbf
-
-    csg.loads.append({'description': 'Displacement to gas', 'axialForce': axial_force,
-                      'diffPressure': pressure_differential})
+    _append_load(csg, 'Displacement to gas', axial_force, pressure_differential)
 
 
 def gen_production(csg, p_res, rho_prod_fluid, rho_ann_fluid, rho_packerfluid, md_toc, tvd_packer, tvd_perf,
-                   poisson=0.3, f_setting=0.0):
+                   poisson=0.3, f_setting=0.0, nodes=None):
     from .load_cases import production_with_packer
 
     p_res = convert_unit(p_res, unit_from='psi', unit_to='bar')
-    e = convert_unit(csg.e, unit_from='psi', unit_to='bar')
+    e = _young_modulus(csg, nodes)
 
     axial_force, pressure_differential = production_with_packer(csg.trajectory, md_toc, csg.od, csg.id,
                                                                 rho_prod_fluid, rho_ann_fluid, e, p_res, tvd_perf,
-                                                                rho_packerfluid, tvd_packer, poisson, f_setting)
+                                                                rho_packerfluid, tvd_packer, poisson, f_setting,
+                                                                _node(nodes, 'bending'))
 
-    pressure_differential = convert_unit(pressure_differential, unit_from="Pa", unit_to="psi")
+    _append_load(csg, 'Production', axial_force, pressure_differential)
 
-    axial_force = [x * 1000 / 4.448 for x in axial_force]  # kN to lbf
-
-    csg.loads.append({'description': 'Production', 'axialForce': axial_force,
-                      'diffPressure': pressure_differential})
 
-
-def gen_injection(csg, whp, rho_injectionfluid, rho_mud, temp, t_k, alpha=17e-6, poisson=0.3, f_setting=0):
+def gen_injection(csg, whp, rho_injectionfluid, rho_mud, temp, t_k, alpha=17e-6, poisson=0.3, f_setting=0,
+                  nodes=None):
     from .load_cases import stimulation
 
     whp = convert_unit(whp, unit_from='psi', unit_to='bar')
-    e = convert_unit(csg.e, unit_from='psi', unit_to='bar')
+    e = _young_modulus(csg, nodes)
 
     axial_force, pressure_differential = stimulation(csg.trajectory, csg.toc_md, csg.od, csg.id, e,
                                                      whp, rho_injectionfluid, rho_mud, rho_mud, temp, t_k,
-                                                     alpha=alpha, poisson=poisson, f_setting=f_setting)
-
-    pressure_differential = convert_unit(pressure_differential, unit_from="Pa", unit_to="psi")
+                                                     alpha=alpha, poisson=poisson, f_setting=f_setting,
+                                                     f_be=_node(nodes, 'bending'))
 
-    axial_force = [x * 1000 / 4.448 for x in axial_force]  # kN to lbf
-
-    csg.loads.append({'description': 'Injection', 'axialForce': axial_force,
-                      'diffPressure': pressure_differential})
+    _append_load(csg, 'Injection', axial_force, pressure_differential)
 
 
-def gen_full_evacuation(csg, rho_prod_fluid, rho_mud, md_toc, poisson=0.3, f_setting=0.0):
+def gen_full_evacuation(csg, rho_prod_fluid, rho_mud, md_toc, poisson=0.3, f_setting=0.0, nodes=None):
     from .load_cases import production_evacuation
 
-    e = convert_unit(csg.e, unit_from='psi', unit_to='bar')
+    e = _young_modulus(csg, nodes)
 
     axial_force, pressure_differential = production_evacuation(csg.trajectory, csg.od, csg.id, md_toc, rho_prod_fluid,
-                                                               rho_mud, e, poisson, f_setting)
+                                                               rho_mud, e, poisson, f_setting,
+                                                               _node(nodes, 'bending'))
 
-    pressure_differential = convert_unit(pressure_differential, unit_from="Pa", unit_to="psi")
+    _append_load(csg, 'Full Evacuation', axial_force, pressure_differential)
 
-    axial_force = [x * 1000 / 4.448 for x in axial_force]  # kN to lbf
 
-    csg.loads.append({'description': 'Full Evacuation', 'axialForce': axial_force,
-                      'diffPressure': pressure_differential})
-
-
-def gen_pressure_test(csg, whp, effective_diameter, rho_testing_fluid, rho_mud):
+def gen_pressure_test(csg, whp, effective_diameter, rho_testing_fluid, rho_mud, nodes=None):
     from .load_cases import pressure_test
 
     whp = convert_unit(whp, unit_from='psi', unit_to='bar')
-    e = convert_unit(csg.e, unit_from='psi', unit_to='bar')
+    e = _young_modulus(csg, nodes)
 
     axial_force, pressure_differential = pressure_test(csg.trajectory, whp, csg.od, e, effective_diameter,
-                                                       rho_testing_fluid, rho_mud)
+                                                       rho_testing_fluid, rho_mud, _node(nodes, 'bending'))
 
-    pressure_differential = convert_unit(pressure_differential, unit_from="Pa", unit_to="psi")
+    _append_load(csg, 'Pressure Test', axial_force, pressure_differential)
 
-    axial_force = [x * 1000 / 4.448 for x in axial_force]  # kN to lbf
 
-    csg.loads.append({'description': 'Pressure Test', 'axialForce': axial_force,
-                      'diffPressure': pressure_differential})
-
-
-def gen_gas_kick(csg, p_res, tvd_res, rho_gas=0.5, rho_mud=1.4, vol_kick_initial=0.05):
+def gen_gas_kick(csg, p_res, tvd_res, rho_gas=0.5, rho_mud=1.4, vol_kick_initial=0.05, nodes=None):
     """
     Run load case: Gas Kick
 
@@ -244,6 +226,7 @@ def gen_gas_kick(csg, p_res, tvd_res, rho_gas=0.5, rho_mud=1.4, vol_kick_initial
         rho_gas (num): gas density, sg
         rho_mud (num): mud density, sg
         vol_kick_initial (num): influx initial volume, m3
+        nodes (dict or None): shared profiles calculated by the scheduler, see registry.run_cases
 
     Returns:
         None. It adds the load case results in loads as [load case name, axial_force, pressure_differential]
@@ -252,20 +235,16 @@ def gen_gas_kick(csg, p_res, tvd_res, rho_gas=0.5, rho_mud=1.4, vol_kick_initial
     from .load_cases import gas_kick
 
     p_res = convert_unit(p_res, unit_from='psi', unit_to='bar')
-    e = convert_unit(csg.e, unit_from='psi', unit_to='bar')
+    e = _young_modulus(csg, nodes)
 
     axial_force, pressure_differential = gas_kick(csg.trajectory, csg.nominal_weight, csg.od, csg.id, rho_mud, rho_gas,
-                                                  p_res, tvd_res, e, vol_kick_initial)
+                                                  p_res, tvd_res, e, vol_kick_initial,
+                                                  _node(nodes, 'bending'))
 
-    pressure_differential = convert_unit(pressure_differential, unit_from="Pa", unit_to="psi")
+    _append_load(csg, 'Gas kick', axial_force, pressure_differential)
 
-    axial_force = [x * 1000 / 4.448 for x in axial_force]  # kN to lbf
-
-    csg.loads.append({'description': 'Gas kick', 'axialForce': axial_force,
-                      'diffPressure': pressure_differential})
 
-
-def gen_mud_drop(csg, rho_mud=1.4, rho_mud_new=1.1):
+def gen_mud_drop(csg, rho_mud=1.4, rho_mud_new=1.1, nodes=None):
     """
     Run load case: Mud Drop
 
@@ -273,6 +252,7 @@ def gen_mud_drop(csg, rho_mud=1.4, rho_mud_new=1.1):
         csg: casing obj
         rho_mud (num): mud density, sg
         rho_mud_new (num): new mud density, sg
+        nodes (dict or None): shared profiles calculated by the scheduler, see registry.run_cases
 
     Returns:
         None. It adds the load case results in loads as [load case name, axial_force, pressure_differential]
@@ -280,14 +260,107 @@ def gen_mud_drop(csg, rho_mud=1.4, rho_mud_new=1.1):
 
     from .load_cases import mud_drop
 
-    e = convert_unit(csg.e, unit_from='psi', unit_to='bar')
+    e = _young_modulus(csg, nodes)
 
     axial_force, pressure_differential = mud_drop(csg.trajectory, csg.nominal_weight, csg.od, csg.id, rho_mud,
-                                                  rho_mud_new, e)
+                                                  rho_mud_new, e, _node(nodes, 'bending'))
+
+    _append_load(csg, 'Mud Drop', axial_force, pressure_differential)
+
 
-    pressure_differential = convert_unit(pressure_differential, unit_from="Pa", unit_to="psi")
+def _append_load(csg, description, axial_force, pressure_differential, pressure_unit='Pa'):
+    """
+    Add a load case result to csg.loads, converting the kernel units in place.
+
+    Arguments:
+        csg: casing obj
+        description (str): load case name
+        axial_force (array): axial force profile, kN. Kernel arrays are converted in place
+        pressure_differential (array or Profile): pressure difference profile, kernel arrays are converted in place.
+                                                  A Profile is kept as it is when csg.adaptive is True
+        pressure_unit (str): unit of pressure_differential, 'Pa' or 'psi'
+    """
+
+    axial_force = asarray(axial_force, dtype=float)
+    axial_force *= FORCE['lbf']         # kN to lbf
 
-    axial_force = [x * 1000 / 4.448 for x in axial_force]  # kN to lbf
+    if getattr(csg, 'adaptive', False) and isinstance(pressure_differential, Profile):
+        pressure_differential = pressure_differential * (PRESSURE['psi'] / PRESSURE[pressure_unit])
+    else:
+        pressure_differential = asarray(pressure_differential, dtype=float)
+        if pressure_unit != 'psi':
+            pressure_differential *= PRESSURE['psi'] / PRESSURE[pressure_unit]
 
-    csg.loads.append({'description': 'Mud Drop', 'axialForce': axial_force,
+    csg.loads.append({'description': description, 'axialForce': axial_force,
                       'diffPressure': pressure_differential})
+
+
+def _young_modulus(csg, nodes):
+    if nodes is not None and 'e' in nodes:
+        return nodes['e']
+    return convert_unit(csg.e, unit_from='psi', unit_to='bar')
+
+
+def _node(nodes, name, key=None):
+    if nodes is None or name not in nodes:
+        return None     # the kernel calculates it
+    if key is not None:
+        return nodes[name][key]
+    return nodes[name]
+
+
+def applicable_cases(csg):
+    """
+    List the load cases that apply to the casing with its current settings and msgs (see registry).
+
+    Arguments:
+        csg: casing obj
+
+    Returns:
+        list of (load case name, gen function, kwargs)
+    """
+
+    from .registry import applicable
+
+    return applicable(csg)
+
+
+def screen_loads(csg):
+    """
+    Check the load cases against the design factors one by one, cheap hydrostatic cases first and drag cases
+    last, stopping at the first failing case. Load profiles are not kept.
+
+    Arguments:
+        csg: casing obj
+
+    Returns:
+        None. It sets csg.screening as {'passed', 'governingCase', 'loadType', 'safetyFactor', 'casesRun'}. If
+        every case passes, the governing case is the one closest to its design factor.
+    """
+
+    cases = sorted(applicable_cases(csg), key=lambda case: SCREEN_ORDER.index(case[0]) if case[0] in SCREEN_ORDER
+                   else len(SCREEN_ORDER))
+    loads = csg.loads
+    screening = {'passed': True, 'governingCase': None, 'loadType': None, 'safetyFactor': None, 'casesRun': 0}
+    margin = None
+
+    try:
+        for description, gen, kwargs in cases:
+            csg.loads = []
+            gen(csg, **kwargs)
+            define_max_loads(csg.loads)
+            define_min_df(csg)
+            screening['casesRun'] += 1
+
+            for load_type, value, ratio in check_load(csg, csg.loads[0]):
+                if margin is None or ratio < margin:
+                    margin = ratio
+                    screening.update({'governingCase': description, 'loadType': load_type,
+                                      'safetyFactor': value})
+            if margin is not None and margin < 1:
+                screening['passed'] = False
+                break
+    finally:
+        csg.loads = loads
+
+    csg.screening = screening
@@ -0,0 +1,272 @@
+import numpy as np
+
+_OPERATORS = {np.add: ('__add__', '__radd__'), np.subtract: ('__sub__', '__rsub__'),
+              np.multiply: ('__mul__', '__rmul__'), np.true_divide: ('__truediv__', None)}
+
+
+class Profile(object):
+    """
+    Lazy profile along the casing stations, kept as a constant, as a line over a reference array (e.g. tvd) or as
+    a piecewise line known at some stations (see piecewise). Sums, differences and scaling of profiles are folded
+    into a new profile, an array is only built when it is needed, e.g. by np.asarray(profile) or when it is
+    combined with an array. Other numpy functions and comparisons work on the values as for an array.
+
+    Arguments:
+        kind (str): 'constant', 'linear' or 'piecewise'
+        size (int): number of stations
+        intercept (num): value for 'constant', intercept for 'linear'
+        slope (num): slope for 'linear'
+        x (list or array): reference values for 'linear' and 'piecewise' (increasing), e.g. tvd. It is not copied.
+        stations (array): station indices with known values for 'piecewise', including the first and last ones
+        values (array): values at those stations for 'piecewise'
+
+    Attributes:
+        kind, size, intercept, slope, x, stations, values: as in the arguments
+    """
+
+    def __init__(self, kind, size, intercept=0.0, slope=0.0, x=None, stations=None, values=None):
+        self.kind = kind
+        self.size = size
+        self.intercept = intercept
+        self.slope = slope
+        self.x = x
+        self.stations = stations
+        self.values = values
+
+    @classmethod
+    def constant(cls, value, size):
+        return cls('constant', size, value)
+
+    @classmethod
+    def linear(cls, intercept, slope, x):
+        return cls('linear', len(x), intercept, slope, x)
+
+    def __len__(self):
+        return self.size
+
+    def materialize(self):
+        """
+        Returns:
+            profile values as a new float array
+        """
+
+        if self.kind == 'constant':
+            return np.full(self.size, self.intercept, dtype=float)
+        if self.kind == 'piecewise':
+            return self.at(self.x)
+        values = self.slope * np.asarray(self.x, dtype=float)
+        if self.intercept != 0:
+            values += self.intercept
+        return values
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.materialize()
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # numpy functions and operators work on the values as for an array, e.g. np.abs(profile) or array > profile.
+        # Sums, differences and scaling by a number keep the profile lazy, e.g. np.float64 * profile.
+        if method == '__call__' and not kwargs and ufunc in _OPERATORS and len(inputs) == 2 and \
+                all(isinstance(x, Profile) or np.ndim(x) == 0 for x in inputs):
+            left, right = inputs
+            if isinstance(left, Profile):
+                return getattr(left, _OPERATORS[ufunc][0])(right)
+            if _OPERATORS[ufunc][1] is not None:
+                return getattr(right, _OPERATORS[ufunc][1])(left)
+
+        if any(isinstance(x, Profile) for x in kwargs.get('out', ())):
+            return NotImplemented
+        inputs = [x.materialize() if isinstance(x, Profile) else x for x in inputs]
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    @property
+    def shape(self):
+        return (self.size,)
+
+    @property
+    def ndim(self):
+        return 1
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def at(self, x):
+        """
+        Evaluate the profile at other reference values. A piecewise profile is exact at the stations, between two
+        stations around a fluid interface it is interpolated.
+
+        Arguments:
+            x (num or array): reference values, e.g. tvd
+
+        Returns:
+            values with the shape of x
+        """
+
+        x = np.asarray(x, dtype=float)
+        if self.kind == 'constant':
+            return np.full(x.shape, self.intercept, dtype=float)
+        if self.kind == 'piecewise':
+            return np.interp(x, np.asarray(self.x, dtype=float)[self.stations], self.values)
+        return self.intercept + self.slope * x
+
+    def min(self):
+        return float(self._ends()[1].min())
+
+    def max(self):
+        return float(self._ends()[1].max())
+
+    def argmin(self):
+        """
+        Returns:
+            first station with the minimum value, without building the profile
+        """
+
+        stations, values = self._ends()
+        return int(stations[values.argmin()])
+
+    def argmax(self):
+        stations, values = self._ends()
+        return int(stations[values.argmax()])
+
+    def _ends(self):
+        # stations where the extremes can be, with their values
+        if self.kind == 'piecewise':
+            return self.stations, self.values
+        if self.kind == 'constant' or self.size == 0:
+            return np.array([0]), np.array([self.intercept], dtype=float)
+        x = np.asarray(self.x, dtype=float)
+        stations = np.array([x.argmin(), x.argmax()])
+        return stations, self.at(x[stations])
+
+    def _combine(self, other, sign):
+        if isinstance(other, Profile) and 'piecewise' in (self.kind, other.kind):
+            if self.kind != 'piecewise':
+                return (other * sign)._combine(self, 1.0)
+            if other.kind == 'piecewise' and other.x is not self.x:
+                return self.materialize() + sign * other.materialize()
+            if other.kind == 'linear' and other.x is not self.x:
+                return self.materialize() + sign * other.materialize()
+            stations = self.stations
+            if other.kind == 'piecewise':
+                stations = np.union1d(self.stations, other.stations)
+            x = np.asarray(self.x, dtype=float)[stations]
+            return Profile('piecewise', self.size, x=self.x, stations=stations,
+                           values=self.at(x) + sign * other.at(x))
+        if isinstance(other, Profile):
+            if other.kind == 'constant' or self.kind == 'constant' or other.x is self.x:
+                x = self.x if self.kind == 'linear' else other.x
+                kind = 'linear' if x is not None else 'constant'
+                return Profile(kind, self.size, self.intercept + sign * other.intercept,
+                               self.slope + sign * other.slope, x)
+            return self.materialize() + sign * other.materialize()
+        if np.ndim(other) == 0:
+            if self.kind == 'piecewise':
+                return Profile('piecewise', self.size, x=self.x, stations=self.stations,
+                               values=self.values + sign * other)
+            return Profile(self.kind, self.size, self.intercept + sign * other, self.slope, self.x)
+        values = self.materialize()
+        values += sign * np.asarray(other, dtype=float)
+        return values
+
+    def __add__(self, other):
+        return self._combine(other, 1.0)
+
+    def __radd__(self, other):
+        return self._combine(other, 1.0)
+
+    def __sub__(self, other):
+        return self._combine(other, -1.0)
+
+    def __rsub__(self, other):
+        return (-self)._combine(other, 1.0)
+
+    def __neg__(self):
+        return self * -1.0
+
+    def __mul__(self, other):
+        if np.ndim(other) == 0 and not isinstance(other, Profile):
+            return Profile(self.kind, self.size, self.intercept * other, self.slope * other, self.x, self.stations,
+                           None if self.values is None else self.values * other)
+        return self.materialize() * np.asarray(other, dtype=float)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        if np.ndim(other) == 0 and not isinstance(other, Profile):
+            return self * (1 / other)
+        return self.materialize() / np.asarray(other, dtype=float)
+
+    def __abs__(self):
+        return np.abs(self.materialize())
+
+    def __lt__(self, other):
+        return self.materialize() < np.asarray(other, dtype=float)
+
+    def __le__(self, other):
+        return self.materialize() <= np.asarray(other, dtype=float)
+
+    def __gt__(self, other):
+        return self.materialize() > np.asarray(other, dtype=float)
+
+    def __ge__(self, other):
+        return self.materialize() >= np.asarray(other, dtype=float)
+
+    def __getitem__(self, idx):
+        if self.kind == 'constant' and np.ndim(idx) == 0 and not isinstance(idx, slice):
+            return self.intercept
+        return self.materialize()[idx]
+
+    def __repr__(self):
+        if self.kind == 'piecewise':
+            return 'Profile(piecewise, {} of {} stations)'.format(len(self.stations), self.size)
+        if self.kind == 'constant':
+            return 'Profile(constant {}, size {})'.format(self.intercept, self.size)
+        return 'Profile(linear {} + {} x, size {})'.format(self.intercept, self.slope, self.size)
+
+
+def piecewise(tvd, depths, function):
+    """
+    Evaluate a function of tvd that is linear between some depths (fluid interfaces, packer, perforations...)
+    only at the stations around those depths and at both ends.
+
+    Arguments:
+        tvd (list or array): true vertical depth of every station, m
+        depths (list): depths where the function can change, m
+        function: function(tvd array) -> values array, evaluated element by element
+
+    Returns:
+        piecewise Profile, or the values at every station if tvd is not increasing
+    """
+
+    x = np.asarray(tvd, dtype=float)
+    if len(x) < 3 or np.any(x[1:] <= x[:-1]):
+        return function(x)
+
+    stations = breakpoint_stations(x, depths)
+    if len(stations) == len(x):
+        return function(x)
+
+    return Profile('piecewise', len(x), x=tvd, stations=stations, values=np.asarray(function(x[stations]), dtype=float))
+
+
+def breakpoint_stations(tvd, depths):
+    """
+    Get the stations needed to describe a profile that is linear between some depths: both ends and the stations
+    before, at and after every depth.
+
+    Arguments:
+        tvd (array): increasing true vertical depth, m
+        depths (list): depths where the profile can change, m
+
+    Returns:
+        sorted array of station indices
+    """
+
+    stations = [0, len(tvd) - 1]
+    for depth in depths:
+        left = int(np.searchsorted(tvd, depth, 'left'))
+        right = int(np.searchsorted(tvd, depth, 'right'))
+        stations += [left - 1, left, left + 1, right - 1, right]
+
+    return np.unique(np.clip(stations, 0, len(tvd) - 1))
@@ -0,0 +1,398 @@
+import copy
+import json
+from concurrent.futures import ThreadPoolExecutor
+from .unit_converter import convert_unit
+from .axial.forces import bending, drag, buoyancy_force
+from .fluids import fluid_column
+from .batch import CASES
+from .prepare_cases import gen_overpull, gen_running, gen_green_cement, gen_cementing, gen_full_evacuation, \
+    gen_mud_drop, gen_displacement_gas, gen_production, gen_injection, gen_pressure_test, gen_gas_kick
+
+PRODUCTION = [None, 'Production']
+
+NODES = {}      # name: (function, dependencies)
+REGISTRY = []   # LoadCase objects in run order
+
+
+class LoadCase(object):
+    """
+    Declaration of a load case for the scheduler.
+
+    Arguments:
+        name (str): load case description, as it appears in the loads
+        gen (function): gen(csg, nodes=None, **kwargs) adding one load to csg.loads. Forces in kN are converted
+                        by _append_load in the built-in cases.
+        inputs (dict): gen kwargs, each value is a settings key as 'section.item' (or 'section' for the whole
+                       section) or a function (csg) -> value
+        nodes (list): shared nodes used by gen, as a node name or (node name, function (kwargs) -> node params)
+        requires (str or None): gen_msgs group that must be complete for the case to apply, e.g. 'Production'
+        pipe_classes (list or None): casing classes the case applies to, None for every class
+    """
+
+    def __init__(self, name, gen, inputs, nodes=(), requires=None, pipe_classes=None):
+        self.name = name
+        self.gen = gen
+        self.inputs = inputs
+        self.nodes = list(nodes)
+        self.requires = requires
+        self.pipe_classes = pipe_classes
+
+    def applies(self, csg):
+        if self.requires is not None and self.requires in csg.msgs:
+            return False
+        return self.pipe_classes is None or csg.pipe_class in self.pipe_classes
+
+    def kwargs(self, csg):
+        kwargs = {}
+        for arg, source in self.inputs.items():
+            if callable(source):
+                kwargs[arg] = source(csg)
+                continue
+            value = csg.settings
+            for key in source.split('.'):
+                value = value[key]
+            kwargs[arg] = value
+        return kwargs
+
+    def settings_keys(self):
+        """
+        Returns:
+            list of the settings keys declared as inputs
+        """
+
+        return [source for source in self.inputs.values() if not callable(source)]
+
+
+def register_node(name, function, depends=()):
+    """
+    Add a shared node that load cases can use. It is calculated once per run for every unique set of params.
+
+    Arguments:
+        name (str): node name
+        function: function(csg, *dependency values, **params)
+        depends (list): names of the nodes used by function, they are calculated without params
+    """
+
+    NODES[name] = (function, list(depends))
+
+
+def register_case(case, position=None, replace=False):
+    """
+    Add a load case to the registry, it is run by Casing.run_loads and listed by applicable_cases. Custom cases
+    are added to case_names, CASES only lists the built-in cases.
+
+    Arguments:
+        case (LoadCase): load case declaration
+        position (int or None): index in the run order, appended if None
+        replace (bool): replace a registered case with the same name
+    """
+
+    names = [registered.name for registered in REGISTRY]
+    if case.name in names:
+        if not replace:
+            raise ValueError('load case {} is already registered'.format(case.name))
+        REGISTRY.remove(REGISTRY[names.index(case.name)])
+    for name, params in [_node_ref(node) for node in case.nodes]:
+        if name not in NODES:
+            raise ValueError('unknown node {} in load case {}'.format(name, case.name))
+
+    REGISTRY.insert(len(REGISTRY) if position is None else position, case)
+
+
+def unregister_case(name):
+    """
+    Remove a load case from the registry. Stores, envelopes and tables already started keep their case list.
+    """
+
+    for case in REGISTRY:
+        if case.name == name:
+            REGISTRY.remove(case)
+            return
+    raise ValueError('load case {} is not registered'.format(name))
+
+
+def case_names():
+    """
+    Get the load cases results are indexed by: the built-in cases (CASES) and then the custom cases registered
+    now. Stores, envelopes and scenario tables keep the list they were started with.
+
+    Returns:
+        new list of load case names
+    """
+
+    return CASES + [case.name for case in REGISTRY if case.name not in CASES]
+
+
+def registered_cases():
+    """
+    Returns:
+        list of the registered LoadCase objects in run order
+    """
+
+    return list(REGISTRY)
+
+
+def plan_cases(csg):
+    """
+    Build the dependency graph of the load cases that apply to the casing with its current settings and msgs.
+    Nodes used by several cases with the same params are only planned once.
+
+    Arguments:
+        csg: casing obj
+
+    Returns:
+        dict with 'cases' (list of (LoadCase, kwargs, {node name: node key})), 'nodes' ({node key: (name,
+        params, dependency keys)}) and 'levels' (node keys in groups that only depend on previous groups)
+    """
+
+    cases, nodes, depth = [], {}, {}
+
+    def add(name, params):
+        key = (name, json.dumps(params, sort_keys=True, default=str))
+        if key not in nodes:
+            depends = [add(dependency, {}) for dependency in NODES[name][1]]
+            nodes[key] = (name, params, depends)
+            depth[key] = 1 + max([depth[dependency] for dependency in depends], default=-1)
+        return key
+
+    for case in REGISTRY:
+        if not case.applies(csg):
+            continue
+        kwargs = case.kwargs(csg)
+        keys = {}
+        for name, params in [_node_ref(node) for node in case.nodes]:
+            keys[name] = add(name, params(kwargs) if params is not None else {})
+        cases.append((case, kwargs, keys))
+
+    levels = [[] for _ in range(1 + max(depth.values(), default=-1))]
+    for key in nodes:
+        levels[depth[key]].append(key)
+
+    return {'cases': cases, 'nodes': nodes, 'levels': levels}
+
+
+def merge_plans(plans):
+    """
+    Join the node graphs of several plans of the same casing, so their nodes can be calculated in one pass.
+
+    Arguments:
+        plans (list): plans as returned by plan_cases
+
+    Returns:
+        dict with 'nodes' and 'levels' of all the plans, each node key once
+    """
+
+    nodes, levels = {}, []
+    for plan in plans:
+        for depth, level in enumerate(plan['levels']):
+            if depth == len(levels):
+                levels.append([])
+            levels[depth] += [key for key in level if key not in nodes]
+            nodes.update((key, plan['nodes'][key]) for key in level)
+
+    return {'nodes': nodes, 'levels': levels}
+
+
+def run_cases(csg, workers=None):
+    """
+    Run the load cases that apply to the casing. Shared nodes are calculated first, level by level, then every
+    case gets the nodes it declared.
+
+    Arguments:
+        csg: casing obj with settings and msgs defined
+        workers (int or None): threads to run independent nodes and cases at the same time, sequential if None
+
+    Returns:
+        None. The loads are added to csg.loads in registry order.
+    """
+
+    plan = plan_cases(csg)
+
+    executor = ThreadPoolExecutor(workers) if workers is not None and workers > 1 else None
+    try:
+        values = evaluate_nodes(csg, plan, executor=executor)
+        items = plan['cases']
+        if executor is not None:
+            results = executor.map(run_case, [csg] * len(items), items, [values] * len(items))
+        else:
+            results = [run_case(csg, item, values) for item in items]
+        for loads in list(results):
+            csg.loads += loads
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def evaluate_nodes(csg, plan, keys=None, values=None, executor=None):
+    """
+    Calculate the shared nodes of a plan level by level. Nodes already in values are not calculated again, so
+    plans of the same casing (e.g. scenarios with other settings) can share them.
+
+    Arguments:
+        csg: casing obj
+        plan (dict): see plan_cases
+        keys (list or None): node keys needed, their dependencies are added. All the nodes of the plan if None
+        values (dict or None): node values by node key, updated in place
+        executor (Executor or None): executor to calculate the nodes of a level at the same time
+
+    Returns:
+        dict with the node values by node key
+    """
+
+    if values is None:
+        values = {}
+
+    needed = set(plan['nodes'] if keys is None else [])
+    pending = list(keys or [])
+    while pending:
+        key = pending.pop()
+        if key not in needed:
+            needed.add(key)
+            pending += plan['nodes'][key][2]
+
+    for level in plan['levels']:
+        level = [key for key in level if key in needed and key not in values]
+        nodes = [plan['nodes'][key] for key in level]
+        if executor is not None:
+            results = executor.map(node_value, [csg] * len(nodes), nodes, [values] * len(nodes))
+        else:
+            results = [node_value(csg, node, values) for node in nodes]
+        values.update(zip(level, results))
+
+    return values
+
+
+def node_value(csg, node, values):
+    """
+    Calculate a node of a plan.
+
+    Arguments:
+        csg: casing obj
+        node (tuple): (name, params, dependency keys) as in plan_cases
+        values (dict): node values by node key, with the dependencies already calculated
+
+    Returns:
+        node value
+    """
+
+    name, params, depends = node
+    return NODES[name][0](csg, *[values[dependency] for dependency in depends], **params)
+
+
+def run_case(csg, item, values):
+    """
+    Run a planned load case on a copy of the casing.
+
+    Arguments:
+        csg: casing obj with settings defined, it is not modified
+        item (tuple): (LoadCase, kwargs, {node name: node key}) as in plan_cases
+        values (dict): node values by node key
+
+    Returns:
+        list with the loads added by the case
+    """
+
+    load_case, kwargs, keys = item
+    run = copy.copy(csg)
+    run.loads = []
+    load_case.gen(run, nodes={name: values[key] for name, key in keys.items()}, **kwargs)
+    return run.loads
+
+
+def applicable(csg):
+    """
+    List the registered load cases that apply to the casing with its current settings and msgs.
+
+    Returns:
+        list of (load case name, gen function, kwargs)
+    """
+
+    return [(case.name, case.gen, case.kwargs(csg)) for case in REGISTRY if case.applies(csg)]
+
+
+def _node_ref(node):
+    if isinstance(node, str):
+        return node, None
+    return node
+
+
+def _young_modulus(csg):
+    return convert_unit(csg.e, unit_from='psi', unit_to='bar')
+
+
+def _bending(csg, e):
+    return bending(csg.od, csg.trajectory.dls, csg.trajectory.info['dlsResolution'], e)
+
+
+def _buoyancy(csg, column):
+    return buoyancy_force(csg.trajectory.tvd, csg.od, csg.id, column, None, column, None)
+
+
+def _drag(csg, column, fric):
+    return drag(csg.trajectory, csg.od, csg.id, csg.shoe, csg.nominal_weight, column, None, fric, 'all')
+
+
+def _fluid_params(kwargs):
+    # the node key is the column, so cases with the same fluids share the node however they list them
+    return {'column': fluid_column(kwargs.get('tvd_fluid') or [], kwargs.get('rho_fluid') or [1.2])}
+
+
+def _drag_params(kwargs):
+    return dict(_fluid_params(kwargs), fric=kwargs.get('fric', 0.24))
+
+
+register_node('e', _young_modulus)
+register_node('bending', _bending, ['e'])
+register_node('buoyancy', _buoyancy)
+register_node('drag', _drag)
+
+register_case(LoadCase('Overpull', gen_overpull,
+                       {'rho_fluid': lambda csg: [csg.settings['densities']['mud']], 'v_avg': 'tripping.speed',
+                        'fric': 'tripping.slidingFriction', 'a': 'tripping.maxSpeedRatio',
+                        'f_ov': lambda csg: int(csg.settings['forces']['overpull'])},
+                       ['e', 'bending', ('buoyancy', _fluid_params), ('drag', _drag_params)]))
+register_case(LoadCase('Running', gen_running,
+                       {'rho_fluid': lambda csg: [csg.settings['densities']['mud']], 'v_avg': 'tripping.speed',
+                        'fric': 'tripping.slidingFriction', 'a': 'tripping.maxSpeedRatio'},
+                       ['e', 'bending', ('buoyancy', _fluid_params), ('drag', _drag_params)]))
+register_case(LoadCase('Green Cement Pressure Test', gen_green_cement,
+                       {'rho_fluid_int': 'densities.cementDisplacingFluid', 'rho_cement': 'densities.cement',
+                        'f_pre': 'forces.preloading', 'p_test': 'testing.cementingPressure'},
+                       ['e', 'bending']))
+register_case(LoadCase('Cementing', gen_cementing,
+                       {'rho_cement': 'densities.cement', 'rho_fluid': 'densities.cementDisplacingFluid',
+                        'f_pre': 'forces.preloading'},
+                       ['e', 'bending']))
+register_case(LoadCase('Full Evacuation', gen_full_evacuation,
+                       {'rho_prod_fluid': 'production.fluidDensity', 'rho_mud': 'densities.mud',
+                        'md_toc': lambda csg: csg.toc_md, 'poisson': 'production.poisson',
+                        'f_setting': 'forces.preloading'},
+                       ['e', 'bending'], pipe_classes=PRODUCTION))
+register_case(LoadCase('Mud Drop', gen_mud_drop,
+                       {'rho_mud': 'densities.mud', 'rho_mud_new': 'densities.mudDropTo'},
+                       ['e', 'bending']))
+register_case(LoadCase('Displacement to gas', gen_displacement_gas,
+                       {'p_res': 'production.resPressure', 'tvd_res': 'production.resTvd',
+                        'rho_gas': 'densities.gasKick', 'rho_mud': 'densities.mud'},
+                       ['e', 'bending'], requires='Displacement to gas'))
+register_case(LoadCase('Production', gen_production,
+                       {'p_res': 'production.resPressure', 'rho_prod_fluid': 'production.fluidDensity',
+                        'rho_ann_fluid': 'densities.completionFluid',
+                        'rho_packerfluid': 'production.packerFluidDensity', 'md_toc': lambda csg: csg.toc_md,
+                        'tvd_packer': 'production.packerTvd', 'tvd_perf': 'production.perforationsTvd',
+                        'poisson': 'production.poisson', 'f_setting': 'forces.preloading'},
+                       ['e', 'bending'], requires='Production', pipe_classes=PRODUCTION))
+register_case(LoadCase('Injection', gen_injection,
+                       {'whp': 'injection.whp', 'rho_injectionfluid': 'densities.injectionFluid',
+                        'rho_mud': 'densities.mud', 'temp': 'temp', 't_k': 'production.wellHeadTemp',
+                        'poisson': 'production.poisson', 'f_setting': 'forces.preloading'},
+                       ['e', 'bending'], requires='Injection', pipe_classes=PRODUCTION))
+register_case(LoadCase('Pressure Test', gen_pressure_test,
+                       {'whp': 'testing.testPressure', 'effective_diameter': 'testing.pipeDiameter',
+                        'rho_testing_fluid': 'testing.testFluidDensity', 'rho_mud': 'densities.mud'},
+                       ['e', 'bending'], requires='Pressure Test'))
+register_case(LoadCase('Gas kick', gen_gas_kick,
+                       {'p_res': 'production.resPressure', 'tvd_res': 'production.resTvd',
+                        'rho_gas': 'densities.gasKick', 'rho_mud': 'densities.mud',
+                        'vol_kick_initial': 'influx.gasKickVolume'},
+                       ['e', 'bending'], requires='Gas Kick'))
@@ -0,0 +1,182 @@
+import json
+import zipfile
+import numpy as np
+
+FORMATS = ('npz', 'arrow')
+
+
+def export_results(casings, path, fmt='npz', append=False):
+    """
+    Write the load profiles of one or more casings as columnar float arrays.
+
+    Arguments:
+        casings (list): casing objects with loads already run
+        path (str): output file
+        fmt (str): 'npz' or 'arrow'
+        append (bool): add the casings to an existing file instead of overwriting it
+
+    Returns:
+        None
+    """
+
+    if fmt == 'npz':
+        _export_npz(casings, path, append)
+    elif fmt == 'arrow':
+        _export_arrow(casings, path, append)
+    else:
+        raise ValueError('format must be one of {}'.format(FORMATS))
+
+
+def load_results(path, fmt=None, mmap=True):
+    """
+    Read load profiles written by export_results.
+
+    Arguments:
+        path (str): results file
+        fmt (str or None): 'npz' or 'arrow'. By default it is taken from the file extension.
+        mmap (bool): map the profile arrays from disk instead of reading them into memory
+
+    Returns:
+        list of dicts, one per casing: 'cases', 'md', 'tvd', 'axialForce' and 'diffPressure' (case x station
+        arrays) plus the metadata 'limits', 'connLimits', 'designFactor', 'maxLoads', 'minDF', 'safetyFactors'
+    """
+
+    if fmt is None:
+        fmt = 'arrow' if path.endswith(('.arrow', '.feather')) else 'npz'
+
+    if fmt == 'npz':
+        return _load_npz(path, mmap)
+    elif fmt == 'arrow':
+        return _load_arrow(path, mmap)
+    else:
+        raise ValueError('format must be one of {}'.format(FORMATS))
+
+
+def results_arrays(csg):
+    """
+    Collect the loads of a casing as arrays and metadata.
+
+    Arguments:
+        csg: casing obj
+
+    Returns:
+        dict with case x station arrays and a json serializable metadata dict
+    """
+
+    if len(csg.loads) == 0:
+        raise ValueError('casing has no loads, run_loads must be used first')
+
+    arrays = {'md': np.asarray(csg.trajectory.md, dtype=float),
+              'tvd': np.asarray(csg.trajectory.tvd, dtype=float),
+              'axialForce': np.array([load['axialForce'] for load in csg.loads], dtype=float),
+              'diffPressure': np.array([load['diffPressure'] for load in csg.loads], dtype=float)}
+
+    meta = {'cases': [load['description'] for load in csg.loads],
+            'limits': csg.limits,
+            'connLimits': csg.conn_limits,
+            'designFactor': csg.design_factor,
+            'maxLoads': [load['maxLoads'] for load in csg.loads],
+            'minDF': [load['minDF'] for load in csg.loads],
+            'safetyFactors': csg.safety_factors}
+
+    return arrays, json.loads(json.dumps(meta, default=float))
+
+
+def _export_npz(casings, path, append):
+    with zipfile.ZipFile(path, mode='a' if append else 'w', compression=zipfile.ZIP_STORED,
+                         allowZip64=True) as file:
+        start = len([name for name in file.namelist() if name.endswith('/meta.npy')])
+        for idx, csg in enumerate(casings, start):
+            arrays, meta = results_arrays(csg)
+            arrays['meta'] = np.array(json.dumps(meta))
+            for key, value in arrays.items():
+                with file.open('casing{}/{}.npy'.format(idx, key), mode='w', force_zip64=True) as member:
+                    np.lib.format.write_array(member, value, allow_pickle=False)
+
+
+def _load_npz(path, mmap):
+    results = []
+    with zipfile.ZipFile(path) as file, open(path, 'rb') as raw:
+        casings = sorted({name.split('/')[0] for name in file.namelist()}, key=lambda x: int(x[6:]))
+        for name in casings:
+            meta = json.loads(str(_read_member(file, name + '/meta.npy')))
+            result = {'cases': meta.pop('cases')}
+            for key in ['md', 'tvd', 'axialForce', 'diffPressure']:
+                info = file.getinfo('{}/{}.npy'.format(name, key))
+                if mmap and info.compress_type == zipfile.ZIP_STORED:
+                    result[key] = _map_member(path, raw, info)
+                else:
+                    result[key] = _read_member(file, info.filename)
+            result.update(meta)
+            results.append(result)
+
+    return results
+
+
+def _read_member(file, name):
+    with file.open(name) as member:
+        return np.lib.format.read_array(member, allow_pickle=False)
+
+
+def _map_member(path, raw, info):
+    raw.seek(info.header_offset + 26)
+    name_length, extra_length = np.frombuffer(raw.read(4), dtype='<u2')
+    raw.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+    version = np.lib.format.read_magic(raw)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(raw)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(raw)
+
+    return np.memmap(path, dtype=dtype, mode='r', offset=raw.tell(), shape=shape,
+                     order='F' if fortran_order else 'C')
+
+
+def _export_arrow(casings, path, append):
+    import pyarrow as pa
+
+    batches, metas = [], []
+    if append:
+        with pa.OSFile(path) as source:     # read into memory, the file is rewritten below
+            table = pa.ipc.open_file(source).read_all()
+        batches = table.to_batches()
+        metas = json.loads(table.schema.metadata[b'pwploads'])
+
+    for idx, csg in enumerate(casings, len(metas)):
+        arrays, meta = results_arrays(csg)
+        cases, stations = arrays['axialForce'].shape
+        batches.append(pa.record_batch({'casing': pa.array(np.full(cases * stations, idx, dtype=np.int32)),
+                                        'case': pa.array(np.repeat(np.arange(cases, dtype=np.int32), stations)),
+                                        'md': pa.array(np.tile(arrays['md'], cases)),
+                                        'tvd': pa.array(np.tile(arrays['tvd'], cases)),
+                                        'axialForce': pa.array(arrays['axialForce'].ravel()),
+                                        'diffPressure': pa.array(arrays['diffPressure'].ravel())}))
+        metas.append(meta)
+
+    schema = batches[0].schema.with_metadata({'pwploads': json.dumps(metas)})
+    with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch.replace_schema_metadata(schema.metadata))
+
+
+def _load_arrow(path, mmap):
+    import pyarrow as pa
+
+    source = pa.memory_map(path) if mmap else pa.OSFile(path)
+    reader = pa.ipc.open_file(source)
+    metas = json.loads(reader.schema.metadata[b'pwploads'])
+
+    results = []
+    for idx in range(reader.num_record_batches):
+        batch = reader.get_batch(idx)
+        meta = metas[batch.column('casing')[0].as_py()]
+        cases = len(meta['cases'])
+        result = {'cases': meta.pop('cases')}
+        for key in ['md', 'tvd', 'axialForce', 'diffPressure']:
+            result[key] = batch.column(key).to_numpy().reshape(cases, -1)
+        result['md'] = result['md'][0]
+        result['tvd'] = result['tvd'][0]
+        result.update(meta)
+        results.append(result)
+
+    return results
@@ -0,0 +1,247 @@
+import copy
+import itertools
+import json
+import numpy as np
+from .utilities import gen_msgs, define_max_loads, define_min_df
+from .registry import plan_cases, merge_plans, evaluate_nodes, run_case, case_names
+
+LOAD_TYPES = ('burst', 'collapse', 'tension', 'compression')
+INTEGER_SETTINGS = ('forces.overpull',)     # truncated to an integer by the load cases
+
+
+def run_scenarios(csg, base_settings=None, grid=None, envelope=None):
+    """
+    Run the load cases for every combination of settings in a grid. Each case is only calculated once for every
+    unique combination of the settings it uses, e.g. a 5 x 3 mud and friction grid needs 15 drag calculations
+    (shared by Running and Overpull), but a single Cementing calculation if cement densities are not in the grid.
+    The bending profile is calculated once for all of them.
+
+    Arguments:
+        csg: casing obj with trajectory
+        base_settings (dict or None): settings shared by all the scenarios
+        grid (dict or None): values for each setting, keys as 'section.item' (see merge_settings), e.g.
+                             {'densities.mud': [1.2, 1.4]}
+        envelope (Envelope or None): envelope to add every calculated load to, scenarios reusing a load are added
+                                     with Envelope.share, so the governing ones are listed in its 'scenarios'
+
+    Returns:
+        dict with 'scenarios' (list of {'section.item': value}), 'cases' (case_names), 'safetyFactors' (minimum DF as
+        scenario x case array per load type, NaN where the case was not run or has no load of that type) and
+        'evaluations' (number of load case calculations)
+    """
+
+    scenarios = expand_grid(grid)
+    cases, table, evaluations = _scenario_table(csg, base_settings, scenarios, envelope)
+
+    return {'scenarios': scenarios, 'cases': cases, 'safetyFactors': table, 'evaluations': evaluations}
+
+
+def sensitivity(csg, settings=None, params=None, rel_step=0.01):
+    """
+    Calculate the derivatives of the minimum DF of every case with respect to some settings, using central
+    differences. All the perturbations are evaluated as one batch of scenarios: only the cases that use a setting
+    are calculated again when it is perturbed and every shared node (e.g. drag) is calculated once.
+
+    Arguments:
+        csg: casing obj with trajectory
+        settings (dict or None): load case settings, defaults are used for missing values
+        params (list or None): settings to perturb as 'section.item' or 'section.group.item'. Default: mud
+                               density, gas kick density, sliding friction, wellhead temperature and preloading
+        rel_step (num): perturbation relative to each value, used as absolute step for values equal to 0. Settings
+                        in INTEGER_SETTINGS (e.g. overpull) are perturbed in whole units, at least 1
+
+    Returns:
+        dict with 'params', 'values' and 'steps' per param, 'cases' (case_names), 'safetyFactors' (minimum DF per case
+        for each load type), 'gradients' (param x case array per load type, NaN where not defined) and 'tornado'
+        (rows {'param', 'low', 'high', 'swing'} per load type with the lowest DF across cases at value - step
+        and value + step, sorted by swing) and 'evaluations' (number of load case calculations)
+    """
+
+    if params is None:
+        params = ['densities.mud', 'densities.gasKick', 'tripping.slidingFriction', 'production.wellHeadTemp',
+                  'forces.preloading']
+
+    run = copy.copy(csg)
+    run.define_settings(settings)
+    values, steps, scenarios = [], [], [{}]
+    for param in params:
+        value = get_setting(run.settings, param)
+        if isinstance(value, dict):
+            raise ValueError('{} is a group of settings, use one of its items'.format(param))
+        step = rel_step * abs(value) if value != 0 else rel_step
+        if param in INTEGER_SETTINGS:
+            step = max(1, round(step))
+        values.append(value)
+        steps.append(step)
+        scenarios += [{param: value - step}, {param: value + step}]
+
+    cases, table, evaluations = _scenario_table(csg, settings, scenarios)
+
+    result = {'params': list(params), 'values': values, 'steps': steps, 'cases': cases, 'safetyFactors': {},
+              'gradients': {}, 'tornado': {}, 'evaluations': evaluations}
+    steps = np.array(steps)
+    for load_type, sf in table.items():
+        low, high = sf[1::2], sf[2::2]
+        result['safetyFactors'][load_type] = sf[0]
+        result['gradients'][load_type] = (high - low) / (2 * steps[:, None])
+
+        rows = []
+        for idx, param in enumerate(params):
+            if np.all(np.isnan(low[idx])) or np.all(np.isnan(high[idx])):
+                continue
+            row = {'param': param, 'low': float(np.nanmin(low[idx])), 'high': float(np.nanmin(high[idx]))}
+            row['swing'] = abs(row['high'] - row['low'])
+            rows.append(row)
+        result['tornado'][load_type] = sorted(rows, key=lambda x: x['swing'], reverse=True)
+
+    return result
+
+
+def _scenario_table(csg, base_settings, scenarios, envelope=None):
+    evaluated = {}
+    cases = case_names()
+    table = {load_type: np.full((len(scenarios), len(cases)), np.nan) for load_type in LOAD_TYPES}
+
+    for idx, load in scenario_loads(csg, base_settings, scenarios, evaluated):
+        if envelope is not None and 'axialForce' in load:
+            envelope.update(load, idx)
+        elif envelope is not None and 'scenario' in load:
+            envelope.share(load, idx)
+        case = cases.index(load['description'])
+        for load_type, value in load['minDF'].items():
+            if value is not None:
+                table[load_type][idx, case] = value
+
+    return cases, table, len(evaluated)
+
+
+def scenario_loads(csg, base_settings, scenarios, evaluated=None, nodes=None):
+    """
+    Generate the loads of every scenario, calculating each case once per unique set of inputs. All the scenarios are
+    planned first and the shared nodes of the registry (e.g. bending and drag) are calculated in one pass, once per
+    unique set of params.
+
+    Arguments:
+        csg: casing obj with trajectory, it is not modified
+        base_settings (dict or None): settings shared by all the scenarios
+        scenarios (list): {'section.item': value} for each scenario
+        evaluated (dict or None): cache of loads by case inputs, it can be shared between calls
+        nodes (dict or None): cache of node values by node key (see plan_cases), it can be shared between calls of
+                              the same casing
+
+    Yields:
+        (scenario index, load) with maxLoads and minDF already defined. The profiles are only included the first
+        time a load is calculated, later scenarios with the same case inputs get the cached maxLoads and minDF, plus
+        'scenario' with the index of the first one if it was calculated in this call (see Envelope.share).
+    """
+
+    if evaluated is None:
+        evaluated = {}
+    if nodes is None:
+        nodes = {}
+
+    runs, plans, needed, first = [], [], set(), {}
+    for scenario in scenarios:
+        run = copy.copy(csg)
+        run.define_settings(base_settings)
+        run.settings = merge_settings(run.settings, scenario)      # on the whole settings, for nested keys
+        gen_msgs(run)
+        plan = plan_cases(run)
+        items = [((load_case.name, json.dumps(kwargs, sort_keys=True, default=str)), (load_case, kwargs, keys))
+                 for load_case, kwargs, keys in plan['cases']]
+        needed.update(key for case_key, item in items if case_key not in evaluated for key in item[2].values())
+        runs.append((run, items))
+        plans.append(plan)
+
+    # the nodes of all the scenarios in one pass, each unique node once
+    evaluate_nodes(csg, merge_plans(plans), list(needed), nodes)
+
+    for idx, (run, items) in enumerate(runs):
+        for case_key, item in items:
+            if case_key in first:
+                yield idx, dict(evaluated[case_key], scenario=first[case_key])
+                continue
+            if case_key in evaluated:
+                yield idx, evaluated[case_key]
+                continue
+            run.loads = run_case(run, item, nodes)
+            define_max_loads(run.loads)
+            define_min_df(run)
+            load = run.loads[0]
+            evaluated[case_key] = {'description': load['description'], 'maxLoads': load['maxLoads'],
+                                   'minDF': load['minDF']}
+            first[case_key] = idx
+            yield idx, load
+
+
+def expand_grid(grid=None):
+    """
+    List all the combinations of a settings grid.
+
+    Arguments:
+        grid (dict or None): values for each setting, keys as 'section.item'
+
+    Returns:
+        list of {'section.item': value}, the last key changes fastest
+    """
+
+    if not grid:
+        return [{}]
+
+    keys = list(grid.keys())
+    return [dict(zip(keys, values)) for values in itertools.product(*[grid[key] for key in keys])]
+
+
+def merge_settings(base_settings, scenario):
+    """
+    Apply a scenario on top of the base settings.
+
+    Arguments:
+        base_settings (dict or None): settings as used in Casing.run_loads
+        scenario (dict): {'section.item': value}, nested items as 'section.group.item' (e.g. 'temp.seabed.temp').
+                         Casing.define_settings replaces a whole group, so nested items need the rest of the group
+                         in base_settings (e.g. use the defined Casing.settings)
+
+    Returns:
+        new settings dict, base_settings is not modified
+    """
+
+    settings = copy.deepcopy(base_settings) if base_settings else {}
+    for key, value in scenario.items():
+        path = _setting_path(key)
+        group = settings
+        for name in path[:-1]:
+            group = group.setdefault(name, {})
+            if not isinstance(group, dict):
+                raise ValueError('{} is not a group of settings in {}'.format(name, key))
+        group[path[-1]] = value
+
+    return settings
+
+
+def get_setting(settings, key):
+    """
+    Get a setting by its key.
+
+    Arguments:
+        settings (dict): settings, e.g. Casing.settings
+        key (str): 'section.item' or nested as 'section.group.item'
+
+    Returns:
+        setting value
+    """
+
+    value = settings
+    for name in _setting_path(key):
+        if not isinstance(value, dict) or name not in value:
+            raise ValueError('{} is not defined in the settings'.format(key))
+        value = value[name]
+
+    return value
+
+
+def _setting_path(key):
+    path = key.split('.')
+    if len(path) < 2 or not all(path):
+        raise ValueError("setting keys are given as 'section.item', got {}".format(key))
+    return path
@@ -0,0 +1,283 @@
+import copy
+import json
+import os
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from .survey import read_trajectory
+from .batch import summarize
+
+_worker = None      # Worker of the current pool process
+
+
+class Worker(object):
+    """
+    Request handler that keeps surveys, casing templates (limits, ellipse, API lines) and trajectory windows in
+    memory, so repeated requests only pay for the load cases. Each cache keeps the most recently used items.
+
+    Arguments:
+        preload (list): surveys to read at start
+        cache_size (int): maximum number of items in each cache
+
+    Attributes:
+        surveys (LruCache): full trajectories by survey
+        casings (LruCache): casing templates by pipe and factors
+        windows (LruCache): trajectories between top and shoe by (survey, top, shoe)
+    """
+
+    def __init__(self, preload=(), cache_size=64):
+        self.surveys = LruCache(cache_size)
+        self.casings = LruCache(cache_size)
+        self.windows = LruCache(cache_size)
+        for survey in preload:
+            self.survey(survey)
+
+    def survey(self, survey):
+        return self.surveys.fetch(survey, lambda: read_trajectory(survey))
+
+    def casing(self, pipe, factors, survey):
+        """
+        Get a casing ready to run loads, built from the cached template and trajectory window.
+
+        Arguments:
+            pipe (dict): pipe characteristics (see Casing)
+            factors (dict or None): design factors
+            survey (str): survey file
+
+        Returns:
+            casing obj
+        """
+
+        from . import Casing
+
+        key = json.dumps([pipe, factors], sort_keys=True)
+        template = self.casings.fetch(key, lambda: Casing(pipe, factors=factors))
+
+        window = (survey, template.top, template.shoe)
+        trajectory = self.windows.fetch(window, lambda: self.survey(survey).window(template.top, template.shoe))
+
+        csg = copy.copy(template)
+        csg.limits = dict(template.limits)      # changed in place by update_design_factors
+        csg.factors = {key: dict(values) for key, values in template.factors.items()}
+        csg.loads = []
+        csg.trajectory = trajectory
+
+        return csg
+
+    def handle(self, request):
+        """
+        Answer a request.
+
+        Arguments:
+            request (dict): {'id', 'command', ...}. Commands:
+                            'run' (default): {'pipe', 'factors', 'settings', 'survey'} -> {'summary'}
+                            'ping' -> {'pid'}
+                            'stats' -> {'stats'} with the number of cached items
+
+        Returns:
+            dict {'id', 'elapsed', ...} or {'id', 'elapsed', 'error'}
+        """
+
+        start = time.perf_counter()
+        command = request.get('command', 'run')
+        response = {'id': request.get('id')}
+
+        try:
+            if command == 'run':
+                csg = self.casing(request['pipe'], request.get('factors'), request['survey'])
+                csg.run_loads(request.get('settings'))
+                response['summary'] = summarize(csg)
+            elif command == 'ping':
+                response['pid'] = os.getpid()
+            elif command == 'stats':
+                response['stats'] = {'surveys': len(self.surveys), 'casings': len(self.casings),
+                                     'windows': len(self.windows)}
+            else:
+                raise ValueError('unknown command: {}'.format(command))
+        except Exception as error:
+            response['error'] = '{}: {}'.format(type(error).__name__, error)
+
+        response['elapsed'] = time.perf_counter() - start
+
+        return response
+
+
+class LruCache(OrderedDict):
+    """
+    Dict that keeps the most recently used items, the oldest one is dropped when it is full.
+
+    Arguments:
+        size (int): maximum number of items
+    """
+
+    def __init__(self, size):
+        super().__init__()
+        self.size = size
+
+    def fetch(self, key, build=None):
+        """
+        Arguments:
+            key: item key
+            build: function () -> value, called when the key is missing
+
+        Returns:
+            cached value, None if the key is missing and build is None
+        """
+
+        if key in self:
+            self.move_to_end(key)
+            return self[key]
+        if build is None:
+            return None
+
+        value = self[key] = build()
+        while len(self) > self.size:
+            self.popitem(last=False)
+
+        return value
+
+
+class Server(object):
+    """
+    Pool of warm workers. With workers=0 requests are answered in the calling process.
+
+    Arguments:
+        workers (int): number of worker processes
+        preload (list): surveys every worker reads at start
+        cache_size (int): maximum number of surveys, casings and windows each worker keeps
+    """
+
+    def __init__(self, workers=0, preload=(), cache_size=64):
+        self.worker = None
+        self.executor = None
+        if workers > 0:
+            self.executor = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                                initargs=(list(preload), cache_size))
+            list(self.executor.map(_handle, [{'command': 'ping'}] * workers))     # start the workers now
+        else:
+            self.worker = Worker(preload, cache_size)
+
+    def submit(self, request, reply):
+        """
+        Answer a request, reply is called with the response (from another thread when using workers).
+        """
+
+        if self.executor is None:
+            reply(self.worker.handle(request))
+            return
+
+        def done(future):
+            try:
+                reply(future.result())
+            except Exception as error:      # worker died
+                reply({'id': request.get('id'), 'error': '{}: {}'.format(type(error).__name__, error)})
+
+        self.executor.submit(_handle, request).add_done_callback(done)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+def serve(server, source, sink):
+    """
+    Answer JSON line requests from a text stream until it ends or a 'shutdown' command is received. Responses are
+    written as they complete, use the request 'id' to match them.
+
+    Arguments:
+        server (Server): server to answer the requests with
+        source: readable text stream, e.g. sys.stdin
+        sink: writable text stream, e.g. sys.stdout
+
+    Returns:
+        True if a shutdown command was received
+    """
+
+    condition = threading.Condition()
+    pending = [0]
+
+    def reply(response):
+        with condition:
+            sink.write(json.dumps(response) + '\n')
+            sink.flush()
+            pending[0] -= 1
+            condition.notify_all()
+
+    shutdown = False
+    for text in source:
+        if not text.strip():
+            continue
+        with condition:
+            pending[0] += 1
+        try:
+            request = json.loads(text)
+        except ValueError as error:
+            reply({'id': None, 'error': 'ValueError: {}'.format(error)})
+            continue
+        if request.get('command') == 'shutdown':
+            shutdown = True
+            break
+        server.submit(request, reply)
+
+    with condition:     # wait for the requests still running
+        condition.wait_for(lambda: pending[0] <= int(shutdown))
+
+    if shutdown:
+        reply({'id': request.get('id'), 'shutdown': True})
+
+    return shutdown
+
+
+def serve_socket(server, path):
+    """
+    Answer JSON line requests on a unix socket, one stream per connection (see serve). A 'shutdown' command
+    stops the server.
+
+    Arguments:
+        server (Server): server to answer the requests with
+        path (str): socket file
+    """
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            if serve(server, _TextSource(self.rfile), _TextSink(self.wfile)):
+                threading.Thread(target=listener.shutdown).start()
+
+    if os.path.exists(path):
+        os.remove(path)
+
+    with socketserver.ThreadingUnixStreamServer(path, Handler) as listener:
+        listener.serve_forever()
+
+    os.remove(path)
+
+
+def _init_worker(preload, cache_size):
+    global _worker
+    _worker = Worker(preload, cache_size)
+
+
+def _handle(request):
+    return _worker.handle(request)
+
+
+class _TextSource(object):
+    def __init__(self, file):
+        self.file = file
+
+    def __iter__(self):
+        for line in self.file:
+            yield line.decode()
+
+
+class _TextSink(object):
+    def __init__(self, file):
+        self.file = file
+
+    def write(self, text):
+        self.file.write(text.encode())
+
+    def flush(self):
+        self.file.flush()
@@ -0,0 +1,132 @@
+import sys
+from multiprocessing import shared_memory, resource_tracker
+from numpy import ndarray, float64
+from .trajectory import Trajectory
+from .survey import read_trajectory
+
+COLUMNS = ('md', 'tvd', 'inclination', 'azimuth', 'dls')
+
+_attached = {}      # shared memory blocks already mapped in this process, by name
+
+
+class SharedSurvey(object):
+    """
+    Survey columns stored in a shared memory block, so worker processes can use the same trajectory without
+    pickling it.
+
+    Arguments:
+        survey: excel file, csv/npy/npz/binary file, dataframe, list of dicts or Trajectory object
+
+    Attributes:
+        handle (SurveyHandle): lightweight reference to send to the workers
+        trajectory (Trajectory): columns as views of the shared block
+    """
+
+    def __init__(self, survey):
+        survey = read_trajectory(survey)
+
+        points = len(survey)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(len(COLUMNS) * points * 8, 1))
+        columns = ndarray((len(COLUMNS), points), dtype=float64, buffer=self._shm.buf)
+        for row, name in enumerate(COLUMNS):
+            columns[row] = getattr(survey, name)
+
+        self.handle = SurveyHandle(self._shm.name, points, dict(survey.info))
+        self.trajectory = Trajectory(*columns, info=self.handle.info)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Release and remove the shared memory block. Workers must not use the handle afterwards.
+        """
+
+        if self._shm is not None:
+            self.trajectory = None
+            try:
+                self._shm.close()
+            except BufferError:     # views still in use, the mapping is released together with them
+                pass
+            if sys.version_info < (3, 13):      # workers attaching the block removed it from the shared tracker
+                resource_tracker.register(self._shm._name, 'shared_memory')
+            self._shm.unlink()
+            self._shm = None
+
+
+class SurveyHandle(object):
+    """
+    Picklable reference to a SharedSurvey.
+
+    Arguments:
+        name (str): shared memory block name
+        points (int): number of survey stations
+        info (dict): survey info
+    """
+
+    __slots__ = ('name', 'points', 'info')
+
+    def __init__(self, name, points, info):
+        self.name = name
+        self.points = points
+        self.info = info
+
+    def __getstate__(self):
+        return self.name, self.points, self.info
+
+    def __setstate__(self, state):
+        self.name, self.points, self.info = state
+
+    def attach(self):
+        """
+        Map the shared block in the current process (once per process) without copying it.
+
+        Returns:
+            Trajectory object with the survey columns
+        """
+
+        if self.name not in _attached:
+            shm = _open_block(self.name)
+            columns = ndarray((len(COLUMNS), self.points), dtype=float64, buffer=shm.buf)
+            _attached[self.name] = (shm, Trajectory(*columns, info=self.info))
+
+        return _attached[self.name][1]
+
+    def detach(self):
+        """
+        Release the mapping of the shared block in the current process. Trajectories returned by attach must not
+        be used afterwards, attach maps the block again.
+        """
+
+        if self.name in _attached:
+            _detach(self.name)
+
+
+def detach_all():
+    """
+    Release every shared block mapped in this process, e.g. in a long-lived worker between jobs.
+    """
+
+    for name in list(_attached):
+        _detach(name)
+
+
+def _detach(name):
+    shm = _attached.pop(name)[0]
+    try:
+        shm.close()
+    except BufferError:     # views still in use, the mapping is released together with them
+        pass
+
+
+def _open_block(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    # the block is owned by the creator process, it must not be removed when this process ends
+    shm = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
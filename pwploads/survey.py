@@ -0,0 +1,149 @@
+import numpy as np
+from .trajectory import Trajectory
+
+FILE_TYPES = ('.csv', '.npy', '.npz', '.bin', '.dat')
+
+
+def load_survey(data, columns=None, dls_resolution=30, delimiter=','):
+    """
+    Load a survey without going through excel/pandas parsing.
+
+    Arguments:
+        data: csv file, npy file, npz file, binary file with float64 columns stored one after another (.bin or
+              .dat), dict of arrays or 2D array
+        columns (list or None): column names when the source has no header ('md', 'inc', 'azi' and optionally
+                                'tvd'). Default ['md', 'inc', 'azi'].
+        dls_resolution (num): resolution of dog leg severity, m
+        delimiter (str): csv delimiter
+
+    Returns:
+        Trajectory object. TVD is calculated with the minimum curvature method unless it is included in the data.
+    """
+
+    if columns is None:
+        columns = ['md', 'inc', 'azi']
+
+    if isinstance(data, dict):
+        survey = {_column_key(key): np.asarray(value, dtype=float) for key, value in data.items()}
+
+    elif isinstance(data, np.ndarray):
+        survey = _from_array(data, columns)
+
+    elif data.endswith('.csv'):
+        with open(data) as file:
+            header = file.readline().strip().split(delimiter)
+        if not _numbers(header):
+            columns = header
+            values = np.loadtxt(data, delimiter=delimiter, skiprows=1, ndmin=2)
+        else:
+            values = np.loadtxt(data, delimiter=delimiter, ndmin=2)
+        survey = _from_array(values, columns)
+
+    elif data.endswith('.npy'):
+        survey = _from_array(np.load(data, mmap_mode='r'), columns)
+
+    elif data.endswith('.npz'):
+        with np.load(data) as file:
+            survey = {_column_key(key): file[key].astype(float) for key in file.files}
+
+    elif data.endswith(('.bin', '.dat')):
+        values = np.memmap(data, dtype=np.float64, mode='r')
+        survey = _from_array(values.reshape(len(columns), -1).T, columns)
+
+    else:
+        raise ValueError('survey type not supported: {}'.format(data))
+
+    for key in ['md', 'inc', 'azi']:
+        if key not in survey:
+            raise ValueError('{} column is missing in the survey'.format(key))
+
+    md, inc, azi = survey['md'], survey['inc'], survey['azi']
+    dogleg, tvd = minimum_curvature(md, inc, azi)
+
+    if 'tvd' in survey:
+        tvd = survey['tvd']
+
+    delta_md = np.diff(md)
+    dls = np.zeros(len(md))
+    np.divide(np.degrees(dogleg[1:]) * dls_resolution, delta_md, out=dls[1:], where=delta_md > 0)
+
+    return Trajectory(md, tvd, inc, azi, dls,
+                      {'dlsResolution': dls_resolution, 'wellType': 'offshore', 'units': 'metric'})
+
+
+def read_trajectory(survey):
+    """
+    Get the full trajectory of a survey.
+
+    Arguments:
+        survey: excel file, csv/npy/npz/binary file, dataframe, list of dicts or Trajectory object
+
+    Returns:
+        Trajectory object
+    """
+
+    if isinstance(survey, Trajectory):
+        return survey
+
+    if isinstance(survey, str) and survey.endswith(FILE_TYPES):
+        return load_survey(survey)
+
+    import well_profile as wp
+    return Trajectory.from_well(wp.load(survey, equidistant=False))
+
+
+def minimum_curvature(md, inc, azi):
+    """
+    Calculate dogleg and tvd along the survey with the minimum curvature method.
+    :param md: array - measured depth, m
+    :param inc: array - inclination, °
+    :param azi: array - azimuth, °
+    :return: dogleg (rad) and tvd (m) arrays
+    """
+
+    inc = np.radians(inc)
+    cos_inc = np.cos(inc)
+    sin_inc = np.sin(inc)
+
+    cos_dogleg = cos_inc[:-1] * cos_inc[1:] + sin_inc[:-1] * sin_inc[1:] * np.cos(np.radians(np.diff(azi)))
+    dogleg = np.zeros(len(md))
+    dogleg[1:] = np.arccos(np.clip(cos_dogleg, -1, 1))
+
+    rf = np.ones(len(md) - 1)
+    bent = dogleg[1:] > 0
+    rf[bent] = np.tan(dogleg[1:][bent] / 2) / (dogleg[1:][bent] / 2)
+
+    tvd = np.empty(len(md))
+    tvd[0] = md[0]
+    np.cumsum(0.5 * np.diff(md) * (cos_inc[:-1] + cos_inc[1:]) * rf, out=tvd[1:])
+    tvd[1:] += md[0]
+
+    return dogleg, tvd
+
+
+def _from_array(values, columns):
+    if values.dtype.names is not None:
+        return {_column_key(key): np.asarray(values[key], dtype=float) for key in values.dtype.names}
+
+    return {_column_key(key): np.asarray(values[:, idx], dtype=float) for idx, key in enumerate(columns)}
+
+
+def _numbers(fields):
+    try:
+        [float(field) for field in fields]
+    except ValueError:
+        return False
+    return True
+
+
+def _column_key(name):
+    name = name.strip().lower()
+    if name.startswith(('md', 'measured')):
+        return 'md'
+    if name.startswith('tvd') or name.startswith('true vertical'):
+        return 'tvd'
+    if name.startswith('inc'):
+        return 'inc'
+    if name.startswith('az'):
+        return 'azi'
+    return name
@@ -0,0 +1,116 @@
+from unittest import TestCase
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import asyncio
+import os
+import pwploads
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+trajectory = pwploads.Trajectory.from_well(pwploads.wp.load(survey_file, equidistant=False))
+
+
+def new_casing():
+    casing = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500,
+                              'casingClass': 'Production'})
+    casing.add_trajectory(trajectory)
+    return casing
+
+
+class TestAsync(TestCase):
+    def setUp(self):
+        self.reference = new_casing()
+        self.reference.run_loads()
+
+    def check_casing(self, casing):
+        self.assertEqual([load['description'] for load in casing.loads],
+                         [load['description'] for load in self.reference.loads])
+        self.assertEqual(casing.safety_factors, self.reference.safety_factors)
+
+    def test_threads(self):
+        casing = new_casing()
+        with ThreadPoolExecutor(4) as executor:
+            asyncio.run(casing.run_loads_async(executor=executor))
+        self.check_casing(casing)
+
+    def test_shared_nodes(self):
+        from pwploads import registry
+        calls = []
+        drag, depends = registry.NODES['drag']
+
+        def counted(*args, **kwargs):
+            calls.append(kwargs)
+            return drag(*args, **kwargs)
+
+        registry.NODES['drag'] = (counted, depends)
+        try:
+            casing = new_casing()
+            asyncio.run(casing.run_loads_async())
+        finally:
+            registry.NODES['drag'] = (drag, depends)
+        self.check_casing(casing)
+        self.assertEqual(len(calls), 1)     # shared by Running and Overpull
+
+    def test_adaptive(self):
+        casing = new_casing()
+        casing.adaptive = True
+        asyncio.run(casing.run_loads_async())
+        self.assertFalse(casing.adaptive)
+        self.assertFalse(any(isinstance(load['diffPressure'], pwploads.Profile) for load in casing.loads))
+
+        casing.loads = []
+        asyncio.run(casing.run_loads_async(mode='adaptive'))
+        self.assertTrue(any(isinstance(load['diffPressure'], pwploads.Profile) for load in casing.loads))
+        self.check_casing(casing)
+
+    def test_processes(self):
+        casing = new_casing()
+        with ProcessPoolExecutor(1) as executor:
+            asyncio.run(casing.run_loads_async(executor=executor))
+        self.check_casing(casing)
+
+        # the summary is defined for all the loads of the casing, as with threads
+        threads = new_casing()
+        threads.loads = [dict(load) for load in casing.loads]
+        with ProcessPoolExecutor(1) as executor:
+            asyncio.run(casing.run_loads_async({'densities': {'mud': 1.9}}, executor=executor))
+        asyncio.run(threads.run_loads_async({'densities': {'mud': 1.9}}))
+        self.assertEqual(len(casing.loads), 2 * len(self.reference.loads))
+        self.assertEqual(casing.safety_factors, threads.safety_factors)
+        self.assertEqual([load['minDF'] for load in casing.loads], [load['minDF'] for load in threads.loads])
+
+    def test_batch(self):
+        casings = [new_casing() for _ in range(3)]
+        results = asyncio.run(pwploads.run_batch_async(casings, limit=2))
+        self.assertEqual(results, [None] * 3)
+        for casing in casings:
+            self.check_casing(casing)
+
+    def test_timeout(self):
+        casing = new_casing()
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(casing.run_loads_async(timeout=0))
+        self.assertEqual(casing.loads, [])
+        self.assertIsNone(casing.safety_factors)
+
+    def test_timeout_running_tasks(self):
+        import time
+        from pwploads import registry
+        drag, depends = registry.NODES['drag']
+
+        def slow(*args, **kwargs):
+            time.sleep(0.3)
+            return drag(*args, **kwargs)
+
+        casing = new_casing()
+        casing.run_loads({'densities': {'mud': 1.3}})
+        state = (list(casing.loads), casing.msgs, casing.settings, casing.safety_factors)
+
+        registry.NODES['drag'] = (slow, depends)
+        try:
+            with ThreadPoolExecutor(2) as executor:
+                with self.assertRaises(asyncio.TimeoutError):
+                    asyncio.run(casing.run_loads_async(executor=executor, timeout=0.05))
+                # the drag task already started finishes in the pool, its result is discarded
+        finally:
+            registry.NODES['drag'] = (drag, depends)
+
+        self.assertEqual((casing.loads, casing.msgs, casing.settings, casing.safety_factors), state)
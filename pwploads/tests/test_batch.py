@@ -0,0 +1,84 @@
+from unittest import TestCase
+import tempfile
+import os
+import numpy as np
+import pwploads
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+
+pipes = [{'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500, 'casingClass': 'Production'},
+         {'od': 9, 'id': 8, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500, 'casingClass': 'Intermediate'},
+         {'od': 8, 'id': 7.2, 'shoeDepth': 1200, 'tocMd': 800, 'top': 0}]
+
+
+class TestBatch(TestCase):
+    def test_evaluate_batch(self):
+        summaries = pwploads.evaluate_batch(pipes, survey_file)
+
+        for pipe, summary in zip(pipes, summaries):
+            casing = pwploads.Casing(pipe)
+            casing.add_trajectory(survey_file)
+            casing.run_loads()
+            self.assertEqual(summary['safetyFactors']['burst']['load'], casing.safety_factors['burst']['load'])
+            self.assertEqual(list(summary['minDF'].keys()), [load['description'] for load in casing.loads])
+
+    def test_result_store(self):
+        with tempfile.TemporaryDirectory() as folder:
+            summaries = pwploads.evaluate_batch(pipes, survey_file, store=folder)
+            store = pwploads.ResultStore.open(folder)
+
+            self.assertEqual(store.axial_force.shape[:2], (len(pipes), len(pwploads.CASES)))
+            self.assertEqual(store.summary, summaries)
+
+            casing = pwploads.Casing(pipes[2])
+            casing.add_trajectory(survey_file)
+            casing.run_loads()
+
+            restored = pwploads.Casing(pipes[2])
+            store.restore(2, restored)
+            self.assertEqual([load['description'] for load in restored.loads],
+                             [load['description'] for load in casing.loads])
+            for load, load_restored in zip(casing.loads, restored.loads):
+                self.assertTrue(np.allclose(load['axialForce'], load_restored['axialForce']))
+                self.assertTrue(np.allclose(load['diffPressure'], load_restored['diffPressure']))
+            restored.plot('burst')
+
+            # the intermediate casing doesn't include production cases
+            self.assertTrue(np.isnan(store.axial_force[1, pwploads.CASES.index('Production')]).all())
+            del store, restored
+
+    def test_result_store_failing_candidate(self):
+        with tempfile.TemporaryDirectory() as folder:
+            failing = {'shoeDepth': 1500, 'tocMd': 1000, 'top': 500}       # no diameters
+            with self.assertRaises(KeyError):
+                pwploads.evaluate_batch([pipes[0], failing], survey_file, store=folder)
+
+            store = pwploads.ResultStore.open(folder)
+            self.assertIsNotNone(store.summary[0])
+            self.assertIsNone(store.summary[1])
+            self.assertFalse(np.isnan(store.axial_force[0, 0, 0]))
+            del store
+
+    def test_result_store_custom_case(self):
+        from .test_registry import gen_hanging
+        case = pwploads.LoadCase('Hanging', gen_hanging, {'rho_mud': 'densities.mud'}, ['bending'])
+        with tempfile.TemporaryDirectory() as folder:
+            pwploads.register_case(case)
+            try:
+                pwploads.evaluate_batch(pipes[:1], survey_file, store=folder)
+            finally:
+                pwploads.unregister_case('Hanging')
+
+            # opened after the case list changed, the layout of the store is used
+            store = pwploads.ResultStore.open(folder)
+            self.assertEqual(store.cases, pwploads.CASES + ['Hanging'])
+            self.assertEqual(store.axial_force.shape[1], len(pwploads.CASES) + 1)
+            self.assertEqual(store.loads(0)[-1]['description'], 'Hanging')
+            self.assertIsNot(store.cases, pwploads.CASES)
+
+            casing = pwploads.Casing(pipes[0])
+            casing.add_trajectory(survey_file)
+            casing.run_loads()
+            with self.assertRaises(ValueError):     # loads of cases the store was not created with
+                pwploads.ResultStore.create(folder, 1, 10, ['Running']).write(0, casing)
+            del store
@@ -0,0 +1,86 @@
+from unittest import TestCase
+import tempfile
+import json
+import os
+import io
+import pwploads
+from pwploads.cli import main, run_batch
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+pipes = [{'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500},
+         {'od': 9.625, 'id': 8.5, 'shoeDepth': 1200, 'tocMd': 800, 'top': 0, 'grade': 'L-80'},
+         {'od': 7, 'id': 6.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500, 'casingClass': 'Production'}]
+
+
+def write_jobs(folder):
+    jobs = os.path.join(folder, 'jobs.jsonl')
+    with open(jobs, 'w') as file:
+        for idx, pipe in enumerate(pipes):
+            file.write(json.dumps({'id': 'csg{}'.format(idx), 'pipe': pipe, 'survey': survey_file}) + '\n')
+        file.write(json.dumps({'id': 'missing', 'pipe': pipes[0], 'survey': 'missing.csv'}) + '\n')
+    return jobs
+
+
+class TestCli(TestCase):
+    def test_batch(self):
+        reference = []
+        for pipe in pipes:
+            casing = pwploads.Casing(pipe)
+            casing.add_trajectory(survey_file)
+            casing.run_loads()
+            reference.append(pwploads.summarize(casing))
+
+        with tempfile.TemporaryDirectory() as folder:
+            output = os.path.join(folder, 'results.jsonl')
+            code = main(['batch', write_jobs(folder), '-j', '2', '-o', output, '--quiet'])
+            with open(output) as file:
+                results = [json.loads(line) for line in file]
+
+        self.assertEqual(code, 1)
+        self.assertEqual([result['line'] for result in results], [1, 2, 3, 4])
+        for result, summary in zip(results, reference):
+            self.assertEqual(result['summary'], summary)
+        self.assertTrue('error' in results[-1])
+
+    def test_unordered(self):
+        with tempfile.TemporaryDirectory() as folder:
+            output, progress = io.StringIO(), io.StringIO()
+            run_batch(write_jobs(folder), output, workers=1, ordered=False, progress=progress)
+
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(sorted(result['id'] for result in results), ['csg0', 'csg1', 'csg2', 'missing'])
+        self.assertTrue('4 jobs done, 1 failed' in progress.getvalue())
+
+    def test_bounded_surveys(self):
+        import numpy as np
+        from unittest import mock
+        from pwploads import cli
+
+        trajectory = pwploads.survey.read_trajectory(survey_file)
+        columns = np.column_stack([trajectory.md, trajectory.inclination, trajectory.azimuth])
+        opened = []
+
+        class Counted(pwploads.SharedSurvey):
+            def __init__(self, survey):
+                super().__init__(survey)
+                opened.append(self)
+                counts.append(sum(block._shm is not None for block in opened))
+
+        counts = []
+        with tempfile.TemporaryDirectory() as folder:
+            jobs = os.path.join(folder, 'jobs.jsonl')
+            with open(jobs, 'w') as file:
+                for idx in range(6):        # more unique surveys than workers
+                    survey = os.path.join(folder, 'survey{}.csv'.format(idx))
+                    np.savetxt(survey, columns * [1, 1, 1 + idx], delimiter=',', header='md,inc,azi', comments='')
+                    for _ in range(2):
+                        file.write(json.dumps({'id': idx, 'pipe': pipes[0], 'survey': survey}) + '\n')
+
+            output = io.StringIO()
+            with mock.patch.object(cli, 'SharedSurvey', Counted):
+                self.assertEqual(run_batch(jobs, output, workers=2), 0)
+
+        self.assertEqual(len(output.getvalue().splitlines()), 12)
+        self.assertEqual(len(opened), 6)
+        self.assertLessEqual(max(counts), 2 * 2)        # only the surveys of the jobs in flight
+        self.assertTrue(all(block._shm is None for block in opened))
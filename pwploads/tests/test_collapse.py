@@ -0,0 +1,34 @@
+from unittest import TestCase
+import numpy as np
+from pwploads.collapse_calcs import calc_collapse_pressure, collapse_factors, collapse_range, p_collap
+
+
+def reference(dt, y_p):
+    factors = collapse_factors(y_p)
+    c_range = collapse_range(dt, factors)
+    return p_collap(dt, y_p, c_range, *[factors[key] for key in 'abcfg'])
+
+
+class TestCollapse(TestCase):
+    def test_vectorized(self):
+        dt = np.linspace(8, 50, 85)
+        for y_p in [40e3, 80e3, 125e3]:
+            values = calc_collapse_pressure(dt, y_p)
+            for x, value in zip(dt, values):
+                self.assertEqual(value, calc_collapse_pressure(float(x), y_p))
+                self.assertAlmostEqual(value, reference(float(x), y_p), delta=1e-9 * value)
+
+        axial_stress = np.array([0, 20e3, 40e3])
+        values = calc_collapse_pressure(11.1, 80e3, axial_stress)
+        self.assertEqual(values.shape, (3,))
+        self.assertTrue(np.all(np.diff(values) < 0))
+        self.assertAlmostEqual(values[1], calc_collapse_pressure(11.1, 80e3, 20e3))
+
+    def test_ranges(self):
+        factors = collapse_factors(80e3)
+        self.assertEqual(collapse_range(factors['dt_yp'], factors), 'yield')
+        self.assertEqual(collapse_range(factors['dt_pt'], factors), 'elastic')
+        self.assertEqual(collapse_range((factors['dt_pt'] + factors['dt_te']) / 2, factors), 'transition')
+        self.assertEqual(list(collapse_range(np.array([factors['dt_yp'], factors['dt_te']]), factors)),
+                         ['yield', 'elastic'])
+        self.assertEqual(calc_collapse_pressure(20, 0), 0)
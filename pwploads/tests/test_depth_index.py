@@ -0,0 +1,59 @@
+from unittest import TestCase
+import os
+import numpy as np
+import pwploads
+
+casing = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 0, 'grade': 'X-80'})
+casing.add_trajectory(os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx'))
+casing.run_loads()
+
+
+def new_casing(survey):
+    csg = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 0, 'grade': 'X-80'})
+    csg.add_trajectory(pwploads.load_survey(survey))
+    csg.run_loads()
+    return csg
+
+
+class TestDepthIndex(TestCase):
+    def test_md(self):
+        md = np.array(casing.trajectory.md)
+        depths = np.array([md[3], (md[10] + md[11]) / 2, 1837, md[-1]])
+        result = casing.loads_at(md=depths, cases=['Running', 'Cementing'])
+
+        self.assertEqual(result['cases'], ['Running', 'Cementing'])
+        self.assertEqual(result['axialForce'].shape, (2, 4))
+        running = casing.loads[[load['description'] for load in casing.loads].index('Running')]
+        expected = np.interp(depths[:2], md, running['axialForce'])
+        self.assertTrue(np.allclose(result['axialForce'][0, :2], expected))
+        self.assertAlmostEqual(result['axialForce'][0, 3], running['axialForce'][-1])
+        self.assertTrue(np.all(np.isnan(result['diffPressure'][:, 2])))      # below the shoe
+
+        profiles = pwploads.compute_safety_profiles(casing)
+        self.assertEqual(casing.loads_at(md=md[3])['safetyFactors']['burst'][:, 0].tolist(),
+                         profiles['burst'][:, 3].tolist())
+
+    def test_tvd(self):
+        md = np.arange(0, 1530, 30.0)
+        vertical = new_casing({'md': md, 'inc': np.linspace(0, 20, len(md)), 'azi': np.zeros(len(md))})
+        tvd = np.array(vertical.trajectory.tvd)
+        depth = (tvd[5] + tvd[6]) / 2
+        result = vertical.loads_at(tvd=[tvd[5], depth])
+        self.assertAlmostEqual(result['md'][0], vertical.trajectory.md[5])
+        self.assertAlmostEqual(result['md'][1], (md[5] + md[6]) / 2, places=1)
+        running = vertical.loads[[load['description'] for load in vertical.loads].index('Running')]
+        self.assertTrue(np.allclose(result['axialForce'][result['cases'].index('Running')],
+                                    np.interp([tvd[5], depth], tvd, running['axialForce'])))
+
+        horizontal = new_casing({'md': md, 'inc': np.minimum(md / 5, 90), 'azi': np.zeros(len(md))})
+        self.assertFalse(np.all(np.diff(horizontal.trajectory.tvd) > 0))
+        with self.assertRaises(ValueError):
+            horizontal.loads_at(tvd=100)
+
+    def test_cache(self):
+        index = pwploads.depth_index(casing)
+        self.assertIs(pwploads.depth_index(casing), index)
+        with self.assertRaises(ValueError):
+            casing.loads_at(md=100, cases=['Unknown'])
+        with self.assertRaises(ValueError):
+            casing.loads_at()
@@ -0,0 +1,55 @@
+from unittest import TestCase
+import numpy as np
+import os
+import pwploads
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+pipe = {'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500}
+factor_sets = [{},
+               {'pipe': {'burst': 1.25, 'collapse': 1.0, 'triaxial': 1.5}},
+               {'connection': {'tension': 1.6, 'compression': 1.3}},
+               {'pipe': {'burst': 20}}]
+
+
+class TestDesignFactors(TestCase):
+    def test_update_design_factors(self):
+        casing = pwploads.Casing(pipe)
+        casing.add_trajectory(survey_file)
+        casing.run_loads()
+        loads = [load['axialForce'].copy() for load in casing.loads]
+
+        for factors in factor_sets[1:]:
+            casing.update_design_factors(factors)
+            reference = pwploads.Casing(pipe, factors=factors)
+            reference.add_trajectory(survey_file)
+            reference.run_loads()
+            self.assertEqual(casing.safety_factors, reference.safety_factors)
+            self.assertEqual([load['minDF'] for load in casing.loads], [load['minDF'] for load in reference.loads])
+            casing.update_design_factors(pwploads.Casing(pipe).factors)      # back to the defaults
+
+        for load, axial_force in zip(casing.loads, loads):
+            self.assertTrue(np.array_equal(load['axialForce'], axial_force))
+
+    def test_evaluate_design_factors(self):
+        casing = pwploads.Casing(pipe)
+        casing.add_trajectory(survey_file)
+        casing.run_loads()
+        result = casing.evaluate_design_factors(factor_sets)
+
+        self.assertEqual(result['cases'], [load['description'] for load in casing.loads])
+        for idx, factors in enumerate(factor_sets):
+            reference = pwploads.Casing(pipe, factors=factors)
+            reference.add_trajectory(survey_file)
+            reference.run_loads()
+            passed = True
+            for case, load in enumerate(reference.loads):
+                for load_type, value in load['minDF'].items():
+                    if value is None:
+                        self.assertTrue(np.isnan(result['minDF'][load_type][idx, case]))
+                    else:
+                        self.assertAlmostEqual(result['minDF'][load_type][idx, case], value)
+                for load_type, value, ratio in pwploads.check_load(reference, load):
+                    self.assertAlmostEqual(result['margin'][load_type][idx, case], ratio)
+                    passed &= ratio >= 1
+            self.assertEqual(result['passed'][idx], passed)
+        self.assertFalse(result['passed'][3])
@@ -0,0 +1,39 @@
+from unittest import TestCase
+import numpy as np
+from pwploads import FluidColumn, fluid_column, axial
+
+tvd = np.linspace(0, 1500, 31)
+
+
+class TestFluids(TestCase):
+    def test_column(self):
+        column = FluidColumn([900, 600], [1.4, 1.2, 1.6])
+        self.assertEqual(list(column.interfaces), [600, 900])
+        self.assertEqual(list(column.densities), [1.2, 1.4, 1.6])
+        self.assertTrue(np.allclose(column.pressures, [0, 9.81 * 1200 * 600, 9.81 * (1200 * 600 + 1400 * 300)]))
+
+        self.assertEqual(list(column.density([0, 600, 601, 900, 1200])), [1.2, 1.2, 1.4, 1.4, 1.6])
+        self.assertAlmostEqual(float(column.pressure(1000)),
+                               9.81 * (1200 * 600 + 1400 * 300 + 1600 * 100))
+
+        # a fluid change between two stations
+        x = np.array([550, 650])
+        self.assertTrue(np.allclose(column.pressure(x), [9.81 * 1200 * 550, 9.81 * (1200 * 600 + 1400 * 50)]))
+
+    def test_cache_key(self):
+        column = fluid_column([600, 900], [1.2, 1.4, 1.6])
+        self.assertIs(column, fluid_column((600.0, 900.0), np.array([1.2, 1.4, 1.6])))
+        self.assertIs(fluid_column(column, None), column)
+        self.assertEqual(column, FluidColumn([600, 900], [1.2, 1.4, 1.6]))
+        self.assertEqual(len({column, FluidColumn([600, 900], [1.2, 1.4, 1.6]), FluidColumn([], [1.2])}), 2)
+
+    def test_profiles(self):
+        column = fluid_column([620, 910], [1.2, 1.4, 1.6])
+        self.assertTrue(np.allclose(axial.pressure_profile(tvd, [620, 910], [1.2, 1.4, 1.6]), column.pressure(tvd)))
+        self.assertTrue(np.array_equal(axial.density_profile(tvd, column, None), column.density(tvd)))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            FluidColumn([600, 900], [1.2, 1.4])
+        with self.assertRaises(ValueError):
+            FluidColumn([600], [1.2, -1.4])
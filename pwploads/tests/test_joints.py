@@ -0,0 +1,36 @@
+from unittest import TestCase
+import os
+import numpy as np
+import pwploads
+
+casing = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 0, 'grade': 'X-80'})
+casing.add_trajectory(os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx'))
+casing.run_loads()
+
+
+class TestJoints(TestCase):
+    def test_edges(self):
+        self.assertTrue(np.allclose(pwploads.joint_edges([0, 5, 30], 12), [0, 12, 24, 30]))
+        self.assertTrue(np.allclose(pwploads.joint_edges([10, 34], 12), [10, 22, 34]))
+        with self.assertRaises(ValueError):
+            pwploads.joint_edges([0, 30], 0)
+
+    def test_aggregate(self):
+        result = casing.aggregate_joints(12)
+        md = np.array(casing.trajectory.md)
+        joints = len(result['top'])
+        self.assertEqual(joints, int(np.ceil((md[-1] - md[0]) / 12)))
+        self.assertEqual(result['maxTension'].shape, (len(casing.loads), joints))
+
+        for idx, load in enumerate(casing.loads):
+            force = np.asarray(load['axialForce'])
+            if load['maxLoads']['tension'] is not None:
+                self.assertAlmostEqual(np.nanmax(result['maxTension'][idx]), force.max())
+            self.assertAlmostEqual(result['safetyFactors']['burst'][idx].min(),
+                                   pwploads.compute_safety_profiles(casing)['burst'][idx].min())
+
+        connections = result['connections']
+        self.assertEqual(connections['axialForce'].shape, (len(casing.loads), joints))
+        self.assertTrue(np.allclose(connections['axialForce'][0],
+                                    np.interp(result['top'], md, casing.loads[0]['axialForce'])))
+        self.assertTrue(np.array_equal(connections['passed'], connections['safetyFactor'] >= 1))
@@ -0,0 +1,68 @@
+from unittest import TestCase
+from concurrent.futures import ThreadPoolExecutor
+import os
+import numpy as np
+import pwploads
+from pwploads import axial, burst
+from pwploads.collapse.pressure_external import morefluids_behindcasing
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+casing = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500})
+casing.add_trajectory(survey_file)
+casing.define_settings(None)
+pwploads.gen_msgs(casing)
+tvd = casing.trajectory.tvd
+tvd_fluid = [600, 900]
+rho_fluid = [1.2, 1.4, 1.6]
+
+
+def run_kernels():
+    return [axial.pressure_profile(tvd, tvd_fluid, rho_fluid),
+            axial.density_profile(tvd, tvd_fluid, rho_fluid),
+            axial.buoyancy_force(tvd, 8, 7.2, tvd_fluid, rho_fluid, tvd_fluid, rho_fluid),
+            axial.running(casing.trajectory, 64, 8, 7.2, 1500, tvd_fluid, rho_fluid, 0.3, 2e6),
+            burst.pressure_test_morefluids(tvd, 200, 1.3, rho_fluid, tvd_fluid),
+            morefluids_behindcasing(tvd, rho_fluid, tvd_fluid)]
+
+
+class TestKernels(TestCase):
+    def test_inputs_unchanged(self):
+        tvd_copy = list(tvd)
+        first = run_kernels()
+        second = run_kernels()
+
+        self.assertEqual(tvd_fluid, [600, 900])
+        self.assertEqual(rho_fluid, [1.2, 1.4, 1.6])
+        self.assertEqual(list(tvd), tvd_copy)
+        for x, y in zip(first, second):
+            self.assertTrue(np.array_equal(x, y))
+
+    def test_thread_pool(self):
+        serial = run_kernels()
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: run_kernels(), range(32)))
+
+        for result in results:
+            for x, y in zip(serial, result):
+                self.assertTrue(np.array_equal(x, y))
+
+    def test_cases_thread_pool(self):
+        serial = []
+        for description, gen, kwargs in pwploads.applicable_cases(casing):
+            casing.loads = []
+            gen(casing, **kwargs)
+            serial.append(casing.loads[0])
+
+        def run_case(case):
+            csg = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500})
+            csg.trajectory = casing.trajectory
+            case[1](csg, **case[2])
+            return csg.loads[0]
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(run_case, pwploads.applicable_cases(casing) * 4))
+
+        for load, reference in zip(results, serial * 4):
+            self.assertEqual(load['description'], reference['description'])
+            self.assertTrue(np.array_equal(load['axialForce'], reference['axialForce']))
+            self.assertTrue(np.array_equal(load['diffPressure'], reference['diffPressure']))
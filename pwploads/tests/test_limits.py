@@ -0,0 +1,118 @@
+from unittest import TestCase
+import numpy as np
+import pwploads
+from pwploads.collapse_calcs import calc_collapse_pressure
+
+casing = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 0, 'grade': 'X-80'})
+
+
+class TestLimits(TestCase):
+    def test_vme(self):
+        envelope = casing.vme_envelope
+        axial, burst, collapse = [np.array(x) for x in envelope.sample(50)]
+        self.assertEqual(len(axial), 99)
+        self.assertTrue(np.allclose(envelope.burst(axial * 1000) / 1000, burst))
+        self.assertTrue(np.allclose(envelope.collapse(axial * 1000) / 1000, collapse))
+        self.assertTrue(np.isnan(envelope.burst(2 * casing.limits['tension'])))
+
+        # the limit scales with 1 / DF
+        self.assertAlmostEqual(envelope.collapse(1e5, 2.5), envelope.collapse(2e5) / 2)
+
+    def test_api(self):
+        envelope = casing.api_envelope
+        force = np.array([-1e5, 0, 1e5, 2 * envelope.tension_limit])
+        expected = [- calc_collapse_pressure(casing.dt, casing.yield_strength, x / casing.area) / 1.1
+                    for x in [0, 0, 1e5, envelope.tension_limit]]
+        self.assertTrue(np.allclose(envelope.collapse(force), expected))
+        self.assertAlmostEqual(envelope.collapse(-1), casing.limits['collapseDF'])
+        self.assertEqual(envelope.burst(force).shape, (4,))
+        self.assertEqual(casing.collapse_curve[1][-1], envelope.collapse(envelope.tension_limit))
+
+    def test_collapse_base(self):
+        force = np.array([-1e4, 1e4, 1e5])
+        base = pwploads.get_collapse_base(casing, force)
+        self.assertEqual(base[0], casing.limits['collapse'])
+        self.assertTrue(np.allclose(base[1:], casing.api_envelope.collapse(force[1:]) * 1.1))
+        self.assertTrue(np.all(base < 0))
+        self.assertTrue(np.all(np.diff(base) > 0))      # tension lowers the rating
+
+    def test_collapse_base_change(self):
+        # the previous base interpolated the triaxial ellipse (kips, ksi) with the force in lbf, so any tension gave
+        # the value at its last point, a positive pressure and a negative collapse SF
+        force = np.array([1e5, 3e5, 6e5])
+        previous = np.interp(force, casing.ellipse[0], casing.ellipse[2])
+        self.assertTrue(np.allclose(previous, 3.8723, atol=1e-4))
+
+        # now the API 5C3 rating with the yield strength reduced by the axial stress, psi
+        base = pwploads.get_collapse_base(casing, force)
+        self.assertTrue(np.allclose(base, [-4806.26, -4244.03, -2518.96], atol=0.01))
+        self.assertEqual(pwploads.get_collapse_base(casing, 0), casing.limits['collapse'])
+
+    def test_collapse_heavy_tension(self):
+        force = np.array([6.5e5, casing.limits['tension'], 2 * casing.limits['tension']])
+        base = pwploads.get_collapse_base(casing, force)
+        self.assertTrue(np.all(base <= 0))
+        self.assertTrue(base[0] > casing.limits['collapse'])
+        self.assertEqual(list(base[1:]), [0, 0])
+
+        csg = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 0, 'grade': 'X-80'})
+        for axial_force in force:
+            csg.loads = [{'description': 'Full Evacuation', 'axialForce': np.full(3, axial_force),
+                          'diffPressure': np.array([-500, -1000, -2000])}]
+            pwploads.define_max_loads(csg.loads)
+            pwploads.define_min_df(csg)
+            pwploads.define_safety_factors(csg)
+            min_df = csg.loads[0]['minDF']['collapse']
+            self.assertGreaterEqual(min_df, 0)
+            self.assertEqual(csg.safety_factors['collapse']['safetyFactor'], round(min_df, 2))
+        self.assertEqual(min_df, 0)
+
+    def test_min_df_tension_collapse(self):
+        # the collapse minDF is at the station with tension, not at the highest collapse load
+        csg = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 0, 'grade': 'X-80'})
+        csg.loads = [{'description': 'Full Evacuation', 'axialForce': np.array([6e5, 1e4, -1e5]),
+                      'diffPressure': np.array([-900, -500, -1000])}]
+        pwploads.define_max_loads(csg.loads)
+        pwploads.define_min_df(csg)
+        profiles = pwploads.compute_safety_profiles(csg)
+
+        load = csg.loads[0]
+        self.assertEqual(load['minDF']['collapse'], profiles['collapse'][0].min())
+        self.assertEqual(load['minDFStation']['collapse'], 0)
+        self.assertLess(load['minDF']['collapse'], casing.limits['collapse'] / -1000)
+        self.assertEqual(load['minDFStation']['compression'], 2)
+        self.assertEqual(load['minDF']['tension'], csg.conn_limits[1] / 6e5)
+        self.assertIsNone(load['minDF']['burst'])
+
+    def test_safety_profiles(self):
+        import os
+        csg = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 0, 'grade': 'X-80'})
+        csg.add_trajectory(os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx'))
+        csg.run_loads()
+        profiles = pwploads.compute_safety_profiles(csg)
+
+        shape = (len(csg.loads), len(csg.trajectory.md))
+        for sf_type in ['burst', 'collapse', 'tension', 'compression', 'connection', 'triaxial']:
+            self.assertEqual(profiles[sf_type].shape, shape)
+        self.assertEqual(profiles['cases'], [load['description'] for load in csg.loads])
+
+        for idx, load in enumerate(csg.loads):
+            if load['minDF']['burst'] is not None:
+                self.assertEqual(load['minDF']['burst'], profiles['burst'][idx].min())
+            else:
+                self.assertTrue(np.all(np.isinf(profiles['burst'][idx])))
+            if load['minDF']['tension'] is not None:
+                self.assertAlmostEqual(load['minDF']['tension'],
+                                       profiles['tension'][idx].min() * csg.conn_limits[1] / csg.limits['tension'])
+            if load['minDF']['collapse'] is not None:
+                self.assertEqual(load['minDF']['collapse'], profiles['collapse'][idx].min())
+                self.assertEqual(load['minDFStation']['collapse'], profiles['collapse'][idx].argmin())
+
+        envelope = pwploads.Envelope(csg)
+        for load in csg.loads:
+            envelope.update(load)
+        for sf_type in pwploads.envelope.SF_TYPES:
+            self.assertTrue(np.array_equal(envelope.safety_factors[sf_type], profiles[sf_type].min(axis=0)))
+        self.assertAlmostEqual(envelope.governing()['collapse']['safetyFactor'],
+                               min(load['minDF']['collapse'] for load in csg.loads
+                                   if load['minDF']['collapse'] is not None))
@@ -0,0 +1,39 @@
+from unittest import TestCase
+import numpy as np
+import pwploads
+
+stations = 60000
+md = np.linspace(0, 6000, stations)
+trajectory = pwploads.load_survey({'md': md, 'inc': np.clip(md / 50, 0, 60), 'azi': np.full(stations, 45.)})
+
+casing = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 6000, 'tocMd': 4000, 'top': 0})
+casing.add_trajectory(trajectory)
+rng = np.random.default_rng(0)
+for case in pwploads.CASES:
+    casing.loads.append({'description': case,
+                         'axialForce': rng.normal(0, 1e5, stations),
+                         'diffPressure': rng.normal(0, 2e3, stations)})
+
+
+class TestPlot(TestCase):
+    def test_decimate_keeps_extrema(self):
+        values = rng.normal(0, 1, stations)
+        idx = pwploads.decimate(values, budget=1000, keep=[123])
+
+        self.assertTrue(len(idx) <= 1001)
+        self.assertTrue(np.all(np.diff(idx) > 0))
+        for point in [0, stations - 1, np.argmin(values), np.argmax(values), 123]:
+            self.assertTrue(point in idx)
+
+    def test_payload_size(self):
+        for plot_type in ['vme', 'pressureDiff', 'burst', 'collapse', 'axial']:
+            fig = casing.plot(plot_type)
+            self.assertTrue(len(fig.to_json()) < 1e6)
+
+    def test_dashboard(self):
+        fig = pwploads.dashboard_plot([casing] * 4, cols=2)
+
+        self.assertEqual(len(fig.data), 4 * len(pwploads.vme_traces(casing)))
+        self.assertTrue(all(trace.type == 'scattergl' for trace in fig.data))
+        self.assertEqual(sum(trace.showlegend is not False for trace in fig.data), len(pwploads.vme_traces(casing)))
+        self.assertTrue(fig.layout.template.layout.hovermode == 'closest')
@@ -0,0 +1,99 @@
+from unittest import TestCase
+import numpy as np
+from pwploads import Profile, axial, burst, collapse
+
+tvd = list(np.linspace(0, 1500, 31))
+
+
+class TestProfiles(TestCase):
+    def test_folding(self):
+        line = Profile.linear(10.0, 2.0, tvd)
+        constant = Profile.constant(5.0, len(tvd))
+
+        folded = 3 * line - constant + 1 - Profile.linear(0.0, 1.0, tvd) / 2
+        self.assertIsInstance(folded, Profile)
+        self.assertEqual(folded.kind, 'linear')
+        self.assertTrue(np.allclose(folded, 3 * (10 + 2 * np.array(tvd)) - 5 + 1 - np.array(tvd) / 2))
+        self.assertEqual((constant - 2 * constant).kind, 'constant')
+        self.assertAlmostEqual(folded.min(), 26.0)
+        self.assertAlmostEqual(folded.max(), 26.0 + 5.5 * 1500)
+
+        values = np.arange(len(tvd), dtype=float)
+        self.assertTrue(np.allclose(values - line, values - 10 - 2 * np.array(tvd)))
+        self.assertTrue(np.allclose(line - values, 10 + 2 * np.array(tvd) - values))
+        self.assertIsInstance(values + constant, np.ndarray)
+        self.assertTrue(np.allclose(line.at([100, 200]), [210, 410]))
+
+    def test_kernels(self):
+        self.assertEqual(collapse.production_fullevacuation(tvd, 1.4).kind, 'linear')
+        self.assertEqual(burst.gas_filled(tvd, 300, 0.5, 2000, 1.4).kind, 'linear')
+        self.assertEqual(axial.shock_load(tvd, 0.3, 8, 7.2, 64, 2e6).kind, 'constant')
+
+        pressure = burst.gas_filled(tvd, 300, 0.5, 2000, 1.4)
+        expected = 300e5 - 9.81 * 500 * (2000 - np.array(tvd)) - 9.81 * 1400 * np.array(tvd)
+        self.assertTrue(np.allclose(pressure, expected))
+        buoyancy = axial.buoyancy_force(tvd, 8, 7.2, [], [1.4], [], [1.2])
+        self.assertIsInstance(buoyancy, Profile)
+        self.assertTrue(np.allclose(buoyancy, axial.buoyancy_force(tvd, 8, 7.2, [2000], [1.4, 1.4], [2000],
+                                                                   [1.2, 1.2])))
+
+    def test_piecewise(self):
+        pressure = burst.production_with_packer(tvd, 0.8, 1.4, 300, 1300, 1.2, 1000)
+        self.assertEqual(pressure.kind, 'piecewise')
+        self.assertLess(len(pressure.stations), len(tvd))
+
+        x = np.array(tvd)
+        p_int = np.select([x <= 1000, x <= 1300],
+                          [300e5 - 9.81 * 800 * 1300 + 9.81 * 1200 * x, 300e5 - 9.81 * 1200 * (1300 - x)],
+                          300e5 + 9.81 * 1.4 * (x - 1300))
+        expected = p_int - 9.81 * 1400 * x
+        self.assertTrue(np.allclose(pressure, expected, rtol=1e-12))
+        self.assertAlmostEqual(pressure.max(), expected.max())
+        self.assertEqual(pressure.argmin(), expected.argmin())
+
+        hydrostatic = axial.pressure_profile(tvd, [500, 1000], [1.2, 1.4, 1.6])
+        self.assertEqual(hydrostatic.kind, 'piecewise')
+        expected = np.select([x <= 500, x <= 1000],
+                             [9.81 * 1200 * x, 9.81 * 1200 * 500 + 9.81 * 1400 * (x - 500)],
+                             9.81 * (1200 * 500 + 1400 * 500) + 9.81 * 1600 * (x - 1000))
+        self.assertTrue(np.allclose(hydrostatic, expected, rtol=1e-12))
+
+    def test_numpy_operations(self):
+        tvd = np.linspace(0, 1000, 11)
+        line = Profile.linear(10.0, 2.0, tvd)
+
+        scaled = np.float64(2.0) * line - np.float64(1.0)
+        self.assertIsInstance(scaled, Profile)
+        self.assertTrue(np.allclose(scaled, 2 * (10 + 2 * tvd) - 1))
+        self.assertTrue(np.array_equal(line >= 1000, 10 + 2 * tvd >= 1000))
+        self.assertTrue(np.array_equal(tvd < line, tvd < 10 + 2 * tvd))
+        self.assertTrue(np.allclose(np.sqrt(line), np.sqrt(10 + 2 * tvd)))
+        self.assertTrue(np.allclose(np.maximum(line, 500), np.maximum(10 + 2 * tvd, 500)))
+        self.assertEqual(list(line), list(10 + 2 * tvd))
+
+    def test_adaptive_loads(self):
+        import pwploads
+        import os
+        survey = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+        settings = {'production': {'resPressure': 4200, 'resTvd': 2000, 'packerTvd': 1450, 'perforationsTvd': 1600}}
+        casings = []
+        for mode in ['full', 'adaptive']:
+            csg = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 0,
+                                   'casingClass': 'Production'})
+            csg.add_trajectory(survey)
+            csg.run_loads(settings, mode=mode)
+            casings.append(csg)
+
+        full, adaptive = casings
+        self.assertTrue(any(isinstance(load['diffPressure'], Profile) for load in adaptive.loads))
+        for expected, load in zip(full.loads, adaptive.loads):
+            self.assertTrue(np.allclose(expected['diffPressure'], np.asarray(load['diffPressure'])))
+            self.assertTrue(np.array_equal(expected['diffPressure'] > 0, load['diffPressure'] > 0))
+            self.assertTrue(np.allclose(np.abs(expected['diffPressure']), np.abs(load['diffPressure'])))
+            self.assertTrue(np.allclose(expected['diffPressure'] - load['diffPressure'], 0, atol=1e-6))
+            self.assertEqual(load['diffPressure'].shape, expected['diffPressure'].shape)
+            for load_type, value in expected['maxLoads'].items():
+                if value is None:
+                    self.assertIsNone(load['maxLoads'][load_type])
+                else:
+                    self.assertAlmostEqual(value, load['maxLoads'][load_type], delta=1e-9 * abs(value))
@@ -0,0 +1,80 @@
+from unittest import TestCase
+import numpy as np
+import os
+import pwploads
+from pwploads.prepare_cases import _append_load
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+pipe = {'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500}
+
+
+def gen_hanging(csg, rho_mud, nodes=None):
+    axial_force = nodes['bending'] + csg.nominal_weight * (csg.trajectory.tvd[-1] - np.array(csg.trajectory.tvd)) \
+        * 9.81 / 1000 * (1 - rho_mud / 7.85)
+    _append_load(csg, 'Hanging', axial_force, [0] * len(axial_force), pressure_unit='psi')
+
+
+class TestRegistry(TestCase):
+    def test_plan(self):
+        casing = pwploads.Casing(pipe)
+        casing.add_trajectory(survey_file)
+        casing.define_settings(None)
+        pwploads.gen_msgs(casing)
+        plan = pwploads.plan_cases(casing)
+
+        names = [name for name, params, depends in plan['nodes'].values()]
+        self.assertEqual(sorted(names), ['bending', 'buoyancy', 'drag', 'e'])    # shared by running and overpull
+        params = {name: params for name, params, depends in plan['nodes'].values()}
+        self.assertEqual(params['drag']['column'], pwploads.fluid_column([], [casing.settings['densities']['mud']]))
+        self.assertIs(params['buoyancy']['column'], params['drag']['column'])
+        self.assertEqual([case[0].name for case in plan['cases']],
+                         [name for name, gen, kwargs in pwploads.applicable_cases(casing)])
+        self.assertEqual([plan['nodes'][key][0] for key in plan['levels'][1]], ['bending'])
+
+    def test_workers(self):
+        casing = pwploads.Casing(pipe)
+        casing.add_trajectory(survey_file)
+        casing.run_loads()
+        parallel = pwploads.Casing(pipe)
+        parallel.add_trajectory(survey_file)
+        parallel.run_loads(workers=4)
+
+        self.assertEqual([load['description'] for load in parallel.loads],
+                         [load['description'] for load in casing.loads])
+        for load, reference in zip(parallel.loads, casing.loads):
+            self.assertTrue(np.allclose(load['axialForce'], reference['axialForce']))
+            self.assertTrue(np.allclose(load['diffPressure'], reference['diffPressure']))
+        self.assertEqual(parallel.safety_factors, casing.safety_factors)
+
+    def test_custom_case(self):
+        case = pwploads.LoadCase('Hanging', gen_hanging, {'rho_mud': 'densities.mud'}, ['bending'],
+                                 pipe_classes=['Production'])
+        cases = list(pwploads.CASES)
+        before = pwploads.Casing(pipe)
+        before.add_trajectory(survey_file)
+        envelope = pwploads.Envelope(before)
+        pwploads.register_case(case)
+        try:
+            with self.assertRaises(ValueError):
+                pwploads.register_case(case)
+            self.assertEqual(pwploads.case_names(), cases + ['Hanging'])
+            casing = pwploads.Casing(dict(pipe, casingClass='Production'))
+            casing.add_trajectory(survey_file)
+            casing.run_loads()
+            intermediate = pwploads.Casing(dict(pipe, casingClass='Intermediate'))
+            intermediate.add_trajectory(survey_file)
+            intermediate.run_loads()
+            pwploads.Envelope(casing).update(casing.loads[-1])
+        finally:
+            pwploads.unregister_case('Hanging')
+
+        self.assertEqual(pwploads.CASES, cases)        # the built-in list is not changed
+        self.assertEqual(pwploads.case_names(), cases)
+        self.assertEqual(envelope.cases, cases)
+        with self.assertRaises(ValueError):
+            envelope.update(casing.loads[-1])
+
+        self.assertEqual(casing.loads[-1]['description'], 'Hanging')
+        self.assertTrue(casing.loads[-1]['minDF']['tension'] > 0)
+        self.assertTrue('Hanging' not in [load['description'] for load in intermediate.loads])
+        self.assertEqual(case.settings_keys(), ['densities.mud'])
@@ -0,0 +1,53 @@
+from unittest import TestCase
+import tempfile
+import os
+import numpy as np
+import pwploads
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+
+
+def casing_with_loads(od, id_csg):
+    casing = pwploads.Casing({'od': od, 'id': id_csg, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500})
+    casing.add_trajectory(survey_file)
+    casing.run_loads()
+    return casing
+
+
+casings = [casing_with_loads(8, 7.2), casing_with_loads(9, 8)]
+
+
+class TestResults(TestCase):
+    def check_results(self, results):
+        self.assertEqual(len(results), 2)
+        for casing, result in zip(casings, results):
+            self.assertEqual(result['cases'], [load['description'] for load in casing.loads])
+            self.assertTrue(np.allclose(result['md'], casing.trajectory.md))
+            for idx, load in enumerate(casing.loads):
+                self.assertTrue(np.allclose(result['axialForce'][idx], load['axialForce']))
+                self.assertTrue(np.allclose(result['diffPressure'][idx], load['diffPressure']))
+            self.assertEqual(result['safetyFactors']['burst']['load'], casing.safety_factors['burst']['load'])
+
+    def test_npz(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'results.npz')
+            casings[0].export_results(path)
+            casings[1].export_results(path, append=True)
+
+            results = pwploads.load_results(path)
+            self.assertIsInstance(results[0]['axialForce'], np.memmap)
+            self.check_results(results)
+            self.check_results(pwploads.load_results(path, mmap=False))
+            del results
+
+    def test_arrow(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'results.arrow')
+            casings[0].export_results(path, format='arrow')
+            casings[1].export_results(path, format='arrow', append=True)
+            self.check_results(pwploads.load_results(path))
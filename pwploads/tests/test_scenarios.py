@@ -0,0 +1,147 @@
+from unittest import TestCase
+import os
+import numpy as np
+import pwploads
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+casing = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500})
+casing.add_trajectory(survey_file)
+base = {'production': {'resPressure': 4200, 'resTvd': 2000}}
+grid = {'densities.mud': [1.4, 1.6], 'densities.cement': [1.8, 1.9], 'tripping.slidingFriction': [0.2, 0.3]}
+
+
+class TestScenarios(TestCase):
+    def test_run_scenarios(self):
+        result = casing.run_scenarios(base, grid)
+
+        self.assertEqual(len(result['scenarios']), 8)
+        self.assertEqual(result['scenarios'][1], {'densities.mud': 1.4, 'densities.cement': 1.8,
+                                                  'tripping.slidingFriction': 0.3})
+        self.assertTrue(result['evaluations'] < 8 * 9)
+        self.assertEqual(casing.loads, [])
+
+        for idx, scenario in enumerate(result['scenarios']):
+            reference = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500})
+            reference.trajectory = casing.trajectory
+            reference.run_loads(pwploads.merge_settings(base, scenario))
+            for load in reference.loads:
+                case = result['cases'].index(load['description'])
+                for load_type, value in load['minDF'].items():
+                    if value is None:
+                        self.assertTrue(np.isnan(result['safetyFactors'][load_type][idx, case]))
+                    else:
+                        self.assertAlmostEqual(result['safetyFactors'][load_type][idx, case], value)
+
+    def test_shared_nodes(self):
+        from pwploads import registry
+        calls = {'drag': 0, 'bending': 0}
+        original = {name: registry.NODES[name] for name in calls}
+
+        def counted(name):
+            function, depends = original[name]
+
+            def node(*args, **kwargs):
+                calls[name] += 1
+                return function(*args, **kwargs)
+            return node, depends
+
+        try:
+            for name in calls:
+                registry.NODES[name] = counted(name)
+            casing.run_scenarios(base, grid)
+        finally:
+            registry.NODES.update(original)
+
+        self.assertEqual(calls, {'drag': 4, 'bending': 1})      # mud x friction, Running and Overpull share drag
+
+    def test_merge_settings(self):
+        settings = pwploads.merge_settings(base, {'production.resPressure': 3000, 'forces.overpull': 10})
+        self.assertEqual(settings['production'], {'resPressure': 3000, 'resTvd': 2000})
+        self.assertEqual(settings['forces'], {'overpull': 10})
+        self.assertEqual(base['production']['resPressure'], 4200)
+
+        temp = {'temp': {'seabed': {'tvd': 500, 'temp': 4}}}
+        settings = pwploads.merge_settings(temp, {'temp.seabed.temp': 6})
+        self.assertEqual(settings['temp']['seabed'], {'tvd': 500, 'temp': 6})
+        self.assertEqual(temp['temp']['seabed']['temp'], 4)
+        with self.assertRaises(ValueError):
+            pwploads.merge_settings(base, {'mud': 1.2})
+        with self.assertRaises(ValueError):
+            pwploads.merge_settings(base, {'production.resPressure.value': 1})
+
+    def test_envelope(self):
+        envelope = pwploads.Envelope(casing)
+        result = casing.run_scenarios(base, grid, envelope)
+        self.assertEqual(envelope.count, result['evaluations'])
+
+        reference = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500})
+        reference.trajectory = casing.trajectory
+        minimum = {sf_type: np.inf for sf_type in pwploads.envelope.SF_TYPES}
+        for scenario in result['scenarios']:
+            reference.loads = []
+            reference.run_loads(pwploads.merge_settings(base, scenario))
+            sf = pwploads.compute_safety_profiles(reference)
+            for sf_type in minimum:
+                minimum[sf_type] = np.minimum(minimum[sf_type], sf[sf_type].min(axis=0))
+
+        governing = envelope.governing()
+        for sf_type, values in minimum.items():
+            self.assertTrue(np.allclose(envelope.safety_factors[sf_type], values))
+            self.assertAlmostEqual(governing[sf_type]['safetyFactor'], values.min())
+
+        idx = np.argmin(envelope.safety_factors['burst'])
+        scenario = result['scenarios'][envelope.scenario['burst'][idx]]
+        reference.loads = []
+        reference.run_loads(pwploads.merge_settings(base, scenario))
+        load = [load for load in reference.loads if load['description'] == governing['burst']['case']][0]
+        self.assertAlmostEqual(casing.limits['burst'] / load['diffPressure'][idx], governing['burst']['safetyFactor'])
+
+        # every scenario with the same inputs for the governing case, not only the first one calculated
+        scenarios = governing['burst']['scenarios']
+        self.assertEqual(scenarios[0], governing['burst']['scenario'])
+        self.assertTrue(len(scenarios) > 1)
+        for scenario in scenarios:
+            reference.loads = []
+            reference.run_loads(pwploads.merge_settings(base, result['scenarios'][scenario]))
+            load = [load for load in reference.loads if load['description'] == governing['burst']['case']][0]
+            self.assertAlmostEqual(load['minDF']['burst'], governing['burst']['safetyFactor'])
+        self.assertEqual(sum(len(shared) for shared in envelope.shared.values()),
+                         len(result['scenarios']) * len(reference.loads))
+
+    def test_sensitivity(self):
+        result = casing.sensitivity(base, rel_step=0.05)
+        self.assertEqual(result['params'][0], 'densities.mud')
+        self.assertEqual(result['gradients']['burst'].shape, (5, len(pwploads.CASES)))
+        self.assertTrue(result['evaluations'] < 9 * 5)      # full central differences need 9 * 11
+
+        reference = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500})
+        reference.trajectory = casing.trajectory
+        sf = []
+        for mud in [result['values'][0] - result['steps'][0], result['values'][0] + result['steps'][0]]:
+            reference.loads = []
+            reference.run_loads(pwploads.merge_settings(base, {'densities.mud': mud}))
+            sf.append({load['description']: load['minDF'] for load in reference.loads})
+
+        for case, df in sf[0].items():
+            if df['collapse'] is None:
+                continue
+            gradient = (sf[1][case]['collapse'] - df['collapse']) / (2 * result['steps'][0])
+            self.assertAlmostEqual(result['gradients']['collapse'][0, pwploads.CASES.index(case)], gradient)
+
+        rows = result['tornado']['collapse']
+        self.assertEqual([row['swing'] for row in rows], sorted([row['swing'] for row in rows], reverse=True))
+        with self.assertRaises(ValueError):
+            casing.sensitivity(None, ['production.resPressure'])
+
+    def test_sensitivity_nested(self):
+        settings = pwploads.merge_settings(base, {'injection.whp': 2000})
+        result = casing.sensitivity(settings, ['temp.seabed.temp'])
+        self.assertEqual(result['values'], [4])
+        self.assertNotEqual(result['gradients']['compression'][0, pwploads.CASES.index('Injection')], 0)
+        with self.assertRaises(ValueError):
+            casing.sensitivity(base, ['temp.seabed'])
+
+    def test_sensitivity_overpull(self):
+        result = casing.sensitivity(base, ['forces.overpull'])
+        self.assertEqual(result['steps'], [1])      # whole units, the load case uses an integer
+        self.assertLess(result['gradients']['tension'][0, pwploads.CASES.index('Overpull')], 0)
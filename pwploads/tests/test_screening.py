@@ -0,0 +1,35 @@
+from unittest import TestCase
+import os
+import pwploads
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+
+
+def casing_with_trajectory(pipe):
+    pipe.update({'shoeDepth': 1500, 'tocMd': 1000, 'top': 500})
+    casing = pwploads.Casing(pipe)
+    casing.add_trajectory(survey_file)
+    return casing
+
+
+class TestScreening(TestCase):
+    def test_screen_pass(self):
+        casing = casing_with_trajectory({'od': 10, 'id': 7, 'grade': 'X-135', 'casingClass': 'Intermediate'})
+        casing.run_loads(mode='screen')
+
+        self.assertTrue(casing.screening['passed'])
+        self.assertEqual(casing.screening['casesRun'], len(pwploads.applicable_cases(casing)))
+        self.assertEqual(casing.loads, [])
+
+    def test_screen_early_exit(self):
+        casing = casing_with_trajectory({'od': 8, 'id': 7.8})
+        casing.run_loads(mode='screen')
+
+        self.assertFalse(casing.screening['passed'])
+        self.assertTrue(casing.screening['casesRun'] < len(pwploads.applicable_cases(casing)))
+        self.assertEqual(casing.loads, [])
+
+        casing.run_loads()
+        required = pwploads.required_factors(casing)[casing.screening['loadType']]
+        governing = [load for load in casing.loads if load['description'] == casing.screening['governingCase']][0]
+        self.assertTrue(governing['minDF'][casing.screening['loadType']] < required)
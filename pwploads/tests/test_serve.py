@@ -0,0 +1,93 @@
+from unittest import TestCase
+import tempfile
+import threading
+import socket
+import json
+import os
+import io
+import pwploads
+from pwploads.serve import Server, Worker, LruCache, serve, serve_socket
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+pipe = {'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500}
+settings = {'densities': {'mud': 1.6}}
+requests = [{'id': 1, 'command': 'ping'},
+            {'id': 2, 'pipe': pipe, 'survey': survey_file},
+            {'id': 3, 'pipe': pipe, 'settings': settings, 'survey': survey_file},
+            {'id': 4, 'pipe': dict(pipe, top=0), 'survey': survey_file},
+            {'id': 5, 'command': 'stats'},
+            {'id': 6, 'command': 'unknown'},
+            {'id': 7, 'command': 'shutdown'},
+            {'id': 8, 'command': 'ping'}]
+
+
+def reference(settings=None, top=500):
+    casing = pwploads.Casing(dict(pipe, top=top))
+    casing.add_trajectory(survey_file)
+    casing.run_loads(settings)
+    return pwploads.summarize(casing)
+
+
+class TestServe(TestCase):
+    def check_responses(self, responses):
+        responses = {response['id']: response for response in responses}
+        self.assertEqual(sorted(responses), [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(responses[2]['summary'], reference())
+        self.assertEqual(responses[3]['summary'], reference(settings))
+        self.assertEqual(responses[4]['summary'], reference(top=0))
+        self.assertTrue('error' in responses[6])
+        self.assertTrue(responses[7]['shutdown'])
+        return responses
+
+    def test_in_process(self):
+        server = Server(preload=[survey_file])
+        source = io.StringIO(''.join(json.dumps(request) + '\n' for request in requests))
+        sink = io.StringIO()
+
+        self.assertTrue(serve(server, source, sink))
+        responses = self.check_responses([json.loads(line) for line in sink.getvalue().splitlines()])
+        self.assertEqual(responses[5]['stats'], {'surveys': 1, 'casings': 2, 'windows': 2})
+        self.assertEqual(responses[1]['pid'], os.getpid())
+
+    def test_socket(self):
+        server = Server(workers=1)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'pwploads.sock')
+            thread = threading.Thread(target=serve_socket, args=(server, path))
+            thread.start()
+            while not os.path.exists(path):
+                thread.join(0.01)
+
+            with socket.socket(socket.AF_UNIX) as client:
+                client.connect(path)
+                client.sendall(''.join(json.dumps(request) + '\n' for request in requests).encode())
+                client.shutdown(socket.SHUT_WR)
+                with client.makefile() as file:
+                    responses = [json.loads(line) for line in file]
+
+            thread.join()
+        server.close()
+
+        self.check_responses(responses)
+
+    def test_cache_size(self):
+        cache = LruCache(2)
+        cache.fetch('a', lambda: 1)
+        cache.fetch('b', lambda: 2)
+        self.assertEqual(cache.fetch('a'), 1)     # b is now the oldest
+        cache.fetch('c', lambda: 3)
+        self.assertEqual(list(cache), ['a', 'c'])
+
+        worker = Worker([survey_file], cache_size=1)
+        for top in [0, 100, 500]:
+            worker.casing(dict(pipe, top=top), None, survey_file)
+        self.assertEqual((len(worker.surveys), len(worker.casings), len(worker.windows)), (1, 1, 1))
+
+    def test_template_not_changed(self):
+        worker = Worker()
+        csg = worker.casing(pipe, None, survey_file)
+        csg.update_design_factors({'pipe': {'burst': 1.5}})
+
+        template = worker.casing(pipe, None, survey_file)
+        self.assertEqual(template.factors['pipe']['burst'], 1.1)
+        self.assertEqual(template.limits['burstDF'], template.limits['burst'] / 1.1)
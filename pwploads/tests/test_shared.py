@@ -0,0 +1,64 @@
+from unittest import TestCase
+from concurrent.futures import ProcessPoolExecutor
+import pickle
+import os
+import pwploads
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+
+pipe = {'od': 8,
+        'id': 7.2,
+        'shoeDepth': 1500,
+        'tocMd': 1000,
+        'weight': 100,
+        'grade': 'X-80',
+        'e': 29e6,
+        'top': 500}
+
+
+def safety_factors(handle):
+    casing = pwploads.Casing(pipe)
+    casing.add_trajectory(handle)
+    casing.run_loads()
+    return {key: value['safetyFactor'] for key, value in casing.safety_factors.items()}
+
+
+class TestSharedSurvey(TestCase):
+    def test_same_window(self):
+        casing = pwploads.Casing(pipe)
+        casing.add_trajectory(survey_file)
+
+        with pwploads.SharedSurvey(survey_file) as shared:
+            casing_shared = pwploads.Casing(pipe)
+            casing_shared.add_trajectory(shared.handle)
+
+            for column in ['md', 'tvd', 'inclination', 'azimuth', 'dls']:
+                self.assertEqual(list(getattr(casing.trajectory, column)),
+                                 list(getattr(casing_shared.trajectory, column)))
+
+    def test_handle_is_small(self):
+        with pwploads.SharedSurvey(survey_file) as shared:
+            self.assertTrue(len(pickle.dumps(shared.handle)) < 200)
+
+    def test_detach(self):
+        with pwploads.SharedSurvey(survey_file) as shared:
+            trajectory = shared.handle.attach()
+            self.assertIs(shared.handle.attach(), trajectory)
+
+            shared.handle.detach()
+            self.assertNotIn(shared.handle.name, pwploads.shared._attached)
+            self.assertEqual(list(shared.handle.attach().md), list(shared.trajectory.md))
+            del trajectory
+
+            pwploads.detach_all()
+            self.assertEqual(pwploads.shared._attached, {})
+
+    def test_process_pool(self):
+        expected = safety_factors(survey_file)
+
+        with pwploads.SharedSurvey(survey_file) as shared:
+            with ProcessPoolExecutor(2) as executor:
+                results = list(executor.map(safety_factors, [shared.handle] * 3))
+
+        for result in results:
+            self.assertEqual(result, expected)
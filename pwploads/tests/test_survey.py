@@ -0,0 +1,61 @@
+from unittest import TestCase
+import tempfile
+import os
+import numpy as np
+import well_profile as wp
+import pwploads
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+excel = pwploads.Trajectory.from_well(wp.load(survey_file, equidistant=False))
+columns = np.column_stack([excel.md, excel.inclination, excel.azimuth])
+reference = pwploads.Trajectory.from_well(wp.load([list(x) for x in columns.T], equidistant=False))
+
+
+class TestSurvey(TestCase):
+    def check_trajectory(self, trajectory):
+        self.assertTrue(np.allclose(trajectory.md, reference.md))
+        self.assertTrue(np.allclose(trajectory.tvd, reference.tvd, atol=0.01))
+        self.assertTrue(np.allclose(trajectory.dls, reference.dls))
+
+    def test_file_types(self):
+        with tempfile.TemporaryDirectory() as folder:
+            csv_file = os.path.join(folder, 'survey.csv')
+            np.savetxt(csv_file, columns, delimiter=',', header='MD (m),Inclination,Azimuth', comments='')
+            self.check_trajectory(pwploads.load_survey(csv_file))
+
+            npy_file = os.path.join(folder, 'survey.npy')
+            np.save(npy_file, columns)
+            self.check_trajectory(pwploads.load_survey(npy_file))
+
+            npz_file = os.path.join(folder, 'survey.npz')
+            np.savez(npz_file, md=columns[:, 0], inc=columns[:, 1], azi=columns[:, 2])
+            self.check_trajectory(pwploads.load_survey(npz_file))
+
+            bin_file = os.path.join(folder, 'survey.bin')
+            columns.T.astype(np.float64).tofile(bin_file)
+            self.check_trajectory(pwploads.load_survey(bin_file))
+
+    def test_csv_header(self):
+        with tempfile.TemporaryDirectory() as folder:
+            csv_file = os.path.join(folder, 'survey.csv')
+            np.savetxt(csv_file, columns, delimiter=',', fmt='%.10e')      # no header, e-notation
+            self.check_trajectory(pwploads.load_survey(csv_file))
+
+            np.savetxt(csv_file, columns, delimiter=',', header='md,inc,azi', comments='', fmt='%.10e')
+            self.check_trajectory(pwploads.load_survey(csv_file))
+
+    def test_add_trajectory(self):
+        with tempfile.TemporaryDirectory() as folder:
+            csv_file = os.path.join(folder, 'survey.csv')
+            np.savetxt(csv_file, columns, delimiter=',', header='md,inc,azi', comments='')
+
+            casing = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500})
+            casing.add_trajectory(csv_file)
+            casing.run_loads()
+
+        self.assertTrue(casing.trajectory.md[-1] <= 1000)
+        self.assertEqual(len(casing.loads[0]['axialForce']), len(casing.trajectory.md))
+
+    def test_missing_column(self):
+        with self.assertRaises(ValueError):
+            pwploads.load_survey({'md': [0, 100], 'inc': [0, 1]})
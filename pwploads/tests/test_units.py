@@ -0,0 +1,34 @@
+from unittest import TestCase
+import numpy as np
+import os
+import pwploads
+from pwploads.units import factor
+
+survey_file = os.path.join(os.path.dirname(__file__), 'TrajectorySample.xlsx')
+
+
+class TestUnits(TestCase):
+    def test_loads_in(self):
+        casing = pwploads.Casing({'od': 8, 'id': 7.2, 'shoeDepth': 1500, 'tocMd': 1000, 'top': 500})
+        casing.add_trajectory(survey_file)
+        casing.run_loads()
+
+        for load in casing.loads:
+            self.assertIsInstance(load['axialForce'], np.ndarray)
+            self.assertIsInstance(load['diffPressure'], np.ndarray)
+
+        si = casing.loads_in('si')
+        for load, converted in zip(casing.loads, si):
+            self.assertTrue(np.allclose(converted['axialForce'], load['axialForce'] * 4.448 / 1000))
+            self.assertTrue(np.allclose(converted['diffPressure'], load['diffPressure'] * 6.895))
+            if load['maxLoads']['burst'] is not None:
+                self.assertAlmostEqual(converted['maxLoads']['burst'], load['maxLoads']['burst'] * 6.895)
+            self.assertEqual(converted['minDF'], load['minDF'])
+
+        field = casing.loads_in('field')
+        self.assertTrue(np.array_equal(field[0]['axialForce'], casing.loads[0]['axialForce']))
+        self.assertAlmostEqual(factor('bar', 'psi'), 14.504, 2)
+        with self.assertRaises(ValueError):
+            factor('psi', 'kN')
+        with self.assertRaises(ValueError):
+            casing.loads_in('imperial')
@@ -0,0 +1,74 @@
+from numpy import array, searchsorted
+
+
+class Trajectory(object):
+    """
+    Trajectory object holding the survey columns as arrays.
+
+    Arguments:
+        md (array): measured depth, m
+        tvd (array): true vertical depth, m
+        inclination (array): inclination, °
+        azimuth (array): azimuth, °
+        dls (array): dog leg severity, °/dlsResolution
+        info (dict): survey info, it must include 'dlsResolution'
+
+    Attributes:
+        md, tvd, inclination, azimuth, dls (array): survey columns
+        info (dict): survey info
+    """
+
+    def __init__(self, md, tvd, inclination, azimuth, dls, info=None):
+        if info is None:
+            info = {'dlsResolution': 30, 'wellType': 'offshore', 'units': 'metric'}
+
+        self.md = md
+        self.tvd = tvd
+        self.inclination = inclination
+        self.azimuth = azimuth
+        self.dls = dls
+        self.info = info
+
+    @classmethod
+    def from_well(cls, well):
+        """
+        Build the columns from a well_profile object.
+
+        Arguments:
+            well: well object from well_profile
+
+        Returns:
+            Trajectory object
+        """
+
+        return cls(array([x['md'] for x in well.trajectory], dtype=float),
+                   array([x['tvd'] for x in well.trajectory], dtype=float),
+                   array([x['inc'] for x in well.trajectory], dtype=float),
+                   array([x['azi'] for x in well.trajectory], dtype=float),
+                   array([x['dls'] for x in well.trajectory], dtype=float),
+                   well.info)
+
+    def __len__(self):
+        return len(self.md)
+
+    def window(self, top, shoe):
+        """
+        Get the section of the trajectory between casing top and shoe. Depths are referenced to the casing top.
+
+        Arguments:
+            top (num): measured depth at casing top, m
+            shoe (num): measured depth at shoe, m
+
+        Returns:
+            Trajectory object. Inclination, azimuth and dls are views of the original columns.
+        """
+
+        start = searchsorted(self.md, top, side='left')
+        end = searchsorted(self.md, shoe, side='right')
+
+        return Trajectory(self.md[start:end] - top,
+                          self.tvd[start:end] - top,
+                          self.inclination[start:end],
+                          self.azimuth[start:end],
+                          self.dls[start:end],
+                          self.info)
@@ -0,0 +1,57 @@
+import numpy as np
+
+UNIT_SYSTEMS = {'field': {'force': 'lbf', 'pressure': 'psi'},
+                'si': {'force': 'kN', 'pressure': 'kPa'},
+                'metric': {'force': 'kN', 'pressure': 'bar'}}
+
+FORCE = {'kN': 1.0, 'N': 1000.0, 'lbf': 1000 / 4.448}      # per kN, as in convert_unit
+PRESSURE = {'Pa': 1.0, 'kPa': 1e-3, 'MPa': 1e-6, 'bar': 1e-5, 'psi': 1 / 6895}      # per Pa, as in convert_unit
+
+
+def factor(unit_from, unit_to):
+    """
+    Get the factor to multiply a force or pressure by.
+
+    Arguments:
+        unit_from (str): unit in FORCE or PRESSURE
+        unit_to (str): unit of the same kind
+
+    Returns:
+        conversion factor
+    """
+
+    for table in [FORCE, PRESSURE]:
+        if unit_from in table and unit_to in table:
+            return table[unit_to] / table[unit_from]
+
+    raise ValueError('no conversion from {} to {}'.format(unit_from, unit_to))
+
+
+def convert_load(load, units='si', units_from='field'):
+    """
+    Convert a load to another unit system. Profiles are new arrays, the load is not modified.
+
+    Arguments:
+        load (dict): load with 'axialForce', 'diffPressure' and optionally 'maxLoads'
+        units (str): unit system in UNIT_SYSTEMS
+        units_from (str): unit system of the load
+
+    Returns:
+        dict with the same keys and converted 'axialForce', 'diffPressure' and 'maxLoads'
+    """
+
+    if units not in UNIT_SYSTEMS:
+        raise ValueError('unknown unit system: {}'.format(units))
+
+    force = factor(UNIT_SYSTEMS[units_from]['force'], UNIT_SYSTEMS[units]['force'])
+    pressure = factor(UNIT_SYSTEMS[units_from]['pressure'], UNIT_SYSTEMS[units]['pressure'])
+
+    converted = dict(load)
+    converted['axialForce'] = np.asarray(load['axialForce'], dtype=float) * force
+    converted['diffPressure'] = np.asarray(load['diffPressure'], dtype=float) * pressure
+    if 'maxLoads' in load:
+        scale = {'tension': force, 'compression': force, 'burst': pressure, 'collapse': pressure}
+        converted['maxLoads'] = {key: None if value is None else value * scale[key]
+                                 for key, value in load['maxLoads'].items()}
+
+    return converted
@@ -1,4 +1,5 @@
-from numpy import interp
+from numpy import asarray, array, nan, inf, isnan, isinf, isfinite, where, argmin, broadcast_to
+from .profiles import Profile
 
 
 def gen_msgs(pipe):
@@ -37,8 +38,12 @@ def gen_msgs(pipe):
 
 def define_max_loads(loads):
     for load in loads:
-        min_level = {'force': min(load['axialForce']), 'pressure': min(load['diffPressure'])}
-        max_level = {'force': max(load['axialForce']), 'pressure': max(load['diffPressure'])}
+        axial_force = asarray(load['axialForce'], dtype=float)
+        pressure = load['diffPressure']
+        if not isinstance(pressure, Profile):
+            pressure = asarray(pressure, dtype=float)     # a Profile gives its extremes without being built
+        min_level = {'force': float(axial_force.min()), 'pressure': float(pressure.min())}
+        max_level = {'force': float(axial_force.max()), 'pressure': float(pressure.max())}
         max_loads = {}
 
         if min_level['force'] < 0:
@@ -53,7 +58,6 @@ def define_max_loads(loads):
 
         if min_level['pressure'] < 0:
             max_loads['collapse'] = min_level['pressure']
-            load['_MaxCollapsePoint'] = load['axialForce'][load['diffPressure'].index(min_level['pressure'])]
         else:
             max_loads['collapse'] = None
 
@@ -66,25 +70,50 @@ def define_max_loads(loads):
 
 
 def get_collapse_base(csg, axial_force):
-    if axial_force <= 0:
-        collapse_base = csg.limits['collapse']
-    else:
-        collapse_base = interp(axial_force, csg.ellipse[0], csg.ellipse[2])
-    return collapse_base
+    """
+    Get the collapse rating for an axial force. In tension it is the API 5C3 rating with the yield strength reduced
+    by the axial stress (see ApiEnvelope.rating), 0 from the pipe yield load on.
+
+    Arguments:
+        csg: casing obj
+        axial_force (num or array): axial force at the max collapse point, lbf
+
+    Returns:
+        collapse rating (negative or 0), psi, with the shape of axial_force
+    """
+
+    return csg.api_envelope.rating(axial_force)
 
 
 def define_min_df(csg):
-    base = {'compression': csg.conn_limits[0], 'tension': csg.conn_limits[1], 'burst': csg.limits['burst']}
-
-    for load in csg.loads:
-        if '_MaxCollapsePoint' in load:
-            base['collapse'] = get_collapse_base(csg, load['_MaxCollapsePoint'])
-        load['minDF'] = {}
-        for load_type, value in load['maxLoads'].items():
-            if value is None:
-                load['minDF'][load_type] = None
+    """
+    Set the minimum DF of every load and the station where it is, taken from the safety factors along the casing
+    (see compute_safety_profiles). Burst and collapse use the pipe body, tension and compression the connection.
+
+    Arguments:
+        csg: casing obj with loads
+    """
+
+    from .envelope import compute_safety_profiles
+
+    if len(csg.loads) == 0:
+        return
+
+    profiles = compute_safety_profiles(csg)
+    values = {'burst': profiles['burst'], 'collapse': profiles['collapse'],
+              'tension': where(isfinite(profiles['tension']), profiles['connection'], inf),
+              'compression': where(isfinite(profiles['compression']), profiles['connection'], inf)}
+
+    for idx, load in enumerate(csg.loads):
+        load['minDF'], load['minDFStation'] = {}, {}
+        for load_type, sf in values.items():
+            sf = where(isnan(sf[idx]), inf, sf[idx])
+            station = int(argmin(sf)) if len(sf) > 0 else 0
+            if len(sf) == 0 or isinf(sf[station]):
+                load['minDF'][load_type] = load['minDFStation'][load_type] = None
             else:
-                load['minDF'][load_type] = base[load_type] / value
+                load['minDF'][load_type] = float(sf[station])
+                load['minDFStation'][load_type] = station
 
 
 def define_safety_factors(csg):
@@ -103,3 +132,84 @@ def define_safety_factors(csg):
                 precaution[load_type] = warning
 
     csg.safety_factors = precaution
+
+
+def required_factors(csg):
+    """
+    Get the minimum DF each load type must reach. Connection limits already include their design factors.
+
+    Arguments:
+        csg: casing obj
+
+    Returns:
+        dict {'burst', 'collapse', 'tension', 'compression'}
+    """
+
+    return {'burst': csg.design_factor['api']['burst'], 'collapse': csg.design_factor['api']['collapse'],
+            'tension': 1.0, 'compression': 1.0}
+
+
+def check_load(csg, load):
+    """
+    Compare the minimum DF of a load against the required design factors.
+
+    Arguments:
+        csg: casing obj
+        load (dict): load with 'minDF' already defined
+
+    Returns:
+        list of (load type, minimum DF, minimum DF / required DF). A ratio below 1 means the load case fails.
+    """
+
+    required = required_factors(csg)
+    return [(load_type, value, value / required[load_type]) for load_type, value in load['minDF'].items()
+            if value is not None]
+
+
+def evaluate_design_factors(csg, factor_sets):
+    """
+    Check the loads already run against many sets of design factors at once, e.g. to compare company standards.
+    The loads are not calculated again, only the ratings are scaled for every set.
+
+    Arguments:
+        csg: casing obj with loads run
+        factor_sets (list): design factors dicts as in Casing, missing values are taken from csg.factors
+
+    Returns:
+        dict with 'cases' (load descriptions), 'minDF' (set x case array per load type, NaN where the load has no
+        load of that type), 'margin' (minDF / required DF, below 1 fails) and 'passed' (bool per set)
+    """
+
+    sets = []
+    for factors in factor_sets:
+        df = {key: dict(values) for key, values in csg.factors.items()}
+        for key in factors.keys():
+            for item in factors[key].keys():
+                df[key][item] = factors[key][item]
+        sets.append(df)
+
+    def column(key, item):
+        return array([df[key][item] for df in sets], dtype=float)[:, None]
+
+    def load_df(load_type):
+        return array([nan if load['minDF'][load_type] is None else load['minDF'][load_type]
+                      for load in csg.loads], dtype=float)
+
+    # burst and collapse ratings do not change with the factors, the connection ratings are scaled
+    scale = {'burst': 1.0, 'collapse': 1.0,
+             'compression': csg.factors['connection']['compression'] / column('connection', 'compression'),
+             'tension': csg.factors['connection']['tension'] / column('connection', 'tension')}
+    required = {'burst': column('pipe', 'burst'), 'collapse': column('pipe', 'collapse'),
+                'tension': 1.0, 'compression': 1.0}
+
+    result = {'cases': [load['description'] for load in csg.loads], 'minDF': {}, 'margin': {}}
+    passed = array([True] * len(sets))
+    for load_type in ['burst', 'collapse', 'tension', 'compression']:
+        min_df = array(broadcast_to(load_df(load_type) * scale[load_type], (len(sets), len(csg.loads))))
+        margin = min_df / required[load_type]
+        result['minDF'][load_type] = min_df
+        result['margin'][load_type] = margin
+        passed &= (isnan(margin) | (margin >= 1)).all(axis=1)
+    result['passed'] = passed
+
+    return result
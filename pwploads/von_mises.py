@@ -1,22 +1,90 @@
-from numpy import linspace
+import numpy as np
 from math import pi
 
 
 def vme(yield_s, area, int_diam, out_diam, design_factor=1.25):
 
-    yield_s /= design_factor
+    return VmeEnvelope(yield_s, area, int_diam, out_diam, design_factor).sample()
 
-    yield_s_new = yield_s * 1.1547
 
-    xaxis_pos = linspace(0, yield_s_new, 300)
-    xaxis_neg = linspace(- yield_s_new, 0, 300)[:-1]
+class VmeEnvelope(object):
+    """
+    Triaxial (von Mises) limit of the pipe, evaluated in closed form.
 
-    a_factor = ((pi * (out_diam/2)**2) + (pi * (int_diam/2)**2)) / area
+    Arguments:
+        yield_s (num): minimum yield strength, psi
+        area (num): pipe cross section area, in^2
+        int_diam (num): inner diameter, in
+        out_diam (num): outer diameter, in
+        design_factor (num): triaxial design factor
 
-    ellipse = [[x * area/1000 for x in xaxis_neg] + [x * area/1000 for x in xaxis_pos],                 # axial forces
-               [(0.5 * (x + (4*yield_s**2 - 3*x**2)**0.5)/a_factor)/1000 for x in xaxis_neg] +          # burst zone
-               [(0.5 * (x + (4*yield_s**2 - 3*x**2)**0.5)/a_factor)/1000 for x in xaxis_pos],
-               [(0.5 * (x - (4*yield_s**2 - 3*x**2)**0.5)/a_factor)/1000 for x in xaxis_neg] +          # collapse zone
-               [(0.5 * (x - (4*yield_s**2 - 3*x**2)**0.5)/a_factor)/1000 for x in xaxis_pos]]
+    Attributes:
+        yield_s (num): yield strength reduced by the design factor, psi
+        area (num): pipe cross section area, in^2
+        a_factor (num): ratio between the pressure difference and the radial + hoop stress
+        design_factor (num): triaxial design factor
+    """
 
-    return ellipse
+    def __init__(self, yield_s, area, int_diam, out_diam, design_factor=1.25):
+        self.design_factor = design_factor
+        self.yield_s = yield_s / design_factor
+        self.area = area
+        self.a_factor = ((pi * (out_diam/2)**2) + (pi * (int_diam/2)**2)) / area
+
+    def burst(self, axial_force, design_factor=None):
+        """
+        Get the burst limit for some axial forces.
+
+        Arguments:
+            axial_force (num or array): axial force, lbf
+            design_factor (num, array or None): triaxial design factor to use instead of the envelope one
+
+        Returns:
+            pressure difference, psi. NaN beyond the axial limits
+        """
+
+        return self._limit(axial_force, design_factor, 1)
+
+    def collapse(self, axial_force, design_factor=None):
+        """
+        Get the collapse limit for some axial forces.
+
+        Arguments:
+            axial_force (num or array): axial force, lbf
+            design_factor (num, array or None): triaxial design factor to use instead of the envelope one
+
+        Returns:
+            pressure difference (negative), psi. NaN beyond the axial limits
+        """
+
+        return self._limit(axial_force, design_factor, -1)
+
+    def sample(self, points=300):
+        """
+        Sample the envelope for plots.
+
+        Arguments:
+            points (int): points on each side of zero axial force
+
+        Returns:
+            [axial forces (kips), burst limit (ksi), collapse limit (ksi)] lists
+        """
+
+        yield_s_new = self.yield_s * 1.1547
+        stress = np.concatenate((np.linspace(- yield_s_new, 0, points)[:-1], np.linspace(0, yield_s_new, points)))
+        root = (4 * self.yield_s ** 2 - 3 * stress ** 2) ** 0.5
+
+        return [list(stress * self.area / 1000),                                # axial forces
+                list((0.5 * (stress + root) / self.a_factor) / 1000),           # burst zone
+                list((0.5 * (stress - root) / self.a_factor) / 1000)]           # collapse zone
+
+    def _limit(self, axial_force, design_factor, sign):
+        yield_s = self.yield_s
+        if design_factor is not None:
+            yield_s = yield_s * self.design_factor / np.asarray(design_factor, dtype=float)
+        stress = np.asarray(axial_force, dtype=float) / self.area
+        with np.errstate(invalid='ignore'):
+            limit = 0.5 * (stress + sign * np.sqrt(4 * yield_s ** 2 - 3 * stress ** 2)) / self.a_factor
+        if limit.ndim == 0:
+            return float(limit)
+        return limit
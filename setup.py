@@ -21,5 +21,6 @@ setup(
                  'Topic :: Software Development',
                  'Topic :: Software Development :: Libraries',
                  'Topic :: Utilities'],
-    install_requires=['numpy', 'plotly', 'torque_drag', 'well_profile']
+    install_requires=['numpy', 'plotly', 'torque_drag', 'well_profile'],
+    entry_points={'console_scripts': ['pwploads=pwploads.cli:main']}
 )